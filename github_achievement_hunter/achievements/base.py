@@ -261,29 +261,28 @@ class AchievementHunter(ABC):
         Returns:
             List of results
         """
-        results = []
         total_items = len(items)
+        total_batches = (total_items + batch_size - 1) // batch_size
+        
+        # Preallocated; items that fail to process keep None
+        results: List[Any] = [None] * total_items
         
         for i in range(0, total_items, batch_size):
-            batch = items[i:i + batch_size]
             batch_num = (i // batch_size) + 1
-            total_batches = (total_items + batch_size - 1) // batch_size
+            processed = min(i + batch_size, total_items)
             
             self.logger.info(
                 f"Processing batch {batch_num}/{total_batches} "
-                f"({len(batch)} {description})"
+                f"({processed - i} {description})"
             )
             
-            for item in batch:
+            for index in range(i, processed):
                 try:
-                    result = processor_func(item)
-                    results.append(result)
+                    results[index] = processor_func(items[index])
                 except Exception as e:
                     self.logger.error(f"Error processing {description}: {str(e)}")
-                    results.append(None)
             
             # Update progress
-            processed = min(i + batch_size, total_items)
             progress_percent = (processed / total_items) * 100
             self.progress_tracker.update_achievement(
                 self.achievement_name,
@@ -314,10 +313,7 @@ class AchievementHunter(ABC):
         """
         try:
             # Check if repository already exists
-            repos = self.github_client.get_user_repositories()
-            repo_exists = any(repo.name == repo_name for repo in repos)
-            
-            if not repo_exists:
+            if not self.github_client.repository_exists(repo_name):
                 self.logger.info(f"Creating repository: {repo_name}")
                 repo = self.github_client.create_repository(
                     name=repo_name,
@@ -8,7 +8,7 @@ from .rate_limiter import RateLimiter, RateLimitError
 from .logger import (
     AchievementLogger, LoggerError, ConfigurationError as LoggerConfigurationError,
     APIError, LoggerRateLimitError, LoggerAuthenticationError, ValidationError,
-    log_context, suppress_and_log, log_errors, log_execution_time, default_logger
+    log_context, suppress_and_log, log_errors, log_execution_time, get_default_logger
 )
 
 __all__ = [
@@ -34,5 +34,13 @@ __all__ = [
     'suppress_and_log',
     'log_errors',
     'log_execution_time',
+    'get_default_logger',
     'default_logger'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Forward the lazy ``default_logger`` attribute without creating it at import."""
+    if name == 'default_logger':
+        return get_default_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -12,7 +12,7 @@ from github import Github, GithubException, Auth
 from github.GithubException import BadCredentialsException, UnknownObjectException
 
 from .config import ConfigLoader
-from .logger import AchievementLogger, log_context, log_errors
+from .logger import get_default_logger, log_context, log_errors
 
 
 class AuthenticationError(Exception):
@@ -53,7 +53,7 @@ class GitHubAuthenticator:
             AuthenticationError: If the token is invalid
             InsufficientScopesError: If the token lacks required scopes
         """
-        self.logger = AchievementLogger().get_logger()
+        self.logger = get_default_logger().get_logger()
         self.username = username
         self._token = token
         self._client: Optional[Github] = None
@@ -155,6 +155,16 @@ class GitHubAuthenticator:
         
         return self._client
     
+    @property
+    def token(self) -> str:
+        """
+        The personal access token, for requests made outside PyGithub.
+        
+        Returns:
+            str: GitHub personal access token
+        """
+        return self._token
+    
     @staticmethod
     def from_config(account_config: dict) -> 'GitHubAuthenticator':
         """
@@ -250,7 +260,7 @@ class MultiAccountAuthenticator:
             primary: Primary account authenticator
             secondary: Optional secondary account authenticator
         """
-        self.logger = AchievementLogger().get_logger()
+        self.logger = get_default_logger().get_logger()
         self.primary = primary
         self.secondary = secondary
         
@@ -286,9 +296,7 @@ class MultiAccountAuthenticator:
             try:
                 secondary_auth = GitHubAuthenticator.from_config(secondary_config)
             except AuthenticationError as e:
-                # Create temporary logger for class method
-                logger = AchievementLogger().get_logger()
-                logger.warning(f"Failed to authenticate secondary account: {str(e)}")
+                get_default_logger().warning(f"Failed to authenticate secondary account: {str(e)}")
         
         return cls(primary_auth, secondary_auth)
     
@@ -1,11 +1,47 @@
+import json
+import logging
 import os
 import re
-import yaml
-from typing import Any, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Union
 from pathlib import Path
 
 from .logger import AchievementLogger, log_context, log_errors
 
+# Allowed values for validated enum-like settings
+_VALID_DB_TYPES = frozenset({'sqlite', 'postgresql', 'mysql'})
+_LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVELS)
+
+# Sentinel distinguishing a missing cache entry from a cached None value
+_MISSING = object()
+
+# Matches ${VAR_NAME} placeholders for environment variable substitution
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+
+def _freeze(obj: Any) -> Any:
+    """
+    Recursively convert dicts to read-only mappings and lists to tuples.
+    
+    Args:
+        obj: The object to freeze
+        
+    Returns:
+        An immutable view of the object
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+def _section(mapping: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Return mapping[key] if it is a dict, otherwise an empty dict."""
+    value = mapping.get(key)
+    return value if isinstance(value, dict) else {}
+
 
 class ConfigError(Exception):
     """Raised when there's an error in configuration loading or validation."""
@@ -22,26 +58,122 @@ class ConfigLoader:
     - Configuration validation
     - Dot notation access for nested values
     - Default values for optional settings
+    - JSON sidecar cache of the parsed YAML, invalidated when the file changes
+    - Process-wide shared instances via get_instance()
     """
     
-    def __init__(self, config_path: str = 'config/config.yaml'):
+    # Default values for optional settings as (dotted key, value) pairs;
+    # _apply_defaults fills in whichever keys the loaded config lacks
+    _FLAT_DEFAULTS = (
+        ('github.rate_limit.requests_per_hour', 4500),
+        ('github.rate_limit.request_delay', 0.8),
+        ('notifications.enabled', True),
+        ('notifications.methods.console', True),
+        ('notifications.methods.email', False),
+        ('notifications.methods.webhook.enabled', False),
+        ('notifications.triggers.achievement_unlock', True),
+        ('notifications.triggers.milestone_progress', True),
+        ('notifications.triggers.daily_summary', False),
+        ('database.type', 'sqlite'),
+        ('database.sqlite.path', './data/achievements.db'),
+        ('logging.level', 'INFO'),
+        ('logging.file.enabled', True),
+        ('logging.file.path', './logs/achievement_hunter.log'),
+        ('logging.file.max_size_mb', 10),
+        ('logging.file.backup_count', 5),
+        ('logging.console.enabled', True),
+        ('logging.console.colorized', True),
+        ('monitoring.dashboard.enabled', True),
+        ('monitoring.dashboard.port', 8080),
+        ('monitoring.dashboard.host', '0.0.0.0'),
+        ('monitoring.metrics.enabled', True),
+        ('monitoring.metrics.interval_seconds', 300),
+        ('cache.enabled', True),
+        ('cache.backend', 'memory'),
+        ('cache.ttl', 3600),
+        ('scheduler.enabled', True),
+        ('scheduler.schedule', '0 * * * *'),
+        ('scheduler.timezone', 'UTC'),
+        ('advanced.retry.enabled', True),
+        ('advanced.retry.max_attempts', 3),
+        ('advanced.retry.backoff_factor', 2),
+        ('advanced.timeout', 30),
+        ('advanced.user_agent', 'GitHub-Achievement-Hunter/1.0'),
+        ('advanced.debug', False),
+    )
+    
+    # Dotted keys that must be present after defaults are applied
+    _REQUIRED_FIELDS = ('github.token', 'target.username', 'achievements')
+    
+    # Shared instances keyed by (absolute path, file mtime in ns)
+    _INSTANCES: Dict[tuple, 'ConfigLoader'] = {}
+    
+    def __init__(self, config_path: str = 'config/config.yaml', use_cache: bool = True):
         """
         Initialize the ConfigLoader.
         
         Args:
             config_path: Path to the configuration file
+            use_cache: Whether to read/write the parsed-YAML sidecar cache
         """
         self.logger = AchievementLogger().get_logger()
         self.config_path = Path(config_path)
+        self.cache_path = self.config_path.with_suffix(self.config_path.suffix + '.cache.json')
+        self.use_cache = use_cache
+        
+        # Dotted key -> split key tuple, and dotted key -> resolved value
+        self._key_cache: Dict[str, tuple] = {}
+        self._value_cache: Dict[str, Any] = {}
+        
+        # Read-only snapshot returned by get_all(), rebuilt after changes
+        self._frozen: Optional[Mapping[str, Any]] = None
+        
+        # Key in _INSTANCES when created through get_instance()
+        self._instance_key: Optional[tuple] = None
         
         with log_context(f"Loading configuration from {config_path}", self.logger):
             self.config = self._load_config()
-            self.config = self._substitute_env_vars(self.config)
+            self._substitute_env_vars(self.config)
             self._apply_defaults()
             self._validate_config()
             
         self.logger.info(f"Configuration loaded successfully from {self.config_path}")
     
+    @classmethod
+    def get_instance(cls, config_path: str = 'config/config.yaml') -> 'ConfigLoader':
+        """
+        Get a shared ConfigLoader for a configuration file.
+        
+        The file is loaded once per process and the same instance is returned
+        until the file's modification time changes.
+        
+        Args:
+            config_path: Path to the configuration file
+            
+        Returns:
+            The shared ConfigLoader instance
+            
+        Raises:
+            ConfigError: If the configuration cannot be loaded
+        """
+        path = Path(config_path).resolve()
+        try:
+            key = (str(path), path.stat().st_mtime_ns)
+        except OSError:
+            # Let the constructor raise the usual ConfigError
+            return cls(str(path))
+        
+        instance = cls._INSTANCES.get(key)
+        if instance is None:
+            # Drop instances built from older versions of the same file
+            for stale_key in [k for k in cls._INSTANCES if k[0] == key[0]]:
+                del cls._INSTANCES[stale_key]
+            
+            instance = cls(str(path))
+            instance._instance_key = key
+            cls._INSTANCES[key] = instance
+        return instance
+    
     @log_errors(reraise=True)
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -58,154 +190,155 @@ class ConfigLoader:
             raise ConfigError(f"Configuration file not found: {self.config_path}")
         
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
-                if config is None:
-                    self.logger.debug("Empty configuration file, returning empty dict")
-                    return {}
+            stat = self.config_path.stat()
+            header = {'src_mtime': stat.st_mtime_ns, 'src_size': stat.st_size}
+            
+            if self.use_cache:
+                config = self._read_cache(header)
+                if config is not None:
+                    self.logger.debug(f"Loaded configuration from cache: {self.cache_path}")
+                    return config
+            
+            config = self._parse_yaml()
+            if config is None:
+                self.logger.debug("Empty configuration file, returning empty dict")
+                config = {}
+            else:
                 self.logger.debug(f"Loaded {len(config)} top-level configuration sections")
-                return config
-        except yaml.YAMLError as e:
-            self.logger.error(f"YAML parsing error: {e}")
-            raise ConfigError(f"Error parsing YAML file: {e}")
+            
+            if self.use_cache:
+                self._write_cache(header, config)
+            return config
+        except ConfigError:
+            raise
         except Exception as e:
             self.logger.error(f"Failed to read configuration file: {e}")
             raise ConfigError(f"Error reading configuration file: {e}")
     
-    def _substitute_env_vars(self, obj: Any) -> Any:
+    def _parse_yaml(self) -> Any:
         """
-        Recursively substitute environment variables in the configuration.
+        Parse the YAML configuration file.
         
-        Replaces ${VAR_NAME} with the value of environment variable VAR_NAME.
+        PyYAML is imported here, on a cache miss, so cache hits never pay
+        for loading it.
+        
+        Returns:
+            The parsed document, or None if the file is empty
+            
+        Raises:
+            ConfigError: If the file is not valid YAML
+        """
+        import yaml
+        
+        try:
+            with open(self.config_path, 'rb') as f:
+                # Prefer libyaml's C parser; fall back to the pure-Python one if unavailable
+                return yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+        except yaml.YAMLError as e:
+            self.logger.error(f"YAML parsing error: {e}")
+            raise ConfigError(f"Error parsing YAML file: {e}")
+    
+    def _read_cache(self, header: Dict[str, int]) -> Optional[Dict[str, Any]]:
+        """
+        Read the parsed configuration from the JSON sidecar cache.
         
         Args:
-            obj: The object to process
+            header: Modification time and size of the YAML source
             
         Returns:
-            The processed object with environment variables substituted
+            The cached configuration, or None if missing or stale
         """
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                if json.loads(f.readline()) != header:
+                    return None
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_cache(self, header: Dict[str, int], config: Dict[str, Any]) -> None:
+        """
+        Atomically write the parsed configuration to the JSON sidecar cache.
         
-        if isinstance(obj, dict):
-            return {k: self._substitute_env_vars(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._substitute_env_vars(item) for item in obj]
-        elif isinstance(obj, str):
-            # Find all ${VAR_NAME} patterns
-            pattern = re.compile(r'\$\{([^}]+)\}')
-            
-            def replacer(match):
-                var_name = match.group(1)
-                value = os.getenv(var_name)
-                if value is None:
-                    # Keep the original placeholder if env var not found
-                    self.logger.warning(f"Environment variable {var_name} not found, keeping placeholder")
-                    return match.group(0)
-                self.logger.debug(f"Substituted environment variable {var_name}")
-                return value
+        Configurations that do not survive a JSON round-trip unchanged
+        (e.g. dates or non-string keys) are not cached.
+        
+        Args:
+            header: Modification time and size of the YAML source
+            config: The parsed configuration
+        """
+        try:
+            body = json.dumps(config)
+            if json.loads(body) != config:
+                self.logger.debug("Configuration is not JSON round-trippable, skipping cache")
+                return
             
-            return pattern.sub(replacer, obj)
-        else:
-            return obj
+            tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(header) + '\n' + body)
+            os.replace(tmp_path, self.cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not write configuration cache: {e}")
     
-    def _apply_defaults(self):
-        """Apply default values for optional configuration settings."""
-        defaults = {
-            'github': {
-                'rate_limit': {
-                    'requests_per_hour': 4500,
-                    'request_delay': 0.8
-                }
-            },
-            'notifications': {
-                'enabled': True,
-                'methods': {
-                    'console': True,
-                    'email': False,
-                    'webhook': {
-                        'enabled': False
-                    }
-                },
-                'triggers': {
-                    'achievement_unlock': True,
-                    'milestone_progress': True,
-                    'daily_summary': False
-                }
-            },
-            'database': {
-                'type': 'sqlite',
-                'sqlite': {
-                    'path': './data/achievements.db'
-                }
-            },
-            'logging': {
-                'level': 'INFO',
-                'file': {
-                    'enabled': True,
-                    'path': './logs/achievement_hunter.log',
-                    'max_size_mb': 10,
-                    'backup_count': 5
-                },
-                'console': {
-                    'enabled': True,
-                    'colorized': True
-                }
-            },
-            'monitoring': {
-                'dashboard': {
-                    'enabled': True,
-                    'port': 8080,
-                    'host': '0.0.0.0'
-                },
-                'metrics': {
-                    'enabled': True,
-                    'interval_seconds': 300
-                }
-            },
-            'cache': {
-                'enabled': True,
-                'backend': 'memory',
-                'ttl': 3600
-            },
-            'scheduler': {
-                'enabled': True,
-                'schedule': '0 * * * *',
-                'timezone': 'UTC'
-            },
-            'advanced': {
-                'retry': {
-                    'enabled': True,
-                    'max_attempts': 3,
-                    'backoff_factor': 2
-                },
-                'timeout': 30,
-                'user_agent': 'GitHub-Achievement-Hunter/1.0',
-                'debug': False
-            }
-        }
-        
-        # Deep merge defaults with loaded config
-        self.config = self._deep_merge(defaults, self.config)
+    def _substitute_env_vars(self, config: Dict[str, Any]) -> None:
+        """
+        Substitute environment variables in the configuration, in place.
+        
+        Replaces ${VAR_NAME} with the value of environment variable VAR_NAME.
+        Walks nested dicts and lists iteratively and only rewrites strings
+        that actually contain a placeholder.
+        
+        Args:
+            config: The configuration to process
+        """
+        stack = [config]
+        while stack:
+            node = stack.pop()
+            items = node.items() if isinstance(node, dict) else enumerate(node)
+            for key, value in items:
+                if isinstance(value, str):
+                    # Most values contain no placeholder; skip the regex engine for them
+                    if '${' in value:
+                        node[key] = _ENV_VAR_RE.sub(self._replace_env_var, value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
     
-    def _deep_merge(self, default: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    def _replace_env_var(self, match: re.Match) -> str:
         """
-        Deep merge two dictionaries, with override taking precedence.
+        Resolve a single ${VAR_NAME} placeholder match.
         
         Args:
-            default: The default dictionary
-            override: The override dictionary
+            match: Regex match for the placeholder
             
         Returns:
-            Merged dictionary
+            The environment variable value, or the original placeholder if unset
         """
-        result = default.copy()
-        
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
+        var_name = match.group(1)
+        value = os.getenv(var_name)
+        if value is None:
+            # Keep the original placeholder if env var not found
+            self.logger.warning(f"Environment variable {var_name} not found, keeping placeholder")
+            return match.group(0)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Substituted environment variable {var_name}")
+        return value
+    
+    def _apply_defaults(self):
+        """Apply default values for optional configuration settings."""
+        # One pass over the flat table; values the user set, even to None,
+        # win, and a non-dict user value shadows every default beneath it
+        for key, default in self._FLAT_DEFAULTS:
+            *parents, leaf = self._split_key(key)
+            node = self.config
+            for k in parents:
+                node = node.setdefault(k, {})
+                if not isinstance(node, dict):
+                    break
             else:
-                result[key] = value
+                node.setdefault(leaf, default)
         
-        return result
+        self._value_cache.clear()
+        self._frozen = None
     
     @log_errors(reraise=True)
     def _validate_config(self):
@@ -217,24 +350,25 @@ class ConfigLoader:
         """
         self.logger.debug("Validating configuration")
         
-        # Check required fields
-        required_fields = [
-            'github.token',
-            'target.username',
-            'achievements'
-        ]
+        # Read each section once instead of re-walking from the root per field
+        github = _section(self.config, 'github')
+        database = _section(self.config, 'database')
+        logging_config = _section(self.config, 'logging')
+        dashboard = _section(_section(self.config, 'monitoring'), 'dashboard')
         
-        for field in required_fields:
+        # Check required fields
+        for field in self._REQUIRED_FIELDS:
             if self.get(field) is None:
                 raise ConfigError(f"Required configuration field missing: {field}")
         
+        token = github.get('token')
+        
         # Validate GitHub token format (should not be a placeholder)
-        token = self.get('github.token')
         if token and token.startswith('${') and token.endswith('}'):
             raise ConfigError(f"GitHub token not set. Please set the {token[2:-1]} environment variable.")
         
         # Validate achievement targets
-        achievements = self.get('achievements', {})
+        achievements = self.config['achievements']
         # List of known achievement types that use dict config with 'enabled' flag
         achievement_types = ['quickdraw', 'yolo', 'pull_shark', 'pair_extraordinaire', 'galaxy_brain']
         
@@ -260,25 +394,33 @@ class ConfigLoader:
                     raise ConfigError(f"Achievement target '{key}' must be a positive integer")
         
         # Validate database configuration
-        db_type = self.get('database.type')
-        if db_type not in ['sqlite', 'postgresql', 'mysql']:
+        db_type = database.get('type')
+        if not isinstance(db_type, str) or db_type not in _VALID_DB_TYPES:
             raise ConfigError(f"Invalid database type: {db_type}")
         
         # Validate log level
-        log_level = self.get('logging.level')
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if log_level not in valid_levels:
-            raise ConfigError(f"Invalid log level: {log_level}. Must be one of {valid_levels}")
+        log_level = logging_config.get('level')
+        if not isinstance(log_level, str) or log_level not in _VALID_LOG_LEVELS:
+            raise ConfigError(f"Invalid log level: {log_level}. Must be one of {list(_LOG_LEVELS)}")
         
         # Validate port numbers
-        dashboard_port = self.get('monitoring.dashboard.port')
+        dashboard_port = dashboard.get('port')
         if not isinstance(dashboard_port, int) or dashboard_port < 1 or dashboard_port > 65535:
             raise ConfigError("Dashboard port must be between 1 and 65535")
     
+    def _split_key(self, key: str) -> tuple:
+        """Split a dotted key, memoizing the result."""
+        keys = self._key_cache.get(key)
+        if keys is None:
+            keys = self._key_cache[key] = tuple(key.split('.'))
+        return keys
+    
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a configuration value using dot notation.
         
+        Resolved values are memoized until the next set() or reload().
+        
         Args:
             key: The configuration key (e.g., 'github.token' or 'achievements.stars')
             default: Default value to return if key not found
@@ -286,15 +428,18 @@ class ConfigLoader:
         Returns:
             The configuration value or default if not found
         """
-        keys = key.split('.')
-        value = self.config
+        value = self._value_cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
         
-        for k in keys:
+        value = self.config
+        for k in self._split_key(key):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
                 return default
         
+        self._value_cache[key] = value
         return value
     
     def set(self, key: str, value: Any):
@@ -305,7 +450,7 @@ class ConfigLoader:
             key: The configuration key (e.g., 'github.token')
             value: The value to set
         """
-        keys = key.split('.')
+        keys = self._split_key(key)
         config = self.config
         
         for k in keys[:-1]:
@@ -314,22 +459,33 @@ class ConfigLoader:
             config = config[k]
         
         config[keys[-1]] = value
+        self._value_cache.clear()
+        self._frozen = None
     
-    def get_all(self) -> Dict[str, Any]:
+    def get_all(self) -> Mapping[str, Any]:
         """
-        Get the entire configuration dictionary.
+        Get the entire configuration as a read-only mapping.
+        
+        The frozen snapshot is built once and shared between calls until the
+        configuration changes, so callers cannot mutate shared state.
         
         Returns:
-            The complete configuration dictionary
+            The complete configuration, with nested dicts as read-only
+            mappings and lists as tuples
         """
-        return self.config.copy()
+        if self._frozen is None:
+            self._frozen = _freeze(self.config)
+        return self._frozen
     
     def reload(self):
         """Reload the configuration from file."""
         self.logger.info("Reloading configuration")
+        if self._instance_key is not None:
+            ConfigLoader._INSTANCES.pop(self._instance_key, None)
+            self._instance_key = None
         with log_context("Configuration reload", self.logger):
             self.config = self._load_config()
-            self.config = self._substitute_env_vars(self.config)
+            self._substitute_env_vars(self.config)
             self._apply_defaults()
             self._validate_config()
         self.logger.info("Configuration reloaded successfully")
\ No newline at end of file
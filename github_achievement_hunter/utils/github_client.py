@@ -5,20 +5,17 @@ This module provides a wrapper around PyGithub that handles rate limiting,
 retries, and provides a clean interface for achievement-specific operations.
 """
 
-import logging
+import json
 import time
-from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any, Callable, TypeVar
+import weakref
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Callable, Iterator, Tuple, TypeVar, Union
 
+import requests
 from github import Github, GithubException, Repository, PullRequest, Issue
-from github.GithubException import RateLimitExceededException, GithubException
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    before_sleep_log
-)
+from github.GithubException import RateLimitExceededException, GithubException, UnknownObjectException
+from github.PaginatedList import PaginatedList
 
 from .logger import AchievementLogger, log_context, log_errors, log_execution_time
 
@@ -41,12 +38,35 @@ class GitHubClient:
     Attributes:
         client: The underlying PyGithub client
         rate_limit_buffer: Number of API calls to keep in reserve
-        _last_rate_check: Timestamp of last rate limit check
+        _last_rate_check: Monotonic timestamp of last rate limit check
     """
     
     # Minimum time between rate limit checks (in seconds)
     RATE_CHECK_INTERVAL = 60
     
+    # Number of API calls after which the rate limit is re-checked early
+    CHECK_EVERY_OPS = 25
+    
+    # Retry policy for failed API calls: attempts and backoff bounds (in seconds)
+    RETRY_ATTEMPTS = 3
+    RETRY_MIN_WAIT = 4
+    RETRY_MAX_WAIT = 10
+    
+    # GitHub GraphQL API endpoint
+    GRAPHQL_ENDPOINT = "https://api.github.com/graphql"
+    
+    # Timeout for GraphQL requests (in seconds)
+    GRAPHQL_TIMEOUT = 30
+    
+    # Maximum number of operations packed into one GraphQL request
+    BULK_BATCH_SIZE = 50
+    
+    # How long cached Repository objects stay valid (in seconds)
+    REPO_CACHE_TTL = 300
+    
+    # Worker threads for running independent API calls concurrently
+    MAX_WORKERS = 8
+    
     def __init__(self, auth_client: GitHubAuthenticator, rate_limit_buffer: int = 100):
         """
         Initialize the GitHub client wrapper.
@@ -58,11 +78,90 @@ class GitHubClient:
         self.logger = AchievementLogger().get_logger()
         self.client = auth_client.get_client()
         self.username = auth_client.username
+        self._token = auth_client.token
         self.rate_limit_buffer = rate_limit_buffer
-        self._last_rate_check = 0
+        self._last_rate_check = float('-inf')
+        self._ops_since_check = 0
+        
+        # Cached PyGithub objects to avoid repeated /user and /repos lookups
+        self._user = None
+        self._repo_cache: Dict[str, Tuple[float, Repository.Repository]] = {}
+        
+        # Thread pools for independent, I/O-bound API calls and for page
+        # fetches. Pages get their own pool so a paginated fetch made from
+        # inside map_api_calls can't wait on workers that are all waiting on
+        # it. Both are shut down by close(), or when the client is garbage
+        # collected or at exit.
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS, thread_name_prefix='github-client'
+        )
+        self._page_executor = ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS, thread_name_prefix='github-client-pages'
+        )
+        self._shutdown_executor = weakref.finalize(
+            self, self._shutdown_pools, (self._executor, self._page_executor)
+        )
         
         self.logger.info(f"Initialized GitHubClient for user: {self.username}")
     
+    def close(self) -> None:
+        """
+        Shut down the client's worker threads.
+        
+        Safe to call more than once. Calls that need the thread pool
+        (map_api_calls, paginated fetches) fail after the client is closed.
+        """
+        self._shutdown_executor()
+    
+    @staticmethod
+    def _shutdown_pools(pools: Tuple[ThreadPoolExecutor, ...]) -> None:
+        """
+        Shut down thread pools, waiting for running calls to finish.
+        
+        Args:
+            pools: Thread pools to shut down
+        """
+        for pool in pools:
+            pool.shutdown(wait=True)
+    
+    def __enter__(self) -> 'GitHubClient':
+        """Use the client as a context manager that closes it on exit."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the client when leaving the ``with`` block."""
+        self.close()
+    
+    def _get_user(self):
+        """
+        Get the authenticated user, cached for the lifetime of the client.
+        
+        Returns:
+            The AuthenticatedUser object
+        """
+        if self._user is None:
+            self._user = self.client.get_user()
+        return self._user
+    
+    def _get_repo(self, repo_name: str) -> Repository.Repository:
+        """
+        Get a repository, reusing a cached object for up to REPO_CACHE_TTL seconds.
+        
+        Args:
+            repo_name: Full repository name (e.g., 'owner/repo')
+            
+        Returns:
+            The Repository object
+        """
+        now = time.monotonic()
+        cached = self._repo_cache.get(repo_name)
+        if cached is not None and now - cached[0] < self.REPO_CACHE_TTL:
+            return cached[1]
+        
+        repo = self.client.get_repo(repo_name)
+        self._repo_cache[repo_name] = (now, repo)
+        return repo
+    
     @log_errors(reraise=True)
     def _check_rate_limit(self, force_check: bool = False) -> None:
         """
@@ -71,32 +170,54 @@ class GitHubClient:
         If the remaining rate limit is below the buffer threshold,
         this method will sleep until the rate limit resets.
         
+        Routine checks read the X-RateLimit-* headers PyGithub records from
+        every response, so they cost no API call; PyGithub only falls back
+        to /rate_limit if no response has been seen yet. Forced checks, and
+        routine checks whose recorded values are unusable, query
+        /rate_limit.
+        
         Args:
-            force_check: Force a rate limit check even if recently checked
+            force_check: Force a live rate limit check even if recently checked
             
         Raises:
             RateLimitExceededException: If rate limit is exceeded after waiting
         """
-        # Skip frequent rate limit checks to avoid wasting API calls
-        current_time = time.time()
-        if not force_check and (current_time - self._last_rate_check) < self.RATE_CHECK_INTERVAL:
+        # Skip frequent rate limit checks to avoid wasting API calls.
+        # Intervals use the monotonic clock so wall-clock steps can't skew them.
+        current_time = time.monotonic()
+        if (not force_check
+                and self._ops_since_check < self.CHECK_EVERY_OPS
+                and (current_time - self._last_rate_check) < self.RATE_CHECK_INTERVAL):
             return
         
+        self._ops_since_check = 0
         try:
-            rate_limit = self.client.get_rate_limit()
-            core_limit = rate_limit.core
+            recorded = None
+            if not force_check:
+                try:
+                    remaining, limit = self.client.rate_limiting
+                    recorded = (int(remaining), int(limit), float(self.client.rate_limiting_resettime))
+                except (TypeError, ValueError):
+                    # Unexpected header values; fall back to asking /rate_limit
+                    pass
+            
+            if recorded is None:
+                core_limit = self.client.get_rate_limit().core
+                remaining, limit = core_limit.remaining, core_limit.limit
+                reset_timestamp = core_limit.reset.timestamp()
+            else:
+                remaining, limit, reset_timestamp = recorded
             
             self._last_rate_check = current_time
             
-            self.logger.debug(f"Rate limit: {core_limit.remaining}/{core_limit.limit}")
+            self.logger.debug(f"Rate limit: {remaining}/{limit}")
             
-            if core_limit.remaining < self.rate_limit_buffer:
+            if remaining < self.rate_limit_buffer:
                 # Calculate sleep time
-                reset_timestamp = core_limit.reset.timestamp()
                 sleep_time = max(0, reset_timestamp - time.time() + 1)
                 
                 self.logger.warning(
-                    f"Rate limit low ({core_limit.remaining} remaining). "
+                    f"Rate limit low ({remaining} remaining). "
                     f"Sleeping for {sleep_time:.0f} seconds until reset."
                 )
                 
@@ -115,18 +236,12 @@ class GitHubClient:
             self.logger.error(f"Error checking rate limit: {str(e)}")
             # Don't fail on rate limit check errors
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type(GithubException),
-        before_sleep=before_sleep_log(logging.getLogger(__name__), logging.WARNING)
-    )
     def api_call_with_retry(self, func: Callable[..., T], *args, **kwargs) -> T:
         """
         Execute an API call with automatic retry on failure.
         
         This method wraps any API call with retry logic using exponential
-        backoff. It will retry up to 3 times on GithubException.
+        backoff. It will try up to RETRY_ATTEMPTS times on GithubException.
         
         Args:
             func: The function to call
@@ -139,8 +254,265 @@ class GitHubClient:
         Raises:
             GithubException: If all retry attempts fail
         """
-        self._check_rate_limit()
-        return func(*args, **kwargs)
+        # Only pay for a rate limit check every CHECK_EVERY_OPS calls or
+        # RATE_CHECK_INTERVAL seconds; other calls go straight through
+        self._ops_since_check += 1
+        if (self._ops_since_check >= self.CHECK_EVERY_OPS
+                or (time.monotonic() - self._last_rate_check) >= self.RATE_CHECK_INTERVAL):
+            self._check_rate_limit()
+        
+        for attempt in range(self.RETRY_ATTEMPTS):
+            try:
+                return func(*args, **kwargs)
+            except GithubException as e:
+                if attempt == self.RETRY_ATTEMPTS - 1:
+                    raise
+                delay = min(max(2 ** attempt, self.RETRY_MIN_WAIT), self.RETRY_MAX_WAIT)
+                self.logger.warning(
+                    f"API call failed (attempt {attempt + 1}/{self.RETRY_ATTEMPTS}), "
+                    f"retrying in {delay} seconds: {e}"
+                )
+                time.sleep(delay)
+    
+    def map_api_calls(self, func: Callable[[Any], T], items: List[Any]) -> List[T]:
+        """
+        Run an API call for each item concurrently, with retry logic.
+        
+        Args:
+            func: The function to call with each item
+            items: Items to pass to ``func``
+            
+        Returns:
+            Results in the same order as ``items``
+            
+        Raises:
+            GithubException: If any call fails after retries
+        """
+        return list(self._executor.map(partial(self.api_call_with_retry, func), items))
+    
+    def _fetch_all_pages(self, paginated: PaginatedList) -> List[Any]:
+        """
+        Fetch every page of a PaginatedList concurrently.
+        
+        Args:
+            paginated: The paginated result to materialize
+            
+        Returns:
+            All items, in page order
+        """
+        page_count = -(-paginated.totalCount // self.client.per_page)
+        pages = self._page_executor.map(paginated.get_page, range(page_count))
+        return [item for page in pages for item in page]
+    
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute a GraphQL query or mutation.
+        
+        Several mutations can be sent in one document to save round-trips;
+        GitHub executes them serially in the order given. Failed HTTP
+        requests are retried, but GraphQL-level errors are not: part of a
+        mutation document may already have been applied.
+        
+        Args:
+            query: GraphQL query or mutation document
+            variables: Variables referenced by the document
+            
+        Returns:
+            The 'data' section of the GraphQL response
+            
+        Raises:
+            GithubException: If the HTTP request or the GraphQL operation fails
+        """
+        payload = {'query': query, 'variables': variables or {}}
+        result = self.api_call_with_retry(self._post_graphql, payload)
+        if 'errors' in result:
+            raise GithubException(200, result['errors'], None)
+        return result['data']
+    
+    def _post_graphql(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a single GraphQL request.
+        
+        Args:
+            payload: JSON body with 'query' and 'variables'
+            
+        Returns:
+            The GraphQL response, with 'data' and any 'errors'
+            
+        Raises:
+            GithubException: If the HTTP request fails
+        """
+        response = requests.post(
+            self.GRAPHQL_ENDPOINT,
+            json=payload,
+            headers={
+                'Authorization': f'Bearer {self._token}',
+                'Content-Type': 'application/json'
+            },
+            timeout=self.GRAPHQL_TIMEOUT
+        )
+        if response.status_code != 200:
+            raise GithubException(response.status_code, response.text, None)
+        return response.json()
+    
+    def bulk_execute(self, operations: List[str], batch_size: Optional[int] = None,
+                     mutation: bool = True) -> Tuple[List[Optional[Dict[str, Any]]], Dict[int, str]]:
+        """
+        Execute many GraphQL operations using as few requests as possible.
+        
+        Each operation is a single top-level field with its selection set,
+        e.g. ``createIssue(input: {...}) { issue { number } }``. Operations
+        are aliased ``m0``, ``m1``, ... and packed ``batch_size`` at a time
+        into one document.
+        
+        An operation that fails does not fail its batch: the other
+        operations in the document still ran, so the batch is not retried
+        and the error is returned for that operation alone.
+        
+        Args:
+            operations: GraphQL field selections to execute
+            batch_size: Operations per request (default: BULK_BATCH_SIZE)
+            mutation: Whether the operations are mutations or queries
+            
+        Returns:
+            Tuple of the per-operation results, in the same order as
+            ``operations`` and None for failed operations, and the error
+            messages keyed by operation index
+            
+        Raises:
+            GithubException: If a request fails as a whole
+        """
+        batch_size = batch_size or self.BULK_BATCH_SIZE
+        keyword = 'mutation' if mutation else 'query'
+        results = []
+        errors = {}
+        
+        for start in range(0, len(operations), batch_size):
+            batch = operations[start:start + batch_size]
+            fields = "\n".join(f"m{i}: {op}" for i, op in enumerate(batch))
+            self.logger.debug(f"Executing GraphQL batch of {len(batch)} operations")
+            result = self.api_call_with_retry(
+                self._post_graphql, {'query': f"{keyword} {{\n{fields}\n}}", 'variables': {}}
+            )
+            
+            batch_errors = {}
+            for error in result.get('errors', []):
+                alias = (error.get('path') or [None])[0]
+                batch_errors.setdefault(alias, error.get('message', 'Unknown error'))
+            if None in batch_errors or not result.get('data'):
+                # Not tied to an operation, e.g. a syntax error: nothing ran
+                raise GithubException(200, result.get('errors'), None)
+            
+            data = result['data']
+            for i in range(len(batch)):
+                alias = f"m{i}"
+                if alias in batch_errors:
+                    errors[start + i] = batch_errors[alias]
+                    results.append(None)
+                else:
+                    results.append(data.get(alias))
+        
+        return results, errors
+    
+    def create_issues_bulk(self, repo_name: str, specs: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """
+        Create several issues in a repository with batched GraphQL mutations.
+        
+        Issues that GitHub rejects are logged and left out of the result;
+        the rest of the batch is still created.
+        
+        Args:
+            repo_name: Full repository name (e.g., 'owner/repo')
+            specs: Issue specs, each with a 'title' and optional 'body'
+            
+        Returns:
+            List of dicts with the 'id', 'number' and 'url' of each created issue
+            
+        Raises:
+            GithubException: If issue creation fails
+        """
+        self.logger.info(f"Creating {len(specs)} issues in {repo_name}")
+        
+        repo_id = self.api_call_with_retry(self._get_repo, repo_name).node_id
+        operations = [
+            f"createIssue(input: {{repositoryId: {json.dumps(repo_id)}, "
+            f"title: {json.dumps(spec['title'])}, body: {json.dumps(spec.get('body', ''))}}}) "
+            f"{{ issue {{ id number url }} }}"
+            for spec in specs
+        ]
+        
+        results, errors = self.bulk_execute(operations)
+        for index, message in errors.items():
+            self.logger.warning(f"Failed to create issue '{specs[index]['title']}': {message}")
+        
+        issues = [result['issue'] for result in results if result is not None]
+        self.logger.info(f"Successfully created {len(issues)} issues in {repo_name}")
+        return issues
+    
+    def close_issues_bulk(self, repo_name: str, issue_numbers: List[int]) -> None:
+        """
+        Close several issues with batched GraphQL requests.
+        
+        Issue node IDs are looked up in one batched query, then all issues
+        are closed in one batched mutation. Issues that cannot be found or
+        closed are logged and skipped.
+        
+        Args:
+            repo_name: Full repository name (e.g., 'owner/repo')
+            issue_numbers: Issue numbers to close
+            
+        Raises:
+            GithubException: If closing fails
+        """
+        self.logger.info(f"Closing {len(issue_numbers)} issues in {repo_name}")
+        
+        owner, name = repo_name.split('/', 1)
+        lookups = [
+            f"repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) "
+            f"{{ issue(number: {int(number)}) {{ id }} }}"
+            for number in issue_numbers
+        ]
+        results, errors = self.bulk_execute(lookups, mutation=False)
+        for index, message in errors.items():
+            self.logger.warning(f"Failed to look up issue #{issue_numbers[index]}: {message}")
+        found = [
+            (number, result['issue']['id'])
+            for number, result in zip(issue_numbers, results)
+            if result is not None and result['issue'] is not None
+        ]
+        
+        operations = [
+            f"closeIssue(input: {{issueId: {json.dumps(issue_id)}}}) {{ issue {{ number }} }}"
+            for _, issue_id in found
+        ]
+        _, errors = self.bulk_execute(operations)
+        for index, message in errors.items():
+            self.logger.warning(f"Failed to close issue #{found[index][0]}: {message}")
+        self.logger.info(f"Successfully closed {len(found) - len(errors)} issues in {repo_name}")
+    
+    def repository_exists(self, repo_name: str) -> bool:
+        """
+        Check whether the authenticated user has a repository.
+        
+        Looks the repository up directly, so this is a single request no
+        matter how many repositories the user has. A repository that is
+        found stays in the repo cache for later calls.
+        
+        Args:
+            repo_name: Repository name (without owner prefix)
+            
+        Returns:
+            True if the repository exists
+            
+        Raises:
+            GithubException: If the lookup fails for any reason other than
+                the repository not existing
+        """
+        try:
+            self._get_repo(f"{self.username}/{repo_name}")
+        except UnknownObjectException:
+            return False
+        return True
     
     def create_repository(self, name: str, description: str = "", 
                          private: bool = False, auto_init: bool = True) -> Repository.Repository:
@@ -161,16 +533,13 @@ class GitHubClient:
         """
         self.logger.info(f"Creating repository: {name}")
         
-        def _create():
-            user = self.client.get_user()
-            return user.create_repo(
-                name=name,
-                description=description,
-                private=private,
-                auto_init=auto_init
-            )
-        
-        repo = self.api_call_with_retry(_create)
+        repo = self.api_call_with_retry(
+            self._get_user().create_repo,
+            name=name,
+            description=description,
+            private=private,
+            auto_init=auto_init
+        )
         self.logger.info(f"Successfully created repository: {repo.full_name}")
         return repo
     
@@ -186,11 +555,9 @@ class GitHubClient:
         """
         self.logger.warning(f"Deleting repository: {repo_name}")
         
-        def _delete():
-            repo = self.client.get_user().get_repo(repo_name)
-            repo.delete()
-        
-        self.api_call_with_retry(_delete)
+        repo = self.api_call_with_retry(self._get_user().get_repo, repo_name)
+        self.api_call_with_retry(repo.delete)
+        self._repo_cache.pop(f"{self.username}/{repo_name}", None)
         self.logger.info(f"Successfully deleted repository: {repo_name}")
     
     def create_pull_request(self, repo_name: str, title: str, body: str,
@@ -213,16 +580,14 @@ class GitHubClient:
         """
         self.logger.info(f"Creating pull request in {repo_name}: {title}")
         
-        def _create():
-            repo = self.client.get_repo(repo_name)
-            return repo.create_pull(
-                title=title,
-                body=body,
-                head=head,
-                base=base
-            )
-        
-        pr = self.api_call_with_retry(_create)
+        repo = self.api_call_with_retry(self._get_repo, repo_name)
+        pr = self.api_call_with_retry(
+            repo.create_pull,
+            title=title,
+            body=body,
+            head=head,
+            base=base
+        )
         self.logger.info(f"Successfully created PR #{pr.number} in {repo_name}")
         return pr
     
@@ -241,12 +606,9 @@ class GitHubClient:
         """
         self.logger.info(f"Merging PR #{pr_number} in {repo_name}")
         
-        def _merge():
-            repo = self.client.get_repo(repo_name)
-            pr = repo.get_pull(pr_number)
-            pr.merge(commit_message=commit_message)
-        
-        self.api_call_with_retry(_merge)
+        repo = self.api_call_with_retry(self._get_repo, repo_name)
+        pr = self.api_call_with_retry(repo.get_pull, pr_number)
+        self.api_call_with_retry(pr.merge, commit_message=commit_message)
         self.logger.info(f"Successfully merged PR #{pr_number} in {repo_name}")
     
     def create_issue(self, repo_name: str, title: str, body: str = "",
@@ -268,15 +630,13 @@ class GitHubClient:
         """
         self.logger.info(f"Creating issue in {repo_name}: {title}")
         
-        def _create():
-            repo = self.client.get_repo(repo_name)
-            return repo.create_issue(
-                title=title,
-                body=body,
-                labels=labels or []
-            )
-        
-        issue = self.api_call_with_retry(_create)
+        repo = self.api_call_with_retry(self._get_repo, repo_name)
+        issue = self.api_call_with_retry(
+            repo.create_issue,
+            title=title,
+            body=body,
+            labels=labels or []
+        )
         self.logger.info(f"Successfully created issue #{issue.number} in {repo_name}")
         return issue
     
@@ -293,12 +653,9 @@ class GitHubClient:
         """
         self.logger.info(f"Closing issue #{issue_number} in {repo_name}")
         
-        def _close():
-            repo = self.client.get_repo(repo_name)
-            issue = repo.get_issue(issue_number)
-            issue.edit(state='closed')
-        
-        self.api_call_with_retry(_close)
+        repo = self.api_call_with_retry(self._get_repo, repo_name)
+        issue = self.api_call_with_retry(repo.get_issue, issue_number)
+        self.api_call_with_retry(issue.edit, state='closed')
         self.logger.info(f"Successfully closed issue #{issue_number} in {repo_name}")
     
     def star_repository(self, repo_name: str) -> None:
@@ -313,12 +670,9 @@ class GitHubClient:
         """
         self.logger.info(f"Starring repository: {repo_name}")
         
-        def _star():
-            user = self.client.get_user()
-            repo = self.client.get_repo(repo_name)
-            user.add_to_starred(repo)
-        
-        self.api_call_with_retry(_star)
+        user = self._get_user()
+        repo = self.api_call_with_retry(self._get_repo, repo_name)
+        self.api_call_with_retry(user.add_to_starred, repo)
         self.logger.info(f"Successfully starred repository: {repo_name}")
     
     def fork_repository(self, repo_name: str) -> Repository.Repository:
@@ -336,11 +690,8 @@ class GitHubClient:
         """
         self.logger.info(f"Forking repository: {repo_name}")
         
-        def _fork():
-            repo = self.client.get_repo(repo_name)
-            return repo.create_fork()
-        
-        forked_repo = self.api_call_with_retry(_fork)
+        repo = self.api_call_with_retry(self._get_repo, repo_name)
+        forked_repo = self.api_call_with_retry(repo.create_fork)
         self.logger.info(f"Successfully forked repository: {forked_repo.full_name}")
         return forked_repo
     
@@ -362,20 +713,17 @@ class GitHubClient:
         """
         self.logger.info(f"Creating {'public' if public else 'private'} gist: {description}")
         
-        def _create():
-            user = self.client.get_user()
-            # Convert files dict to format expected by PyGithub
-            gist_files = {
-                filename: {'content': content}
-                for filename, content in files.items()
-            }
-            return user.create_gist(
-                public=public,
-                files=gist_files,
-                description=description
-            )
-        
-        gist = self.api_call_with_retry(_create)
+        # Convert files dict to format expected by PyGithub, once rather than per retry
+        gist_files = {}
+        for filename, content in files.items():
+            gist_files[filename] = {'content': content}
+        
+        gist = self.api_call_with_retry(
+            self._get_user().create_gist,
+            public=public,
+            files=gist_files,
+            description=description
+        )
         self.logger.info(f"Successfully created gist: {gist.id}")
         return gist
     
@@ -391,18 +739,49 @@ class GitHubClient:
         """
         self.logger.info(f"Following user: {username}")
         
-        def _follow():
-            user = self.client.get_user()
-            target_user = self.client.get_user(username)
-            user.add_to_following(target_user)
-        
-        self.api_call_with_retry(_follow)
+        user = self._get_user()
+        target_user = self.api_call_with_retry(self.client.get_user, username)
+        self.api_call_with_retry(user.add_to_following, target_user)
         self.logger.info(f"Successfully followed user: {username}")
     
+    def _get_user_repos(self, username: str) -> Union[PaginatedList, Iterator[Repository.Repository]]:
+        """
+        Get the unfetched repository listing of a user.
+        
+        Args:
+            username: Username to get repos for
+            
+        Returns:
+            The user's repositories, usually a PaginatedList
+        """
+        if username == self.username:
+            user = self._get_user()
+        else:
+            user = self.client.get_user(username)
+        return user.get_repos()
+    
+    def _list_user_repositories(self, username: str) -> List[Repository.Repository]:
+        """
+        Fetch all of a user's repositories, with pages requested concurrently.
+        
+        Args:
+            username: Username to get repos for
+            
+        Returns:
+            List of Repository objects
+        """
+        repos = self._get_user_repos(username)
+        if isinstance(repos, PaginatedList):
+            return self._fetch_all_pages(repos)
+        return list(repos)
+    
     def get_user_repositories(self, username: Optional[str] = None) -> List[Repository.Repository]:
         """
         Get repositories for a user.
         
+        Every page is fetched up front, concurrently. Use
+        iter_user_repositories() to stream them instead.
+        
         Args:
             username: Username to get repos for (None for authenticated user)
             
@@ -415,17 +794,43 @@ class GitHubClient:
         username = username or self.username
         self.logger.info(f"Fetching repositories for user: {username}")
         
-        def _get_repos():
-            if username == self.username:
-                user = self.client.get_user()
-            else:
-                user = self.client.get_user(username)
-            return list(user.get_repos())
-        
-        repos = self.api_call_with_retry(_get_repos)
+        repos = self.api_call_with_retry(self._list_user_repositories, username)
         self.logger.info(f"Found {len(repos)} repositories for user: {username}")
         return repos
     
+    def iter_user_repositories(self, username: Optional[str] = None) -> Iterator[Repository.Repository]:
+        """
+        Stream repositories for a user, one page at a time.
+        
+        Nothing is requested until the iterator is consumed, and each page
+        is only requested once the caller reaches it, with the same retry
+        logic as other API calls.
+        
+        Args:
+            username: Username to get repos for (None for authenticated user)
+            
+        Yields:
+            Repository objects
+            
+        Raises:
+            GithubException: If fetching a page fails
+        """
+        username = username or self.username
+        self.logger.info(f"Streaming repositories for user: {username}")
+        
+        repos = self.api_call_with_retry(self._get_user_repos, username)
+        if not isinstance(repos, PaginatedList):
+            yield from repos
+            return
+        
+        page = 0
+        while True:
+            items = self.api_call_with_retry(repos.get_page, page)
+            yield from items
+            if len(items) < self.client.per_page:
+                return
+            page += 1
+    
     def get_rate_limit_info(self) -> Dict[str, Any]:
         """
         Get current API rate limit information.
@@ -435,12 +840,13 @@ class GitHubClient:
         """
         rate_limit = self.client.get_rate_limit()
         core = rate_limit.core
+        now = time.time()
         
         return {
             'remaining': core.remaining,
             'limit': core.limit,
             'reset': core.reset.isoformat() if core.reset else None,
-            'reset_in_seconds': max(0, core.reset.timestamp() - time.time()) if core.reset else 0
+            'reset_in_seconds': max(0, core.reset.timestamp() - now) if core.reset else 0
         }
     
     def wait_for_rate_limit_reset(self) -> None:
@@ -5,39 +5,84 @@ Provides comprehensive logging with different levels, file rotation,
 and custom exception classes for structured error handling.
 """
 
+import inspect
 import logging
+import logging.handlers
 import os
+import re
 import sys
 from datetime import datetime
 from contextlib import contextmanager
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Union
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+
+# Argument names whose values must not be logged
+_SENSITIVE_KEY_RE = re.compile(r'token|password|secret|api_key|auth', re.IGNORECASE)
+
+# Common sensitive names, matched exactly before falling back to the regex
+_EXACT_SENSITIVE = frozenset({
+    'token', 'password', 'secret', 'api_key', 'auth', 'apikey',
+    'access_token', 'refresh_token'
+})
+
+# Fallback for positional args with unknown names: scan the string values
+_SENSITIVE_VALUE_RE = re.compile(r'token|password|secret|key|auth', re.IGNORECASE)
+
+
+def _slot_state(exc: BaseException) -> Dict[str, Any]:
+    """
+    Collect the __slots__ attributes of an exception for pickling.
+    
+    BaseException.__reduce__ only saves ``args`` and ``__dict__``, so values
+    kept in slots would otherwise be lost on a pickle round trip.
+    
+    Args:
+        exc: The exception instance
+        
+    Returns:
+        Mapping of slot name to value for every slot that is set
+    """
+    return {
+        name: getattr(exc, name)
+        for cls in type(exc).__mro__
+        for name in getattr(cls, '__slots__', ())
+        if hasattr(exc, name)
+    }
 
 
 class LoggerError(Exception):
     """Base exception for logger-related errors."""
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(Exception):
     """Raised when there are configuration-related errors."""
-    pass
+    __slots__ = ()
 
 
 class APIError(Exception):
     """Base exception for API-related errors."""
     
+    __slots__ = ('status_code', 'response_data')
+    
     def __init__(self, message: str, status_code: Optional[int] = None, 
                  response_data: Optional[Dict[str, Any]] = None):
         super().__init__(message)
         self.status_code = status_code
         self.response_data = response_data
+    
+    def __reduce__(self):
+        return type(self), self.args, _slot_state(self)
 
 
 class LoggerRateLimitError(APIError):
     """Raised when API rate limits are exceeded."""
     
+    __slots__ = ('reset_time',)
+    
     def __init__(self, message: str, reset_time: Optional[datetime] = None):
         super().__init__(message, status_code=429)
         self.reset_time = reset_time
@@ -46,6 +91,8 @@ class LoggerRateLimitError(APIError):
 class LoggerAuthenticationError(APIError):
     """Raised when authentication fails."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str):
         super().__init__(message, status_code=401)
 
@@ -53,9 +100,14 @@ class LoggerAuthenticationError(APIError):
 class ValidationError(Exception):
     """Raised when data validation fails."""
     
+    __slots__ = ('field',)
+    
     def __init__(self, message: str, field: Optional[str] = None):
         super().__init__(message)
         self.field = field
+    
+    def __reduce__(self):
+        return type(self), self.args, _slot_state(self)
 
 
 class AchievementLogger:
@@ -65,6 +117,7 @@ class AchievementLogger:
     Features:
     - Multiple log levels (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     - File logging with automatic rotation
+    - Buffered file writes, flushed in batches or on ERROR records
     - Console logging with formatted output
     - Thread-safe logging operations
     - Automatic log directory creation
@@ -72,6 +125,9 @@ class AchievementLogger:
     
     _instance = None
     
+    # Level wrappers rebound to the underlying logger's methods by __init__
+    _LEVEL_METHODS = ('debug', 'info', 'warning', 'error', 'critical')
+    
     def __new__(cls, *args, **kwargs):
         """Implement singleton pattern for logger."""
         if cls._instance is None:
@@ -81,7 +137,9 @@ class AchievementLogger:
     
     def __init__(self, log_level: str = 'INFO', log_dir: str = 'logs',
                  console_output: bool = True, file_output: bool = True,
-                 force_reinit: bool = False):
+                 force_reinit: bool = False, capacity: int = 1024,
+                 flush_level: int = logging.ERROR,
+                 max_bytes: int = 50 * 1024 * 1024, backup_count: int = 5):
         """
         Initialize the achievement logger.
         
@@ -91,6 +149,10 @@ class AchievementLogger:
             console_output: Whether to output logs to console
             file_output: Whether to output logs to file
             force_reinit: Force re-initialization (mainly for testing)
+            capacity: Number of file log records buffered before a write
+            flush_level: Records at or above this level are written immediately
+            max_bytes: Size at which the log file is rotated
+            backup_count: Number of rotated log files to keep
             
         Raises:
             LoggerError: If logger initialization fails
@@ -101,13 +163,22 @@ class AchievementLogger:
         try:
             self.log_level = log_level.upper()
             self.log_dir = Path(log_dir)
+            self.capacity = capacity
+            self.flush_level = flush_level
+            self.max_bytes = max_bytes
+            self.backup_count = backup_count
             self.logger = logging.getLogger('github_achievement_hunter')
             
             # Set log level
             numeric_level = getattr(logging, self.log_level, logging.INFO)
             self.logger.setLevel(numeric_level)
             
-            # Remove existing handlers to avoid duplicates
+            # Remove existing handlers to avoid duplicates, writing out
+            # anything still buffered
+            for handler in self.logger.handlers:
+                handler.close()
+                if isinstance(handler, logging.handlers.MemoryHandler) and handler.target:
+                    handler.target.close()
             self.logger.handlers.clear()
             
             # Create log directory if needed
@@ -118,6 +189,11 @@ class AchievementLogger:
             # Setup console handler
             if console_output:
                 self._setup_console_handler()
+            
+            # Route the level wrappers straight to the logger's own methods,
+            # which already check isEnabledFor, saving a call per message
+            for level in self._LEVEL_METHODS:
+                setattr(self, level, getattr(self.logger, level))
                 
             self._initialized = True
             self.logger.info(f"Logger initialized with level: {self.log_level}")
@@ -126,17 +202,36 @@ class AchievementLogger:
             raise LoggerError(f"Failed to initialize logger: {str(e)}")
     
     def _setup_file_handler(self) -> None:
-        """Set up file handler with rotation."""
+        """
+        Set up a rotating file handler behind an in-memory buffer.
+        
+        Records are held until ``capacity`` accumulate or one at
+        ``flush_level`` or above arrives, then written in one batch.
+        Buffered records are written out by flush() and at interpreter
+        exit via logging.shutdown().
+        """
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         log_file = self.log_dir / f'achievement_hunter_{timestamp}.log'
         
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=self.max_bytes,
+            backupCount=self.backup_count,
+            encoding='utf-8'
+        )
         file_formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(lineno)d - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+        
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=self.capacity,
+            flushLevel=self.flush_level,
+            target=file_handler,
+            flushOnClose=True
+        )
+        self.logger.addHandler(buffered_handler)
     
     def _setup_console_handler(self) -> None:
         """Set up console handler with colored output."""
@@ -158,25 +253,38 @@ class AchievementLogger:
         """
         return self.logger
     
-    def debug(self, message: str, **kwargs) -> None:
+    def flush(self) -> None:
+        """Write any buffered log records to their destinations."""
+        for handler in self.logger.handlers:
+            handler.flush()
+    
+    # Pass values as ``args`` with a %-style message so they are only
+    # formatted when the record is actually emitted. Once initialized, these
+    # are shadowed by the logger's bound methods set up in __init__.
+    def debug(self, message: str, *args, **kwargs) -> None:
         """Log a debug message."""
-        self.logger.debug(message, **kwargs)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(message, *args, **kwargs)
     
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args, **kwargs) -> None:
         """Log an info message."""
-        self.logger.info(message, **kwargs)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(message, *args, **kwargs)
     
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args, **kwargs) -> None:
         """Log a warning message."""
-        self.logger.warning(message, **kwargs)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(message, *args, **kwargs)
     
-    def error(self, message: str, exc_info: bool = False, **kwargs) -> None:
+    def error(self, message: str, *args, exc_info: bool = False, **kwargs) -> None:
         """Log an error message."""
-        self.logger.error(message, exc_info=exc_info, **kwargs)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(message, *args, exc_info=exc_info, **kwargs)
     
-    def critical(self, message: str, exc_info: bool = False, **kwargs) -> None:
+    def critical(self, message: str, *args, exc_info: bool = False, **kwargs) -> None:
         """Log a critical message."""
-        self.logger.critical(message, exc_info=exc_info, **kwargs)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger.critical(message, *args, exc_info=exc_info, **kwargs)
 
 
 # Context managers for error handling
@@ -197,16 +305,16 @@ def log_context(operation: str, logger: Optional[AchievementLogger] = None):
             # perform operation
     """
     if logger is None:
-        logger = AchievementLogger()
+        logger = get_default_logger()
     
-    logger.info(f"Starting: {operation}")
+    logger.info("Starting: %s", operation)
     try:
         yield
     except Exception as e:
-        logger.error(f"Error in {operation}: {str(e)}", exc_info=True)
+        logger.error("Error in %s: %s", operation, e, exc_info=True)
         raise
     else:
-        logger.info(f"Completed: {operation}")
+        logger.info("Completed: %s", operation)
 
 
 @contextmanager
@@ -229,7 +337,7 @@ def suppress_and_log(exception_types: tuple = (Exception,),
             # risky operation
     """
     if logger is None:
-        logger = AchievementLogger()
+        logger = get_default_logger()
     
     try:
         yield
@@ -258,42 +366,40 @@ def log_errors(logger: Optional[AchievementLogger] = None,
             return x / y
     """
     def decorator(func: Callable) -> Callable:
+        # Work out once which positional parameters hold sensitive values,
+        # so the error path only has to apply the mask
+        try:
+            try:
+                param_names = _parameter_names(func)
+            except TypeError:
+                # Unhashable callables can't be memoized
+                param_names = tuple(inspect.signature(func).parameters)
+            sensitive_mask = tuple(_is_sensitive_key(name) for name in param_names)
+        except (TypeError, ValueError):
+            # No introspectable signature (e.g. some builtins)
+            sensitive_mask = None
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if logger is None:
-                _logger = AchievementLogger()
-            else:
-                _logger = logger
-                
             try:
                 return func(*args, **kwargs)
             except Exception as e:
+                # The logger is only needed on the error path
+                _logger = logger if logger is not None else get_default_logger()
                 error_msg = f"Error in {func.__name__}: {str(e)}"
                 
                 if log_args and (args or kwargs):
-                    # Get parameter names from function signature
-                    import inspect
-                    try:
-                        sig = inspect.signature(func)
-                        param_names = list(sig.parameters.keys())
-                        
-                        # Create a dict mapping param names to values for better sanitization
-                        args_dict = {}
-                        for i, (param_name, arg_value) in enumerate(zip(param_names, args)):
-                            args_dict[param_name] = arg_value
-                        
+                    if sensitive_mask is not None:
                         # Sanitize based on parameter names
-                        safe_args_dict = _sanitize_kwargs(args_dict)
-                        safe_kwargs = _sanitize_kwargs(kwargs)
-                        
-                        # Format for display
-                        safe_args = tuple(safe_args_dict.values()) if safe_args_dict else args
-                        error_msg += f" | Args: {safe_args}, Kwargs: {safe_kwargs}"
-                    except:
-                        # Fallback to simple sanitization
+                        safe_args = tuple(
+                            '***' if sensitive else arg
+                            for arg, sensitive in zip(args, sensitive_mask)
+                        ) if sensitive_mask else args
+                    else:
+                        # Fallback to value-based sanitization
                         safe_args = _sanitize_args(args)
-                        safe_kwargs = _sanitize_kwargs(kwargs)
-                        error_msg += f" | Args: {safe_args}, Kwargs: {safe_kwargs}"
+                    safe_kwargs = _sanitize_kwargs(kwargs)
+                    error_msg += f" | Args: {safe_args}, Kwargs: {safe_kwargs}"
                 
                 _logger.error(error_msg, exc_info=True)
                 
@@ -321,24 +427,24 @@ def log_execution_time(logger: Optional[AchievementLogger] = None,
         def slow_function():
             time.sleep(1)
     """
-    import time
-    
     def decorator(func: Callable) -> Callable:
+        # Bound log method, resolved on the first call rather than at
+        # decoration time so the default logger is still created lazily
+        log_method = None
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if logger is None:
-                _logger = AchievementLogger()
-            else:
-                _logger = logger
-                
-            start_time = time.time()
+            nonlocal log_method
+            start_time = perf_counter()
             try:
                 result = func(*args, **kwargs)
                 return result
             finally:
-                elapsed = time.time() - start_time
-                log_method = getattr(_logger, level.lower(), _logger.info)
-                log_method(f"{func.__name__} took {elapsed:.3f} seconds")
+                elapsed = perf_counter() - start_time
+                if log_method is None:
+                    _logger = logger if logger is not None else get_default_logger()
+                    log_method = getattr(_logger, level.lower(), _logger.info)
+                log_method("%s took %.3f seconds", func.__name__, elapsed)
                 
         return wrapper
     return decorator
@@ -354,19 +460,45 @@ def _sanitize_args(args: tuple) -> tuple:
     Returns:
         Sanitized arguments
     """
-    # For positional args, we don't know the parameter names,
-    # so we just check for common patterns in the values
-    sensitive_patterns = ['token', 'password', 'secret', 'key', 'auth']
-    
-    def is_sensitive(arg):
-        arg_str = str(arg).lower()
-        return any(pattern in arg_str for pattern in sensitive_patterns)
-    
+    # For positional args, we don't know the parameter names, so we check
+    # string values for common patterns; other values pass through as-is
     return tuple(
-        '***' if is_sensitive(arg) else arg for arg in args
+        '***' if isinstance(arg, str) and _SENSITIVE_VALUE_RE.search(arg) else arg
+        for arg in args
     )
 
 
+@lru_cache(maxsize=1024)
+def _parameter_names(func: Callable) -> Tuple[str, ...]:
+    """
+    Get the parameter names of a callable, memoized across decorations.
+    
+    Args:
+        func: The callable to introspect
+        
+    Returns:
+        Parameter names in declaration order
+        
+    Raises:
+        TypeError: If the callable is unhashable or not supported by inspect
+        ValueError: If no signature can be found
+    """
+    return tuple(inspect.signature(func).parameters)
+
+
+def _is_sensitive_key(key: str) -> bool:
+    """
+    Check whether an argument name suggests it holds sensitive data.
+    
+    Args:
+        key: Parameter or keyword argument name
+        
+    Returns:
+        True if the value should be redacted
+    """
+    return key.lower() in _EXACT_SENSITIVE or _SENSITIVE_KEY_RE.search(key) is not None
+
+
 def _sanitize_kwargs(kwargs: dict) -> dict:
     """
     Sanitize function keyword arguments to avoid logging sensitive data.
@@ -377,15 +509,35 @@ def _sanitize_kwargs(kwargs: dict) -> dict:
     Returns:
         Sanitized keyword arguments
     """
-    sensitive_keys = {'token', 'password', 'secret', 'api_key', 'auth'}
     return {
-        k: '***' if any(sensitive in k.lower() for sensitive in sensitive_keys) else v
+        k: '***' if _is_sensitive_key(k) else v
         for k, v in kwargs.items()
     }
 
 
-# Create default logger instance
-default_logger = AchievementLogger()
+# Default logger instance, created on first use so that importing this module
+# does not create the log directory or open a log file
+_default_logger: Optional[AchievementLogger] = None
+
+
+def get_default_logger() -> AchievementLogger:
+    """
+    Get the shared default logger, creating it on first use.
+    
+    Returns:
+        The default AchievementLogger instance
+    """
+    global _default_logger
+    if _default_logger is None:
+        _default_logger = AchievementLogger()
+    return _default_logger
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazy ``default_logger`` module attribute (PEP 562)."""
+    if name == 'default_logger':
+        return get_default_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -400,5 +552,6 @@ __all__ = [
     'suppress_and_log',
     'log_errors',
     'log_execution_time',
+    'get_default_logger',
     'default_logger'
 ]
\ No newline at end of file
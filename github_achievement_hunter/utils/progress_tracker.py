@@ -2,24 +2,104 @@
 Progress tracking system for GitHub Achievement Hunter.
 
 This module provides persistent progress tracking with atomic writes,
-backup functionality, and recovery from corruption.
+batched saves, backup functionality, and recovery from corruption.
 """
 
+import atexit
+import collections
+import errno
 import json
 import logging
 import os
 import shutil
-import tempfile
+import time
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Set
 
 from .logger import AchievementLogger, log_context, log_errors
 
+# Prefer orjson's C serializer when installed; fall back to the stdlib json module.
+# _dumps writes compact UTF-8 bytes for the state file; _dumps_pretty writes
+# sorted, 2-space indented bytes for exports meant to be read by people.
+try:
+    import orjson
+    
+    _dumps = orjson.dumps
+    
+    def _dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+    
+    def _dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, sort_keys=True).encode('utf-8')
+    
+    _loads = json.loads
+
 
 class ProgressError(Exception):
     """Raised when progress tracking operations fail."""
-    pass
+    __slots__ = ()
+
+
+# os.link errors meaning hard links cannot be used here, so fall back to copying
+_LINK_UNSUPPORTED = frozenset({
+    errno.EXDEV, errno.EPERM, errno.ENOSYS, errno.EMLINK, errno.EOPNOTSUPP
+})
+
+# fdatasync skips flushing metadata such as mtime; not available on every platform
+_datasync = getattr(os, 'fdatasync', os.fsync)
+
+# Trackers that may hold unsaved changes; weak so trackers can still be collected
+_LIVE_TRACKERS = weakref.WeakSet()
+
+
+def _flush_live_trackers() -> None:
+    """Save pending changes of every live tracker at interpreter exit."""
+    for tracker in list(_LIVE_TRACKERS):
+        try:
+            tracker.flush()
+        except ProgressError:
+            # Already logged by _save_progress; keep flushing the others
+            pass
+
+
+atexit.register(_flush_live_trackers)
+
+
+class _FrozenView(Mapping):
+    """Read-only live view of a dict whose nested dicts and lists are read-only too."""
+    __slots__ = ('_data',)
+    
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+    
+    def __getitem__(self, key: str) -> Any:
+        return _freeze(self._data[key])
+    
+    def __iter__(self):
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+
+def _freeze(value: Any) -> Any:
+    """Wrap dicts in read-only views and copy lists to tuples."""
+    if isinstance(value, dict):
+        return _FrozenView(value)
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 
 class ProgressTracker:
@@ -28,6 +108,9 @@ class ProgressTracker:
     
     Features:
     - Atomic writes to prevent corruption
+    - Batched saves: changes are written every FLUSH_THRESHOLD updates,
+      after FLUSH_INTERVAL seconds, on flush(), when the tracker is garbage
+      collected, or at interpreter exit
     - Automatic backups before updates
     - Recovery from corrupted files
     - Timestamp tracking for all updates
@@ -42,16 +125,34 @@ class ProgressTracker:
     # Maximum number of backups to keep
     MAX_BACKUPS = 5
     
+    # Save after this many unsaved updates...
+    FLUSH_THRESHOLD = 50
+    
+    # ...or on the first update this many seconds after the last save
+    FLUSH_INTERVAL = 30.0
+    
+    # Resolved directories already created by this process, shared by all trackers
+    _created_dirs: Set[Path] = set()
+    
     def __init__(self, progress_file: str = 'progress.json', 
-                 backup_dir: Optional[str] = None):
+                 backup_dir: Optional[str] = None,
+                 flush_threshold: Optional[int] = None,
+                 flush_interval: Optional[float] = None):
         """
         Initialize the progress tracker.
         
         Args:
             progress_file: Path to the progress file
             backup_dir: Directory for backups (defaults to .backups next to progress file)
+            flush_threshold: Unsaved updates before a save (defaults to FLUSH_THRESHOLD;
+                1 saves on every update)
+            flush_interval: Seconds after the last save before the next update
+                forces a save (defaults to FLUSH_INTERVAL)
         """
         self.progress_file = Path(progress_file)
+        self._tmp_path = self.progress_file.with_name(self.progress_file.name + '.tmp')
+        self.flush_threshold = flush_threshold or self.FLUSH_THRESHOLD
+        self.flush_interval = self.FLUSH_INTERVAL if flush_interval is None else flush_interval
         
         # Set backup directory
         if backup_dir:
@@ -60,18 +161,56 @@ class ProgressTracker:
             self.backup_dir = self.progress_file.parent / '.backups'
         
         # Create directories if needed
-        self.progress_file.parent.mkdir(parents=True, exist_ok=True)
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.progress_file.parent)
+        self._ensure_dir(self.backup_dir)
         
         # Initialize logger
         self.logger = AchievementLogger().get_logger()
         
+        # Existing backups, oldest first; kept in sync as backups are made
+        # so saves don't have to list and stat the backup directory
+        self._backup_queue = collections.deque(sorted(
+            self.backup_dir.glob('progress_*.json'),
+            key=lambda p: p.stat().st_mtime
+        ))
+        
         # Load existing progress or create default
         with log_context(f"Loading progress from {progress_file}", self.logger):
             self.progress = self._load_progress()
+        self._progress_view = _FrozenView(self.progress)
         self._last_save_time = None
         
-        self.logger.info(f"Initialized ProgressTracker with file: {self.progress_file}")
+        # Updates not yet written to disk, and when the last save happened
+        self._dirty_count = 0
+        self._last_flush = time.monotonic()
+        
+        # Timestamp of the latest update, reused as metadata.last_updated
+        self._pending_timestamp: Optional[str] = None
+        _LIVE_TRACKERS.add(self)
+        
+        self.logger.info("Initialized ProgressTracker with file: %s", self.progress_file)
+    
+    @classmethod
+    def _ensure_dir(cls, path: Path) -> None:
+        """
+        Create a directory unless this process has already done so.
+        
+        Paths are resolved first, so a later os.chdir() can't make a
+        relative path refer to a different, uncreated directory.
+        
+        Args:
+            path: Directory to create, including missing parents
+        """
+        path = path.resolve()
+        if path in cls._created_dirs:
+            return
+        path.mkdir(parents=True, exist_ok=True)
+        cls._created_dirs.add(path)
+    
+    @staticmethod
+    def _now_iso() -> str:
+        """Return the current UTC time as an ISO 8601 string."""
+        return datetime.now(timezone.utc).isoformat()
     
     def _default_progress(self) -> Dict[str, Any]:
         """
@@ -80,11 +219,12 @@ class ProgressTracker:
         Returns:
             Dictionary with default achievement progress
         """
+        now = self._now_iso()
         return {
             'metadata': {
                 'version': '1.0',
-                'created_at': datetime.now(timezone.utc).isoformat(),
-                'last_updated': datetime.now(timezone.utc).isoformat()
+                'created_at': now,
+                'last_updated': now
             },
             'achievements': {
                 'pull_shark': {
@@ -153,18 +293,18 @@ class ProgressTracker:
         
         try:
             # Try to load main file
-            with open(self.progress_file, 'r') as f:
+            with open(self.progress_file, 'rb') as f:
                 content = f.read()
                 if not content.strip():
                     self.logger.warning("Progress file is empty, using default")
                     return self._default_progress()
                 
-                progress = json.loads(content)
+                progress = _loads(content)
                 self.logger.info("Successfully loaded progress file")
                 return progress
                 
         except (json.JSONDecodeError, IOError) as e:
-            self.logger.error(f"Failed to load progress file: {e}")
+            self.logger.error("Failed to load progress file: %s", e)
             
             # Backup corrupted file first
             self._backup_corrupted_file()
@@ -185,28 +325,19 @@ class ProgressTracker:
         Returns:
             Recovered progress dictionary or None
         """
-        if not self.backup_dir.exists():
-            return None
-        
-        # Get all backup files sorted by modification time (newest first)
-        backups = sorted(
-            self.backup_dir.glob('progress_*.json'),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )
-        
-        for backup_file in backups:
+        # Try the newest backups first
+        for backup_file in reversed(self._backup_queue):
             try:
-                with open(backup_file, 'r') as f:
-                    progress = json.load(f)
-                self.logger.info(f"Successfully recovered from backup: {backup_file}")
+                with open(backup_file, 'rb') as f:
+                    progress = _loads(f.read())
+                self.logger.info("Successfully recovered from backup: %s", backup_file)
                 
                 # Restore the backup to main file
                 shutil.copy2(backup_file, self.progress_file)
                 return progress
                 
             except (json.JSONDecodeError, IOError) as e:
-                self.logger.warning(f"Backup file {backup_file} is corrupted: {e}")
+                self.logger.warning("Backup file %s is corrupted: %s", backup_file, e)
                 continue
         
         return None
@@ -218,12 +349,19 @@ class ProgressTracker:
             corrupted_path = self.backup_dir / f'corrupted_{timestamp}.json'
             try:
                 shutil.move(str(self.progress_file), str(corrupted_path))
-                self.logger.info(f"Moved corrupted file to: {corrupted_path}")
+                self.logger.info("Moved corrupted file to: %s", corrupted_path)
             except Exception as e:
-                self.logger.error(f"Failed to backup corrupted file: {e}")
+                self.logger.error("Failed to backup corrupted file: %s", e)
     
     def _create_backup(self) -> None:
-        """Create a backup of the current progress file."""
+        """
+        Create a backup of the current progress file.
+        
+        The backup is a hard link to the current file, so no data is copied.
+        This is a true snapshot because saves replace the progress file with
+        a new inode rather than writing into it. Where hard links are not
+        available (e.g. a backup_dir on another filesystem) the file is copied.
+        """
         if not self.progress_file.exists():
             return
         
@@ -231,115 +369,199 @@ class ProgressTracker:
         backup_path = self.backup_dir / f'progress_{timestamp}.json'
         
         try:
-            shutil.copy2(self.progress_file, backup_path)
-            self.logger.debug(f"Created backup: {backup_path}")
+            # A second save within the same second replaces that backup
+            backup_path.unlink(missing_ok=True)
+            try:
+                os.link(self.progress_file, backup_path)
+            except OSError as e:
+                if e.errno not in _LINK_UNSUPPORTED:
+                    raise
+                shutil.copy2(self.progress_file, backup_path)
+            self.logger.debug("Created backup: %s", backup_path)
+            
+            # A replaced same-second backup moves to the newest position
+            if backup_path in self._backup_queue:
+                self._backup_queue.remove(backup_path)
+            self._backup_queue.append(backup_path)
             
             # Clean old backups
             self._cleanup_old_backups()
             
         except Exception as e:
-            self.logger.error(f"Failed to create backup: {e}")
+            self.logger.error("Failed to create backup: %s", e)
     
     def _cleanup_old_backups(self) -> None:
         """Remove old backups keeping only the most recent ones."""
-        backups = sorted(
-            self.backup_dir.glob('progress_*.json'),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )
-        
         # Keep only MAX_BACKUPS
-        for backup in backups[self.MAX_BACKUPS:]:
+        while len(self._backup_queue) > self.MAX_BACKUPS:
+            backup = self._backup_queue.popleft()
             try:
                 backup.unlink()
-                self.logger.debug(f"Removed old backup: {backup}")
+                self.logger.debug("Removed old backup: %s", backup)
             except Exception as e:
-                self.logger.error(f"Failed to remove backup {backup}: {e}")
+                self.logger.error("Failed to remove backup %s: %s", backup, e)
     
     @log_errors(reraise=True)
-    def _save_progress(self) -> None:
+    def _save_progress(self, durable: bool = False) -> None:
         """
         Save progress to file atomically.
         
-        Uses atomic write to prevent corruption during save.
+        Uses atomic write to prevent corruption during save. The rename is
+        always atomic, so the file holds either the old or the new progress,
+        but unless ``durable`` is set the new contents may still be only in
+        the OS page cache. A power loss can then leave an older or empty
+        file, which _load_progress recovers from using the backups.
+        
+        Args:
+            durable: Whether to sync the data to disk before the rename
         
         Raises:
             ProgressError: If save operation fails
         """
-        # Update metadata
-        self.progress['metadata']['last_updated'] = datetime.now(timezone.utc).isoformat()
+        # Update metadata, reusing the latest update's timestamp if it has one
+        self.progress['metadata']['last_updated'] = self._pending_timestamp or self._now_iso()
         
         # Create backup before saving
         if self.progress_file.exists():
             self._create_backup()
         
-        # Atomic write using temporary file
+        # Atomic write using a temporary file in the same directory, so the
+        # rename stays on one filesystem. The name is fixed because only one
+        # process writes a given progress file.
         try:
-            # Create temporary file in same directory (for atomic rename)
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                dir=self.progress_file.parent,
-                delete=False,
-                prefix='.tmp_',
-                suffix='.json'
-            ) as tmp_file:
-                json.dump(self.progress, tmp_file, indent=2, sort_keys=True)
-                tmp_file.flush()
-                os.fsync(tmp_file.fileno())  # Force write to disk
-                tmp_path = tmp_file.name
+            payload = memoryview(_dumps(self.progress))
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+            try:
+                fd = os.open(self._tmp_path, flags, 0o600)
+            except FileNotFoundError:
+                # The directory was removed after it was created; make it again
+                self._tmp_path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(self._tmp_path, flags, 0o600)
+            try:
+                while payload:
+                    payload = payload[os.write(fd, payload):]
+                if durable:
+                    _datasync(fd)  # Force write to disk
+            finally:
+                os.close(fd)
             
             # Atomic rename (on same filesystem)
-            os.replace(tmp_path, self.progress_file)
+            os.replace(self._tmp_path, self.progress_file)
             
             self._last_save_time = datetime.now(timezone.utc)
+            self._dirty_count = 0
+            self._last_flush = time.monotonic()
+            self._pending_timestamp = None
             self.logger.debug("Successfully saved progress")
             
         except Exception as e:
-            self.logger.error(f"Failed to save progress: {e}")
+            self.logger.error("Failed to save progress: %s", e)
             # Clean up temporary file if it exists
-            if 'tmp_path' in locals() and os.path.exists(tmp_path):
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
+            try:
+                os.unlink(self._tmp_path)
+            except OSError:
+                pass
             raise ProgressError(f"Failed to save progress: {e}")
     
+    def _mark_dirty(self, timestamp: Optional[str] = None) -> None:
+        """
+        Record an unsaved update and save if the batch is due.
+        
+        Args:
+            timestamp: ISO timestamp already taken for this update, if any
+        
+        Raises:
+            ProgressError: If a due save fails
+        """
+        self._pending_timestamp = timestamp
+        self._dirty_count += 1
+        if (self._dirty_count >= self.flush_threshold
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self._save_progress()
+    
+    @staticmethod
+    def _is_noop_update(current: Dict[str, Any], data: Dict[str, Any]) -> bool:
+        """
+        Check whether merging data into current would change nothing.
+        
+        Args:
+            current: Stored progress section
+            data: Data that would be merged into it
+            
+        Returns:
+            True if every key in data is already stored with an equal value
+        """
+        return all(key in current and current[key] == value for key, value in data.items())
+    
+    def flush(self) -> None:
+        """
+        Write any unsaved updates to disk now, synced for durability.
+        
+        Raises:
+            ProgressError: If the save fails
+        """
+        if self._dirty_count:
+            self._save_progress(durable=True)
+    
+    def __del__(self) -> None:
+        """Save pending changes when the tracker is garbage collected."""
+        # getattr: __init__ may have failed before the counter was set
+        if getattr(self, '_dirty_count', 0):
+            try:
+                self._save_progress(durable=True)
+            except Exception:
+                # Already logged by _save_progress; nothing can be raised here
+                pass
+    
     def update_achievement(self, achievement: str, data: Dict[str, Any]) -> None:
         """
         Update progress for a specific achievement.
         
+        Updates that would not change any stored value are skipped, so
+        neither last_updated nor the file is touched.
+        
         Args:
             achievement: Achievement name
             data: Data to update (merged with existing)
             
         Raises:
             KeyError: If achievement doesn't exist
-            ProgressError: If save fails
+            ProgressError: If a due save fails
         """
         if achievement not in self.progress['achievements']:
             raise KeyError(f"Unknown achievement: {achievement}")
         
+        current = self.progress['achievements'][achievement]
+        if self._is_noop_update(current, data):
+            self.logger.debug("No-op update for %s", achievement)
+            return
+        
         # Update achievement data
-        self.progress['achievements'][achievement].update(data)
-        self.progress['achievements'][achievement]['last_updated'] = \
-            datetime.now(timezone.utc).isoformat()
+        now = self._now_iso()
+        current.update(data)
+        current['last_updated'] = now
         
-        # Save immediately
-        self._save_progress()
+        self._mark_dirty(now)
         
-        self.logger.info(f"Updated achievement '{achievement}': {data}")
+        self.logger.info("Updated achievement '%s': %s", achievement, data)
     
     def update_repository(self, repo_data: Dict[str, Any]) -> None:
         """
         Update repository information.
         
+        Updates that would not change any stored value are skipped.
+        
         Args:
             repo_data: Repository data to update
         """
+        if self._is_noop_update(self.progress['repository'], repo_data):
+            self.logger.debug("No-op update for repository")
+            return
+        
         self.progress['repository'].update(repo_data)
-        self._save_progress()
+        self._mark_dirty()
         
-        self.logger.info(f"Updated repository: {repo_data}")
+        self.logger.info("Updated repository: %s", repo_data)
     
     def increment_statistic(self, stat: str, amount: int = 1) -> None:
         """
@@ -351,17 +573,20 @@ class ProgressTracker:
         """
         if stat in self.progress['statistics']:
             self.progress['statistics'][stat] += amount
-            self._save_progress()
+            self._mark_dirty()
     
-    def get_achievement_progress(self, achievement: str) -> Dict[str, Any]:
+    def get_achievement_progress(self, achievement: str) -> Mapping[str, Any]:
         """
         Get progress for a specific achievement.
         
+        The result is a read-only live view rather than a copy; changes
+        must go through update_achievement().
+        
         Args:
             achievement: Achievement name
             
         Returns:
-            Achievement progress data
+            Read-only view of the achievement progress data
             
         Raises:
             KeyError: If achievement doesn't exist
@@ -369,16 +594,19 @@ class ProgressTracker:
         if achievement not in self.progress['achievements']:
             raise KeyError(f"Unknown achievement: {achievement}")
         
-        return self.progress['achievements'][achievement].copy()
+        return MappingProxyType(self.progress['achievements'][achievement])
     
-    def get_all_progress(self) -> Dict[str, Any]:
+    def get_all_progress(self) -> Mapping[str, Any]:
         """
         Get complete progress data.
         
+        Nested sections are read-only as well, so every change has to go
+        through the update methods.
+        
         Returns:
-            Copy of all progress data
+            Read-only live view of all progress data
         """
-        return self.progress.copy()
+        return self._progress_view
     
     def is_achievement_completed(self, achievement: str) -> bool:
         """
@@ -417,12 +645,14 @@ class ProgressTracker:
         if not confirm:
             raise ValueError("Must confirm=True to reset progress")
         
-        # Create backup before reset
+        # Back up the latest state, including unsaved updates, before reset
+        self.flush()
         self._create_backup()
         
         # Reset to default
         self.progress = self._default_progress()
-        self._save_progress()
+        self._progress_view = _FrozenView(self.progress)
+        self._save_progress(durable=True)
         
         self.logger.warning("Progress has been reset to default state")
     
@@ -433,10 +663,13 @@ class ProgressTracker:
         Args:
             export_path: Path to export progress to
         """
-        with open(export_path, 'w') as f:
-            json.dump(self.progress, f, indent=2, sort_keys=True)
+        # Persist pending updates too, so the export is never ahead of the file
+        self.flush()
+        
+        with open(export_path, 'wb') as f:
+            f.write(_dumps_pretty(self.progress))
         
-        self.logger.info(f"Exported progress to: {export_path}")
+        self.logger.info("Exported progress to: %s", export_path)
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -446,7 +679,10 @@ class ProgressTracker:
             Summary dictionary with key statistics
         """
         achievements = self.progress['achievements']
-        completed = self.get_completed_achievements()
+        completed = [
+            name for name, data in achievements.items()
+            if data.get('completed', False)
+        ]
         
         summary = {
             'total_achievements': len(achievements),
@@ -456,7 +692,7 @@ class ProgressTracker:
             'repository_created': self.progress['repository']['created'],
             'repository_name': self.progress['repository']['name'],
             'last_updated': self.progress['metadata']['last_updated'],
-            'statistics': self.progress['statistics'].copy()
+            'statistics': dict(self.progress['statistics'])
         }
         
         return summary
\ No newline at end of file
@@ -5,15 +5,21 @@ This module provides intelligent rate limiting with sliding window tracking,
 burst prevention, exponential backoff, and predictive rate limiting.
 """
 
+import asyncio
+import bisect
 import logging
+import random
+import re
+import threading
 import time
-from collections import deque
+import uuid
 from datetime import datetime, timezone
-from functools import wraps
-from typing import Callable, Dict, Any, Optional, TypeVar, Tuple
+from functools import partial, wraps
+from typing import Callable, Dict, Any, List, Mapping, Optional, TypeVar, Tuple
 
 from github import Github, GithubException
 from github.GithubException import RateLimitExceededException
+from github.GithubObject import GithubObject
 
 from .logger import AchievementLogger, log_context, log_errors, log_execution_time
 
@@ -35,25 +41,46 @@ class RateLimiter:
     - Burst prevention mechanisms
     - Exponential backoff for rate limit errors
     - Predictive rate limiting based on usage patterns
-    - Per-endpoint rate limit tracking
+    - Per-endpoint token buckets, corrected by GitHub's response headers
+    - Cap on concurrent in-flight requests
+    - Optional burst window shared between processes through Redis
     
     Attributes:
         client: GitHub client instance
         buffer: Safety buffer for rate limits
-        request_times: Deque of recent request timestamps
-        endpoint_usage: Track usage per API endpoint
+        request_times: Recent request times, oldest first; at least the last
+            WINDOW_SIZE of them, and fewer than twice that
+        endpoint_requests: Per endpoint category, [request_count, first_request_time]
+        _buckets: Token bucket per endpoint category used for the wait time
         backoff_state: Current backoff state for retries
+        redis_client: Optional Redis client holding the shared burst window
     """
     
     # Default configuration
     DEFAULT_BUFFER = 100
     WINDOW_SIZE = 1000  # Track last 1000 requests
     BURST_THRESHOLD = 30  # Max requests per minute
+    DEFAULT_MAX_CONCURRENT = 10  # Max in-flight requests through with_rate_limit
+    WAIT_CACHE_TTL = 0.1  # Seconds a computed wait time is reused
+    USAGE_STATS_TTL = 1.0  # Seconds get_usage_stats results are reused
+    RESPONSE_CACHE_TTL = 60.0  # Default lifetime of cached responses
+    RESPONSE_CACHE_MAX_SIZE = 1024  # Max cached responses before eviction
+    THROTTLE_REQUESTS_PER_HOUR = 4000  # Predicted hourly rate that triggers throttling (80% of 5000)
+    
+    # Sorted set of request times shared by every limiter on one Redis
+    REDIS_TIMES_KEY = 'ratelim:times'
+    
+    # How long fetched GitHub rate limits are trusted, normally and while
+    # recovering from a rate limit error
+    RATE_CHECK_INTERVAL = 300.0
+    RATE_CHECK_INTERVAL_AFTER_ERROR = 5.0
     
     # Exponential backoff configuration
     INITIAL_BACKOFF = 1.0  # seconds
     MAX_BACKOFF = 300.0  # 5 minutes
     BACKOFF_MULTIPLIER = 2.0
+    JITTER_RANGE = 0.4  # Maximum jitter added, as a fraction of the backoff
+    CIRCUIT_BREAKER_THRESHOLD = 2  # Consecutive failures before all calls hold off
     
     # GitHub API endpoint categories with different limits
     ENDPOINT_CATEGORIES = {
@@ -63,33 +90,87 @@ class RateLimiter:
         'integration_manifest': {'limit': 5000, 'window': 3600}
     }
     
-    def __init__(self, client: Github, buffer: int = DEFAULT_BUFFER):
+    # URL fragments of non-core endpoints; the matching group's number
+    # indexes _CATEGORY_NAMES
+    _CATEGORY_RE = re.compile(r'(/search/)|(/graphql)|(/app-manifests/)')
+    _CATEGORY_NAMES = (None, 'search', 'graphql', 'integration_manifest')
+    
+    def __init__(self, client: Github, buffer: int = DEFAULT_BUFFER,
+                 max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+                 redis_client: Optional[Any] = None):
         """
         Initialize the rate limiter.
         
         Args:
             client: GitHub client instance
             buffer: Safety buffer for rate limits
+            max_concurrent: Maximum number of calls wrapped by with_rate_limit
+                that may be in flight at once
+            redis_client: Optional redis-py compatible client. When given, the
+                burst window is kept in Redis so limiters in several processes
+                share one burst budget
         """
         self.client = client
         self.buffer = buffer
-        self.request_times = deque(maxlen=self.WINDOW_SIZE)
-        self.endpoint_usage: Dict[str, deque] = {
-            endpoint: deque(maxlen=1000) 
+        self.redis_client = redis_client
+        self.max_concurrent = max_concurrent
+        self._concurrency = threading.BoundedSemaphore(max_concurrent)
+        
+        # Shared wait: end time of the current sleep, and the event set
+        # when it ends, for threads that join it
+        self._sleep_lock = threading.Lock()
+        self._sleep_until = 0.0
+        self._sleep_event = threading.Event()
+        
+        # Internal timestamps come from time.monotonic() so clock adjustments
+        # cannot skew the windows; only GitHub's reset times use time.time()
+        # request_times is a plain list: bisect and indexing are faster on
+        # contiguous storage than on a deque
+        self.request_times: List[float] = []
+        self.endpoint_requests: Dict[str, List[float]] = {
+            endpoint: [0, 0.0]
             for endpoint in self.ENDPOINT_CATEGORIES
         }
+        
+        # Token bucket per endpoint category as [tokens, last_refill_time];
+        # each starts full and refills at limit / window tokens per second.
+        # _bucket_rates holds (capacity, tokens_per_second) for each bucket.
+        now = time.monotonic()
+        self._buckets: Dict[str, List[float]] = {
+            endpoint: [float(config['limit']), now]
+            for endpoint, config in self.ENDPOINT_CATEGORIES.items()
+        }
+        self._bucket_rates: Dict[str, Tuple[float, float]] = {
+            endpoint: (float(config['limit']), config['limit'] / config['window'])
+            for endpoint, config in self.ENDPOINT_CATEGORIES.items()
+        }
         self.backoff_state = {
             'consecutive_failures': 0,
             'last_failure_time': 0,
             'current_backoff': self.INITIAL_BACKOFF
         }
-        self._last_rate_check = 0
+        self._random = random.random  # Bound once for the backoff jitter
+        self._last_rate_check = float('-inf')
+        self._rate_check_interval = self.RATE_CHECK_INTERVAL
         self._cached_limits: Dict[str, Any] = {}
         
+        # (expires_at, endpoint_category, wait_time) of the last wait computation
+        self._wait_cache: Tuple[float, str, float] = (0.0, '', 0.0)
+        
+        # (expires_at, stats) of the last get_usage_stats result; cleared
+        # whenever tracked requests or backoff state change
+        self._usage_stats_cache: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+        
+        # Concurrency cap for with_rate_limit_async, created inside the event loop
+        self._async_concurrency: Optional[asyncio.Semaphore] = None
+        
+        # Results of cacheable calls as cache key -> (expires_at, result)
+        self._response_cache: Dict[str, Tuple[float, Any]] = {}
+        
         # Initialize logger
         self.logger = AchievementLogger().get_logger()
         
-        self.logger.info(f"Initialized RateLimiter with buffer: {buffer}")
+        self.logger.info("Initialized RateLimiter with buffer: %s", buffer)
     
     def _categorize_endpoint(self, url: Optional[str] = None) -> str:
         """
@@ -104,14 +185,8 @@ class RateLimiter:
         if not url:
             return 'core'
         
-        if '/search/' in url:
-            return 'search'
-        elif '/graphql' in url:
-            return 'graphql'
-        elif '/app-manifests/' in url:
-            return 'integration_manifest'
-        else:
-            return 'core'
+        match = self._CATEGORY_RE.search(url)
+        return self._CATEGORY_NAMES[match.lastindex] if match else 'core'
     
     @log_errors(reraise=False)
     def _get_current_limits(self, force_check: bool = False) -> Dict[str, Any]:
@@ -124,32 +199,31 @@ class RateLimiter:
         Returns:
             Dictionary with rate limit info for each category
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Use cached limits if recent
-        if not force_check and (current_time - self._last_rate_check) < 60:
+        if not force_check and (current_time - self._last_rate_check) < self._rate_check_interval:
             return self._cached_limits
         
         try:
+            # One request returns every resource; keep all that we categorize
             rate_limit = self.client.get_rate_limit()
-            self._cached_limits = {
-                'core': {
-                    'remaining': rate_limit.core.remaining,
-                    'limit': rate_limit.core.limit,
-                    'reset': rate_limit.core.reset
-                },
-                'search': {
-                    'remaining': rate_limit.search.remaining,
-                    'limit': rate_limit.search.limit,
-                    'reset': rate_limit.search.reset
-                }
-            }
+            limits = {}
+            for category in self.ENDPOINT_CATEGORIES:
+                resource = getattr(rate_limit, category, None)
+                if resource is not None:
+                    limits[category] = {
+                        'remaining': resource.remaining,
+                        'limit': resource.limit,
+                        'reset': resource.reset
+                    }
+            self._cached_limits = limits
             self._last_rate_check = current_time
             
             return self._cached_limits
             
         except Exception as e:
-            self.logger.error(f"Failed to get rate limits: {e}")
+            self.logger.error("Failed to get rate limits: %s", e)
             # Return conservative defaults
             return {
                 'core': {'remaining': 100, 'limit': 5000, 'reset': None},
@@ -163,14 +237,92 @@ class RateLimiter:
         Args:
             endpoint_category: Category of the endpoint
         """
-        current_time = time.time()
+        current_time = time.monotonic()
+        self._usage_stats_cache = (0.0, None)
+        
+        # Track in global window; requests beyond WINDOW_SIZE are dropped in
+        # one go once the list doubles, so trimming is amortized O(1)
+        request_times = self.request_times
+        request_times.append(current_time)
+        if len(request_times) >= 2 * self.WINDOW_SIZE:
+            del request_times[:-self.WINDOW_SIZE]
+        
+        # Count per endpoint; GitHub's response headers and the token bucket
+        # cover the limits, so no per-endpoint history is kept
+        if endpoint_category in self.endpoint_requests:
+            counter = self.endpoint_requests[endpoint_category]
+            if not counter[0]:
+                counter[1] = current_time
+            counter[0] += 1
+        
+        # Spend a token from the endpoint's bucket
+        if endpoint_category in self._buckets:
+            self._refill_bucket(endpoint_category, current_time)[0] -= 1
+        
+        if self.redis_client is not None:
+            self._track_shared_request()
+    
+    def _track_shared_request(self) -> None:
+        """
+        Record a request in the burst window shared through Redis.
         
-        # Track in global window
-        self.request_times.append(current_time)
+        Redis scores are wall clock times, since monotonic clocks are not
+        comparable between processes. Entries older than the burst window
+        are trimmed on the way.
+        """
+        now = time.time()
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.zadd(self.REDIS_TIMES_KEY, {f'{now}:{uuid.uuid4().hex}': now})
+            pipe.zremrangebyscore(self.REDIS_TIMES_KEY, '-inf', now - 60)
+            pipe.expire(self.REDIS_TIMES_KEY, 60)
+            pipe.execute()
+        except Exception as e:
+            self.logger.warning("Failed to record request in Redis: %s", e)
+    
+    def _shared_burst_window(self) -> Optional[Tuple[int, float]]:
+        """
+        Read the burst window shared through Redis.
+        
+        Returns:
+            Tuple of (requests in the last minute, seconds since the
+            BURST_THRESHOLD-th most recent of them), or None if Redis is
+            not configured or unavailable
+        """
+        if self.redis_client is None:
+            return None
         
-        # Track per endpoint
-        if endpoint_category in self.endpoint_usage:
-            self.endpoint_usage[endpoint_category].append(current_time)
+        now = time.time()
+        try:
+            recent_requests = self.redis_client.zcount(self.REDIS_TIMES_KEY, now - 60, '+inf')
+            oldest_recent = self.redis_client.zrange(
+                self.REDIS_TIMES_KEY, -self.BURST_THRESHOLD, -self.BURST_THRESHOLD, withscores=True
+            )
+        except Exception as e:
+            self.logger.warning("Failed to read burst window from Redis: %s", e)
+            return None
+        
+        age = now - oldest_recent[0][1] if oldest_recent else 0.0
+        return recent_requests, age
+    
+    def _refill_bucket(self, endpoint_category: str, current_time: float) -> List[float]:
+        """
+        Add the tokens earned since the last refill to an endpoint's bucket.
+        
+        Args:
+            endpoint_category: Category of the endpoint
+            current_time: Current timestamp
+            
+        Returns:
+            The refilled [tokens, last_refill_time] bucket
+        """
+        capacity, rate = self._bucket_rates[endpoint_category]
+        bucket = self._buckets[endpoint_category]
+        elapsed = current_time - bucket[1]
+        if elapsed > 0:
+            bucket[0] = min(capacity, bucket[0] + elapsed * rate)
+            bucket[1] = current_time
+        return bucket
     
     def _check_burst_limit(self) -> bool:
         """
@@ -179,17 +331,31 @@ class RateLimiter:
         Returns:
             True if within limits, False if burst detected
         """
-        if not self.request_times:
-            return True
-        
-        current_time = time.time()
-        one_minute_ago = current_time - 60
+        return self._within_burst_limit(self._shared_burst_window())
+    
+    def _within_burst_limit(self, shared: Optional[Tuple[int, float]]) -> bool:
+        """
+        Check a burst window against the burst threshold.
         
-        # Count requests in last minute
-        recent_requests = sum(1 for t in self.request_times if t > one_minute_ago)
+        Args:
+            shared: Burst window read from Redis, or None to use the
+                local request times
+            
+        Returns:
+            True if within limits, False if burst detected
+        """
+        if shared is not None:
+            recent_requests = shared[0]
+        elif not self.request_times:
+            return True
+        else:
+            # Count requests in last minute; request_times is in time order,
+            # so everything after the bisection point is recent
+            one_minute_ago = time.monotonic() - 60
+            recent_requests = len(self.request_times) - bisect.bisect_right(self.request_times, one_minute_ago)
         
         if recent_requests >= self.BURST_THRESHOLD:
-            self.logger.warning(f"Burst limit approaching: {recent_requests} requests in last minute")
+            self.logger.warning("Burst limit approaching: %d requests in last minute", recent_requests)
             return False
         
         return True
@@ -214,62 +380,72 @@ class RateLimiter:
                     wait_time = limit_info['reset'].timestamp() - time.time() + 1
                     return max(0, wait_time)
         
-        # Check burst prevention
-        if not self._check_burst_limit():
+        # Check burst prevention; the shared window is read once so the
+        # count and the wait come from the same source
+        shared = self._shared_burst_window()
+        if not self._within_burst_limit(shared):
             # Wait until oldest request is outside burst window
-            if self.request_times:
+            if shared is not None:
+                return max(0, 60 - shared[1] + 1)
+            if len(self.request_times) >= self.BURST_THRESHOLD:
                 oldest_recent = self.request_times[-self.BURST_THRESHOLD]
-                wait_time = 60 - (time.time() - oldest_recent) + 1
+                wait_time = 60 - (time.monotonic() - oldest_recent) + 1
                 return max(0, wait_time)
         
-        # Check sliding window
-        endpoint_config = self.ENDPOINT_CATEGORIES.get(endpoint_category, self.ENDPOINT_CATEGORIES['core'])
-        endpoint_requests = self.endpoint_usage.get(endpoint_category, deque())
-        
-        if len(endpoint_requests) >= endpoint_config['limit']:
-            oldest_request = endpoint_requests[0]
-            window_start = time.time() - endpoint_config['window']
-            
-            if oldest_request > window_start:
-                wait_time = oldest_request + endpoint_config['window'] - time.time() + 1
-                return max(0, wait_time)
+        # Check the endpoint's token bucket; wait until a whole token is available
+        if endpoint_category in self._buckets:
+            tokens = self._refill_bucket(endpoint_category, time.monotonic())[0]
+            if tokens < 1:
+                return (1 - tokens) / self._bucket_rates[endpoint_category][1]
         
         return 0
     
-    def _predict_rate_limit(self) -> Tuple[bool, float]:
+    def _recent_average_interval(self, current_time: float) -> Optional[float]:
         """
-        Predict if we'll hit rate limits soon based on current patterns.
+        Average time between the requests of the last 5 minutes.
         
+        Args:
+            current_time: Current monotonic timestamp
+            
         Returns:
-            Tuple of (should_throttle, suggested_delay)
+            The average interval, or None if there is too little history
+            to predict from
         """
         if len(self.request_times) < 10:
-            return False, 0
+            return None
         
-        # Calculate request rate over last 5 minutes
-        current_time = time.time()
         five_minutes_ago = current_time - 300
-        recent_requests = [t for t in self.request_times if t > five_minutes_ago]
+        start = bisect.bisect_right(self.request_times, five_minutes_ago)
+        recent_count = len(self.request_times) - start
         
-        if len(recent_requests) < 2:
-            return False, 0
+        if recent_count < 2:
+            return None
         
-        # Calculate average time between requests
-        time_diffs = [recent_requests[i] - recent_requests[i-1] 
-                     for i in range(1, len(recent_requests))]
-        avg_interval = sum(time_diffs) / len(time_diffs) if time_diffs else 0
+        # The gaps between consecutive requests add up to the span from
+        # first to last
+        return (self.request_times[-1] - self.request_times[start]) / (recent_count - 1)
+    
+    def _predict_rate_limit(self) -> Tuple[bool, float]:
+        """
+        Predict if we'll hit rate limits soon based on current patterns.
+        
+        Returns:
+            Tuple of (should_throttle, suggested_delay)
+        """
+        # Calculate request rate over last 5 minutes
+        avg_interval = self._recent_average_interval(time.monotonic())
         
         # Predict requests in next hour at current rate
-        if avg_interval > 0:
+        if avg_interval is not None and avg_interval > 0:
             predicted_requests_per_hour = 3600 / avg_interval
             
             # If we're on track to exceed 80% of limit, throttle
-            if predicted_requests_per_hour > 4000:  # 80% of 5000
+            if predicted_requests_per_hour > self.THROTTLE_REQUESTS_PER_HOUR:
                 # Suggest delay to stay under 70% of limit
                 suggested_interval = 3600 / 3500  # ~1.03 seconds
                 suggested_delay = max(0, suggested_interval - avg_interval)
                 
-                self.logger.info(f"Predictive throttling: {predicted_requests_per_hour:.0f} req/hr predicted")
+                self.logger.info("Predictive throttling: %.0f req/hr predicted", predicted_requests_per_hour)
                 return True, suggested_delay
         
         return False, 0
@@ -283,6 +459,74 @@ class RateLimiter:
             endpoint_url: Optional API endpoint URL for categorization
         """
         endpoint_category = self._categorize_endpoint(endpoint_url)
+        wait_time = self._get_wait_time(endpoint_category)
+        
+        # Wait if necessary
+        if wait_time > 0:
+            self._wait(wait_time)
+        
+        # Track this request
+        self._track_request(endpoint_category)
+    
+    async def acheck_and_wait(self, endpoint_url: Optional[str] = None) -> None:
+        """
+        Check rate limits and wait if necessary, without blocking the event loop.
+        
+        Asyncio counterpart of check_and_wait. Computing the wait can fetch
+        the limits from GitHub and tracking can write to Redis, so both run
+        in a worker thread unless the fast path applies.
+        
+        Args:
+            endpoint_url: Optional API endpoint URL for categorization
+        """
+        endpoint_category = self._categorize_endpoint(endpoint_url)
+        if self._is_clearly_within_limits(endpoint_category, time.monotonic()):
+            wait_time = 0
+        else:
+            wait_time = await asyncio.to_thread(self._get_wait_time, endpoint_category)
+        
+        if wait_time > 0:
+            self.logger.warning("Rate limit approaching, waiting %.1fs", wait_time)
+            await asyncio.sleep(wait_time)
+        
+        if self.redis_client is not None:
+            await asyncio.to_thread(self._track_request, endpoint_category)
+        else:
+            self._track_request(endpoint_category)
+    
+    def _get_wait_time(self, endpoint_category: str) -> float:
+        """
+        Get how long to wait before a request, including predictive throttling.
+        
+        A wait time computed for the same category within the last
+        WAIT_CACHE_TTL seconds is reused; limits cannot meaningfully change
+        that fast. After CIRCUIT_BREAKER_THRESHOLD consecutive rate limit
+        errors, every caller waits out the current backoff instead of
+        sending requests that would fail too.
+        
+        Args:
+            endpoint_category: Category of the endpoint
+            
+        Returns:
+            Wait time in seconds
+        """
+        current_time = time.monotonic()
+        
+        # Fast path for the common case where no check could ask for a wait
+        if self._is_clearly_within_limits(endpoint_category, current_time):
+            return 0
+        
+        # Circuit breaker: hold off until the current backoff has passed
+        backoff_state = self.backoff_state
+        if backoff_state['consecutive_failures'] >= self.CIRCUIT_BREAKER_THRESHOLD:
+            circuit_wait = (backoff_state['last_failure_time'] + backoff_state['current_backoff']
+                            - current_time)
+            if circuit_wait > 0:
+                return circuit_wait
+        
+        expires_at, cached_category, wait_time = self._wait_cache
+        if current_time < expires_at and cached_category == endpoint_category:
+            return wait_time
         
         # Calculate wait time
         wait_time = self._calculate_wait_time(endpoint_category)
@@ -291,15 +535,82 @@ class RateLimiter:
         should_throttle, throttle_delay = self._predict_rate_limit()
         if should_throttle and throttle_delay > wait_time:
             wait_time = throttle_delay
-            self.logger.info(f"Predictive throttling: adding {throttle_delay:.1f}s delay")
+            self.logger.info("Predictive throttling: adding %.1fs delay", throttle_delay)
         
-        # Wait if necessary
-        if wait_time > 0:
-            self.logger.warning(f"Rate limit approaching, waiting {wait_time:.1f}s")
-            time.sleep(wait_time)
+        self._wait_cache = (current_time + self.WAIT_CACHE_TTL, endpoint_category, wait_time)
+        return wait_time
+    
+    def _is_clearly_within_limits(self, endpoint_category: str, current_time: float) -> bool:
+        """
+        Check cheaply whether a request can go ahead without computing a wait.
         
-        # Track this request
-        self._track_request(endpoint_category)
+        True when there is no backoff in progress, fewer than half the burst
+        threshold of requests were made in the last minute, the requests of
+        the last 5 minutes are spaced too far apart for the predictor to
+        throttle, the endpoint's bucket holds a token even before
+        refilling, and freshly fetched limits leave more than twice the
+        buffer. In that case neither the limit, burst and bucket checks nor
+        the predictor can ask for a wait.
+        
+        Args:
+            endpoint_category: Category of the endpoint
+            current_time: Current monotonic timestamp
+            
+        Returns:
+            True if the full wait time calculation can be skipped
+        """
+        # A shared burst window in Redis is not reflected in local history
+        if self.backoff_state['consecutive_failures'] or self.redis_client is not None:
+            return False
+        
+        half_burst = self.BURST_THRESHOLD // 2
+        request_times = self.request_times
+        if len(request_times) >= half_burst and request_times[-half_burst] > current_time - 60:
+            return False
+        
+        avg_interval = self._recent_average_interval(current_time)
+        if (avg_interval is not None and avg_interval > 0
+                and 3600 / avg_interval > self.THROTTLE_REQUESTS_PER_HOUR):
+            return False
+        
+        bucket = self._buckets.get(endpoint_category)
+        if bucket is not None and bucket[0] < 1:
+            return False
+        
+        if current_time - self._last_rate_check >= self._rate_check_interval:
+            return False
+        limit_info = self._cached_limits.get(endpoint_category)
+        return limit_info is not None and limit_info['remaining'] > 2 * self.buffer
+    
+    def _wait(self, wait_time: float) -> None:
+        """
+        Wait before a request, sharing the wait with other threads.
+        
+        If another thread is already sleeping at least as long, this thread
+        waits for that sleep to end instead of starting its own, so all
+        waiting threads resume together rather than in a staggered burst.
+        
+        Args:
+            wait_time: Seconds to wait
+        """
+        current_time = time.monotonic()
+        with self._sleep_lock:
+            joining = self._sleep_until >= current_time + wait_time
+            if joining:
+                timeout = self._sleep_until - current_time
+            else:
+                self._sleep_until = current_time + wait_time
+                self._sleep_event = threading.Event()
+            event = self._sleep_event
+        
+        if joining:
+            self.logger.debug("Joining rate limit wait of %.1fs", timeout)
+            event.wait(timeout)
+            return
+        
+        self.logger.warning("Rate limit approaching, waiting %.1fs", wait_time)
+        time.sleep(wait_time)
+        event.set()
     
     def handle_rate_limit_error(self, error: Exception) -> float:
         """
@@ -311,7 +622,7 @@ class RateLimiter:
         Returns:
             Backoff time in seconds
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Update backoff state
         if current_time - self.backoff_state['last_failure_time'] > 3600:
@@ -322,16 +633,21 @@ class RateLimiter:
         self.backoff_state['consecutive_failures'] += 1
         self.backoff_state['last_failure_time'] = current_time
         
-        # Calculate backoff with jitter
-        backoff = min(
-            self.backoff_state['current_backoff'] * (self.BACKOFF_MULTIPLIER ** self.backoff_state['consecutive_failures']),
+        # A rate limit error means any cached wait time was too optimistic,
+        # and limits should be re-fetched soon until requests succeed again
+        self._wait_cache = (0.0, '', 0.0)
+        self._rate_check_interval = self.RATE_CHECK_INTERVAL_AFTER_ERROR
+        self._usage_stats_cache = (0.0, None)
+        
+        # Grow the backoff by one step per consecutive failure
+        self.backoff_state['current_backoff'] = min(
+            self.backoff_state['current_backoff'] * self.BACKOFF_MULTIPLIER,
             self.MAX_BACKOFF
         )
+        backoff = self.backoff_state['current_backoff']
         
-        # Add jitter (±20%)
-        import random
-        jitter = backoff * 0.2 * (2 * random.random() - 1)
-        backoff_with_jitter = backoff + jitter
+        # Add jitter (0 to +40%) so a retry never waits less than the backoff
+        backoff_with_jitter = min(backoff * (1 + self.JITTER_RANGE * self._random()), self.MAX_BACKOFF)
         
         # If we have reset time from GitHub, use that instead if longer
         if isinstance(error, RateLimitExceededException):
@@ -344,8 +660,8 @@ class RateLimiter:
             except:
                 pass
         
-        self.logger.warning(f"Rate limit error, backing off for {backoff_with_jitter:.1f}s "
-                      f"(attempt {self.backoff_state['consecutive_failures']})")
+        self.logger.warning("Rate limit error, backing off for %.1fs (attempt %d)",
+                            backoff_with_jitter, self.backoff_state['consecutive_failures'])
         
         return backoff_with_jitter
     
@@ -353,24 +669,79 @@ class RateLimiter:
         """Reset backoff state after successful request."""
         self.backoff_state['consecutive_failures'] = 0
         self.backoff_state['current_backoff'] = self.INITIAL_BACKOFF
+        self._usage_stats_cache = (0.0, None)
+        self._rate_check_interval = self.RATE_CHECK_INTERVAL
     
-    def with_rate_limit(self, func: Callable[..., T]) -> Callable[..., T]:
+    def _cache_response(self, cache_key: str, result: Any, expires_at: float) -> None:
+        """
+        Store a cacheable call's result, keeping the cache bounded.
+        
+        When the cache is full, expired entries are purged first and then
+        the oldest entries are evicted until there is room.
+        
+        Args:
+            cache_key: Key identifying the call
+            result: Result to cache
+            expires_at: Monotonic time after which the result is stale
+        """
+        response_cache = self._response_cache
+        response_cache.pop(cache_key, None)
+        if len(response_cache) >= self.RESPONSE_CACHE_MAX_SIZE:
+            current_time = time.monotonic()
+            for key in [k for k, (expiry, _) in response_cache.items() if expiry <= current_time]:
+                del response_cache[key]
+            while len(response_cache) >= self.RESPONSE_CACHE_MAX_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest
+                del response_cache[next(iter(response_cache))]
+        response_cache[cache_key] = (expires_at, result)
+    
+    def with_rate_limit(self, func: Optional[Callable[..., T]] = None, *,
+                        cacheable: bool = False,
+                        cache_ttl: float = RESPONSE_CACHE_TTL) -> Callable[..., T]:
         """
         Decorator to add rate limiting to a function.
         
+        Use as ``@limiter.with_rate_limit`` or, to cache the results of
+        idempotent reads, ``@limiter.with_rate_limit(cacheable=True)``.
+        Cached calls are answered without a request, so they use no rate
+        limit budget.
+        
         Args:
             func: Function to wrap with rate limiting
+            cacheable: Whether to reuse results for identical arguments
+            cache_ttl: Seconds a cached result stays valid
             
         Returns:
-            Wrapped function
+            Wrapped function, or a decorator if func is not given
         """
+        if func is None:
+            return partial(self.with_rate_limit, cacheable=cacheable, cache_ttl=cache_ttl)
+        
+        # Bind the per-call helpers once per decorated function. check_and_wait,
+        # reset_backoff and handle_rate_limit_error are still looked up on
+        # self, so they can be replaced on the instance after decoration.
+        response_cache = self._response_cache
+        cache_response = self._cache_response
+        concurrency = self._concurrency
+        update_limits = self._update_limits_from_response
+        monotonic = time.monotonic
+        max_retries = 3
+        
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
+            # Answer from the cache before touching the rate limit
+            if cacheable:
+                cache_key = repr((func.__qualname__, args, sorted(kwargs.items())))
+                cached = response_cache.get(cache_key)
+                if cached is not None:
+                    if monotonic() < cached[0]:
+                        return cached[1]
+                    del response_cache[cache_key]
+            
             # Extract endpoint URL if available
             endpoint_url = kwargs.get('endpoint_url')
             
             # Implement retry logic with backoff
-            max_retries = 3
             last_error = None
             
             for attempt in range(max_retries):
@@ -378,12 +749,19 @@ class RateLimiter:
                     # Check rate limit before request
                     self.check_and_wait(endpoint_url)
                     
-                    # Execute function
-                    result = func(*args, **kwargs)
+                    # Execute function, limiting how many calls are in flight;
+                    # GitHub's secondary limits count concurrent requests
+                    with concurrency:
+                        result = func(*args, **kwargs)
+                    
+                    update_limits(result)
                     
                     # Reset backoff on success
                     self.reset_backoff()
                     
+                    if cacheable:
+                        cache_response(cache_key, result, monotonic() + cache_ttl)
+                    
                     return result
                     
                 except RateLimitExceededException as e:
@@ -412,47 +790,154 @@ class RateLimiter:
         
         return wrapper
     
+    def with_rate_limit_async(self, func: Optional[Callable[..., Any]] = None, *,
+                              cacheable: bool = False,
+                              cache_ttl: float = RESPONSE_CACHE_TTL) -> Callable[..., Any]:
+        """
+        Decorator to add rate limiting to a coroutine function.
+        
+        Asyncio counterpart of with_rate_limit: waits with asyncio.sleep and
+        caps in-flight calls with an asyncio.Semaphore of max_concurrent.
+        Results are cached the same way, sharing the same cache.
+        
+        Args:
+            func: Coroutine function to wrap with rate limiting
+            cacheable: Whether to reuse results for identical arguments
+            cache_ttl: Seconds a cached result stays valid
+            
+        Returns:
+            Wrapped coroutine function, or a decorator if func is not given
+        """
+        if func is None:
+            return partial(self.with_rate_limit_async, cacheable=cacheable, cache_ttl=cache_ttl)
+        
+        response_cache = self._response_cache
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            # Answer from the cache before touching the rate limit
+            if cacheable:
+                cache_key = repr((func.__qualname__, args, sorted(kwargs.items())))
+                cached = response_cache.get(cache_key)
+                if cached is not None:
+                    if time.monotonic() < cached[0]:
+                        return cached[1]
+                    del response_cache[cache_key]
+            
+            # Created on first use so it belongs to the running event loop
+            if self._async_concurrency is None:
+                self._async_concurrency = asyncio.Semaphore(self.max_concurrent)
+            
+            endpoint_url = kwargs.get('endpoint_url')
+            max_retries = 3
+            
+            for attempt in range(max_retries):
+                try:
+                    await self.acheck_and_wait(endpoint_url)
+                    
+                    async with self._async_concurrency:
+                        result = await func(*args, **kwargs)
+                    
+                    self._update_limits_from_response(result)
+                    self.reset_backoff()
+                    
+                    if cacheable:
+                        self._cache_response(cache_key, result, time.monotonic() + cache_ttl)
+                    
+                    return result
+                    
+                except GithubException as e:
+                    # Retry rate limit errors (RateLimitExceededException, 403, 429)
+                    is_rate_limit = isinstance(e, RateLimitExceededException) or e.status in [403, 429]
+                    if not is_rate_limit or attempt == max_retries - 1:
+                        raise
+                    await asyncio.sleep(self.handle_rate_limit_error(e))
+        
+        return wrapper
+    
+    def _update_limits_from_response(self, result: Any) -> None:
+        """
+        Refresh a category's cached remaining count from a call's response.
+        
+        The response's X-RateLimit-Resource header names the category its
+        counts belong to, so they are applied to that category alone.
+        Results without rate limit headers (or for a resource that is not
+        tracked) leave the cache for the next get_rate_limit() refresh.
+        
+        Args:
+            result: Return value of the wrapped call; PyGithub objects and
+                HTTP responses carry the headers of the response they came from
+        """
+        if isinstance(result, GithubObject):
+            # raw_headers would fetch lazily loaded objects just to return them
+            headers = result._headers
+        else:
+            headers = getattr(result, 'headers', None)
+        if not isinstance(headers, Mapping):
+            return
+        
+        headers = {str(name).lower(): value for name, value in headers.items()}
+        limit_info = self._cached_limits.get(headers.get('x-ratelimit-resource'))
+        if limit_info is None:
+            return
+        
+        try:
+            remaining = int(headers['x-ratelimit-remaining'])
+            limit = int(headers['x-ratelimit-limit'])
+        except (KeyError, TypeError, ValueError):
+            return
+        
+        limit_info['remaining'] = remaining
+        limit_info['limit'] = limit
+    
     def get_usage_stats(self) -> Dict[str, Any]:
         """
         Get current usage statistics.
         
+        Results are reused for up to USAGE_STATS_TTL seconds while no
+        request is tracked and the backoff state is unchanged, so callers
+        should not modify the returned dictionary.
+        
         Returns:
             Dictionary with usage stats
         """
-        current_time = time.time()
+        current_time = time.monotonic()
+        expires_at, cached_stats = self._usage_stats_cache
+        if cached_stats is not None and current_time < expires_at:
+            return cached_stats
         
-        # Global stats
-        total_requests = len(self.request_times)
+        # Global stats, over the last WINDOW_SIZE requests
+        total_requests = min(len(self.request_times), self.WINDOW_SIZE)
         if total_requests > 0:
-            time_span = current_time - self.request_times[0]
+            time_span = current_time - self.request_times[-total_requests]
             avg_rate = total_requests / time_span * 3600 if time_span > 0 else 0
         else:
             avg_rate = 0
         
         # Per-endpoint stats
-        endpoint_stats = {}
-        for endpoint, requests in self.endpoint_usage.items():
-            if requests:
-                endpoint_time_span = current_time - requests[0]
-                endpoint_rate = len(requests) / endpoint_time_span * 3600 if endpoint_time_span > 0 else 0
-            else:
-                endpoint_rate = 0
-            
-            endpoint_stats[endpoint] = {
-                'requests': len(requests),
-                'rate_per_hour': endpoint_rate
+        endpoint_stats = {
+            endpoint: {
+                'requests': count,
+                'rate_per_hour': (
+                    count / (current_time - first_request) * 3600
+                    if count and current_time > first_request else 0
+                )
             }
+            for endpoint, (count, first_request) in self.endpoint_requests.items()
+        }
         
         # Current limits
         limits = self._get_current_limits()
         
-        return {
+        stats = {
             'total_requests_tracked': total_requests,
             'average_rate_per_hour': avg_rate,
             'endpoint_stats': endpoint_stats,
             'current_limits': limits,
             'backoff_state': self.backoff_state.copy()
         }
+        self._usage_stats_cache = (current_time + self.USAGE_STATS_TTL, stats)
+        return stats
     
     def __repr__(self) -> str:
         """String representation of the rate limiter."""
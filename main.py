@@ -56,13 +56,13 @@ def main():
     args = parser.parse_args()
     
     # Initialize components
-    config = ConfigLoader(args.config)
+    config = ConfigLoader.get_instance(args.config)
     logger = AchievementLogger(args.log_level).get_logger()
     progress = ProgressTracker(args.progress_file)
     
     # Set dry-run in config if specified
     if args.dry_run:
-        config.config['settings']['dry_run'] = True
+        config.set('settings.dry_run', True)
     
     # Initialize GitHub clients
     primary_auth = GitHubAuthenticator.from_config(config.config['github']['primary_account'])
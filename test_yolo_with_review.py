@@ -1,105 +1,190 @@
 #!/usr/bin/env python3
 """
 Test YOLO achievement with pending review - the correct way
+
+Uses GitHub's GraphQL API so the flow needs three main requests: one query
+for the repository and reviewer, one mutation that creates the branch, the
+commit and the pull request, and one that requests the review and merges.
+Top-level mutation fields run in order, so each batch behaves like the
+sequence of REST calls it replaces. Before merging, the pull request's
+mergeable state is polled with a short backoff instead of a fixed sleep.
 """
 
-from github import Github, Auth
+import base64
 import time
 from datetime import datetime
 
+import requests
+
 # Configuration
 TOKEN = 'YOUR_GITHUB_TOKEN_HERE'
 REPO_NAME = 'yolo-achievement-test-repo'
 REVIEWER = 'YOUR_COLLABORATOR_USERNAME'  # You'll need to add a collaborator or use someone who has access
 
+GRAPHQL_URL = 'https://api.github.com/graphql'
+MERGEABLE_POLL_ATTEMPTS = 5  # Backs off 0.1s, 0.2s, 0.4s, 0.8s between polls
+
+REPOSITORY_QUERY = """
+query($name: String!, $reviewer: String!) {
+  viewer {
+    login
+    repository(name: $name) {
+      id
+      nameWithOwner
+      defaultBranchRef { name target { oid } }
+    }
+  }
+  user(login: $reviewer) { id }
+}
+"""
+
+CREATE_PR_MUTATION = """
+mutation($repoId: ID!, $ref: String!, $oid: GitObjectID!, $branch: CommittableBranch!,
+         $message: CommitMessage!, $changes: FileChanges!, $base: String!, $head: String!,
+         $title: String!, $body: String!) {
+  createRef(input: {repositoryId: $repoId, name: $ref, oid: $oid}) { ref { name } }
+  createCommitOnBranch(input: {branch: $branch, message: $message, fileChanges: $changes,
+                               expectedHeadOid: $oid}) { commit { oid } }
+  createPullRequest(input: {repositoryId: $repoId, baseRefName: $base, headRefName: $head,
+                            title: $title, body: $body}) { pullRequest { id number url } }
+}
+"""
+
+MERGEABLE_QUERY = """
+query($id: ID!) {
+  node(id: $id) { ... on PullRequest { mergeable } }
+}
+"""
+
+REVIEW_AND_MERGE_MUTATION = """
+mutation($prId: ID!, $userIds: [ID!], $title: String!, $message: String!) {
+  requestReviews(input: {pullRequestId: $prId, userIds: $userIds}) { pullRequest { id } }
+  mergePullRequest(input: {pullRequestId: $prId, mergeMethod: MERGE, commitHeadline: $title,
+                           commitBody: $message}) { pullRequest { merged url } }
+}
+"""
+
+
+def graphql(query, variables):
+    """Run a GraphQL request, returning its data and the errors keyed by field"""
+    response = requests.post(
+        GRAPHQL_URL,
+        json={'query': query, 'variables': variables},
+        headers={'Authorization': f'bearer {TOKEN}'},
+        timeout=30
+    )
+    response.raise_for_status()
+    payload = response.json()
+    errors = {}
+    for error in payload.get('errors', []):
+        field = (error.get('path') or ['request'])[0]
+        errors.setdefault(field, error.get('message', 'Unknown error'))
+    return payload.get('data') or {}, errors
+
+
+def wait_until_mergeable(pr_id):
+    """Poll until GitHub has computed whether the pull request can be merged"""
+    for attempt in range(MERGEABLE_POLL_ATTEMPTS):
+        data, _ = graphql(MERGEABLE_QUERY, {'id': pr_id})
+        if (data.get('node') or {}).get('mergeable') != 'UNKNOWN':
+            return
+        if attempt < MERGEABLE_POLL_ATTEMPTS - 1:
+            time.sleep(0.1 * 2 ** attempt)
+
+
 def main():
     print("Starting YOLO achievement test with pending review...")
     
-    # Authenticate
-    auth = Auth.Token(TOKEN)
-    g = Github(auth=auth)
-    
+    # Authenticate and get repository
     try:
-        user = g.get_user()
-        username = user.login
-        print(f"Authenticated as: {username}")
+        data, errors = graphql(REPOSITORY_QUERY, {'name': REPO_NAME, 'reviewer': REVIEWER})
     except Exception as e:
         print(f"Authentication failed: {e}")
         return
     
-    # Get repository
-    repo_full_name = f"{username}/{REPO_NAME}"
-    try:
-        repo = g.get_repo(repo_full_name)
-        print(f"Using existing repository: {repo_full_name}")
-    except Exception as e:
-        print(f"Repository not found: {e}")
+    viewer = data.get('viewer')
+    if not viewer:
+        print(f"Authentication failed: {errors}")
+        return
+    print(f"Authenticated as: {viewer['login']}")
+    
+    repo = viewer['repository']
+    if not repo:
+        print(f"Repository not found: {viewer['login']}/{REPO_NAME}")
         print("Please create the repository first")
         return
+    print(f"Using existing repository: {repo['nameWithOwner']}")
     
-    # Create a branch
-    default_branch = repo.default_branch
-    base_sha = repo.get_branch(default_branch).commit.sha
-    branch_name = f'yolo-review-{int(time.time())}'
+    reviewer = data.get('user')
+    if not reviewer:
+        print(f"Reviewer not found: {errors.get('user', REVIEWER)}")
     
-    print(f"Creating branch: {branch_name}")
-    repo.create_git_ref(f'refs/heads/{branch_name}', base_sha)
-    
-    # Create a file
-    file_path = f'yolo-review-{int(time.time())}.txt'
+    # Create a branch, a file on it and the pull request in one request
+    default_branch = repo['defaultBranchRef']['name']
+    base_sha = repo['defaultBranchRef']['target']['oid']
+    timestamp = int(time.time())
+    branch_name = f'yolo-review-{timestamp}'
+    file_path = f'yolo-review-{timestamp}.txt'
     file_content = f'YOLO achievement with review test at {datetime.now().isoformat()}'
     
+    print(f"Creating branch: {branch_name}")
     print(f"Creating file: {file_path}")
-    repo.create_file(
-        file_path,
-        'Add YOLO achievement file for review',
-        file_content,
-        branch=branch_name
-    )
-    
-    time.sleep(2)
-    
-    # Create pull request
     print("Creating pull request...")
-    pr = repo.create_pull(
-        title='YOLO Achievement PR - With Pending Review',
-        body='This PR will be merged with a pending review for the YOLO achievement! 🎯',
-        base=default_branch,
-        head=branch_name
-    )
+    data, errors = graphql(CREATE_PR_MUTATION, {
+        'repoId': repo['id'],
+        'ref': f'refs/heads/{branch_name}',
+        'oid': base_sha,
+        'branch': {'repositoryNameWithOwner': repo['nameWithOwner'], 'branchName': branch_name},
+        'message': {'headline': 'Add YOLO achievement file for review'},
+        'changes': {'additions': [{
+            'path': file_path,
+            'contents': base64.b64encode(file_content.encode()).decode()
+        }]},
+        'base': default_branch,
+        'head': branch_name,
+        'title': 'YOLO Achievement PR - With Pending Review',
+        'body': 'This PR will be merged with a pending review for the YOLO achievement! 🎯'
+    })
+    
+    created = data.get('createPullRequest')
+    if not created:
+        print(f"Failed to create pull request: {errors}")
+        return
+    pr = created['pullRequest']
+    print(f"Created PR #{pr['number']}")
     
-    print(f"Created PR #{pr.number}")
+    wait_until_mergeable(pr['id'])
     
-    # Request a review
+    # Request a review, then merge with the review still pending
     print(f"Requesting review from: {REVIEWER}")
+    print(f"Merging PR #{pr['number']} with pending review...")
     try:
-        pr.create_review_request(reviewers=[REVIEWER])
-        print("Review requested successfully!")
+        data, errors = graphql(REVIEW_AND_MERGE_MUTATION, {
+            'prId': pr['id'],
+            'userIds': [reviewer['id']] if reviewer else [],
+            'title': f"Merge PR #{pr['number']}: YOLO Achievement with Pending Review",
+            'message': 'Merged with pending review for YOLO achievement!'
+        })
     except Exception as e:
-        print(f"Failed to request review: {e}")
-        print("Note: The reviewer must be a collaborator or have access to the repo")
-        # Try to continue anyway - you might be able to self-review
+        print(f"Error merging: {e}")
+        return
     
-    time.sleep(2)
+    if 'requestReviews' in errors:
+        print(f"Failed to request review: {errors['requestReviews']}")
+        print("Note: The reviewer must be a collaborator or have access to the repo")
+    else:
+        print("Review requested successfully!")
     
-    # Merge with pending review
-    print(f"Merging PR #{pr.number} with pending review...")
-    try:
-        merge_result = pr.merge(
-            merge_method='merge',
-            commit_title=f'Merge PR #{pr.number}: YOLO Achievement with Pending Review',
-            commit_message='Merged with pending review for YOLO achievement!'
-        )
-        
-        if merge_result.merged:
-            print(f"✅ Successfully merged PR #{pr.number} with pending review!")
-            print(f"PR URL: {pr.html_url}")
-            print("\nYOLO achievement should be unlocked! Check your GitHub profile.")
-        else:
-            print("❌ Failed to merge PR")
-    except Exception as e:
-        print(f"Error merging: {e}")
+    merged = data.get('mergePullRequest')
+    if merged and merged['pullRequest']['merged']:
+        print(f"✅ Successfully merged PR #{pr['number']} with pending review!")
+        print(f"PR URL: {pr['url']}")
+        print("\nYOLO achievement should be unlocked! Check your GitHub profile.")
+    elif 'mergePullRequest' in errors:
+        print(f"Error merging: {errors['mergePullRequest']}")
         print("Note: The repository might have branch protection rules preventing merge")
+    else:
+        print("❌ Failed to merge PR")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
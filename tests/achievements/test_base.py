@@ -2,7 +2,7 @@
 Tests for the base achievement hunter class
 """
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import ANY, Mock, MagicMock, call, patch
 from datetime import datetime
 import time
 
@@ -10,20 +10,25 @@ from github_achievement_hunter.achievements.base import AchievementHunter
 from github_achievement_hunter.utils.github_client import GitHubClient
 from github_achievement_hunter.utils.progress_tracker import ProgressTracker
 from github_achievement_hunter.utils.config import ConfigLoader
-from github_achievement_hunter.utils.logger import AchievementLogger
+
+
+# Returned by datetime.now() in the base module during every test
+FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
 
 
 class TestAchievementHunter(AchievementHunter):
     """Concrete implementation for testing"""
     
+    # Class-level defaults; tests and the hooks below shadow them per instance
+    validate_called = False
+    execute_called = False
+    verify_called = False
+    should_validate_succeed = True
+    should_execute_succeed = True
+    should_verify_succeed = True
+    
     def __init__(self, *args, **kwargs):
         super().__init__("test_achievement", *args, **kwargs)
-        self.validate_called = False
-        self.execute_called = False
-        self.verify_called = False
-        self.should_validate_succeed = True
-        self.should_execute_succeed = True
-        self.should_verify_succeed = True
     
     def validate_requirements(self):
         self.validate_called = True
@@ -40,27 +45,71 @@ class TestAchievementHunter(AchievementHunter):
         return self.should_verify_succeed
 
 
+class RecordingLogger:
+    """Logger stand-in that records the messages logged at each level"""
+    
+    def __init__(self):
+        self.debug_calls = []
+        self.info_calls = []
+        self.warning_calls = []
+        self.error_calls = []
+    
+    def debug(self, msg, *args, **kwargs):
+        self.debug_calls.append(msg)
+    
+    def info(self, msg, *args, **kwargs):
+        self.info_calls.append(msg)
+    
+    def warning(self, msg, *args, **kwargs):
+        self.warning_calls.append(msg)
+    
+    def error(self, msg, *args, **kwargs):
+        self.error_calls.append(msg)
+
+
 class TestAchievementHunterBase:
     """Test suite for AchievementHunter base class"""
     
+    # The spec'd mocks introspect their class when built, so they are built
+    # once per module and reset for each test by the fixtures below
+    
+    @pytest.fixture(scope="module")
+    def _github_client_mock(self):
+        """Create the module's spec'd GitHub client mock"""
+        return Mock(spec_set=GitHubClient)
+    
+    @pytest.fixture(scope="module")
+    def _progress_tracker_mock(self):
+        """Create the module's spec'd progress tracker mock"""
+        tracker = Mock(spec_set=ProgressTracker)
+        tracker.update_achievement = Mock()
+        return tracker
+    
+    @pytest.fixture(scope="module")
+    def _config_mock(self):
+        """Create the module's spec'd config loader mock"""
+        return Mock(spec_set=ConfigLoader)
+    
     @pytest.fixture
-    def mock_github_client(self):
+    def mock_github_client(self, _github_client_mock):
         """Create mock GitHub client"""
-        return Mock(spec=GitHubClient)
+        _github_client_mock.reset_mock(return_value=True, side_effect=True)
+        return _github_client_mock
     
     @pytest.fixture
-    def mock_progress_tracker(self):
+    def mock_progress_tracker(self, _progress_tracker_mock):
         """Create mock progress tracker"""
-        tracker = Mock(spec=ProgressTracker)
+        tracker = _progress_tracker_mock
+        tracker.reset_mock(return_value=True, side_effect=True)
         tracker.is_achievement_completed.return_value = False
-        tracker.update_achievement = Mock()
         tracker.get_achievement_progress.return_value = {"status": "pending"}
         return tracker
     
     @pytest.fixture
-    def mock_config(self):
+    def mock_config(self, _config_mock):
         """Create mock config loader"""
-        config = Mock(spec=ConfigLoader)
+        config = _config_mock
+        config.reset_mock(return_value=True, side_effect=True)
         config.get.return_value = {
             "enabled": True,
             "test_setting": "test_value"
@@ -68,23 +117,39 @@ class TestAchievementHunterBase:
         return config
     
     @pytest.fixture
-    def mock_logger(self):
-        """Create mock logger"""
-        logger = Mock(spec=AchievementLogger)
-        logger.info = Mock()
-        logger.error = Mock()
-        logger.warning = Mock()
-        logger.debug = Mock()
-        return logger
+    def logger(self):
+        """Create recording logger"""
+        return RecordingLogger()
+    
+    @pytest.fixture
+    def mock_repo(self):
+        """Create mock repository named like the one the tests ensure"""
+        repo = Mock()
+        repo.name = "test-repo"
+        repo.html_url = "https://github.com/user/test-repo"
+        return repo
+    
+    @pytest.fixture(autouse=True)
+    def frozen_now(self):
+        """Freeze datetime.now in the base module so timestamps are fixed"""
+        with patch('github_achievement_hunter.achievements.base.datetime') as mock_datetime:
+            mock_datetime.now.return_value = FROZEN_NOW
+            yield FROZEN_NOW
+    
+    @pytest.fixture(autouse=True)
+    def mock_sleep(self):
+        """Make time.sleep a no-op so no test can block on a real wait"""
+        with patch('time.sleep') as mock_sleep:
+            yield mock_sleep
     
     @pytest.fixture
-    def hunter(self, mock_github_client, mock_progress_tracker, mock_config, mock_logger):
+    def hunter(self, mock_github_client, mock_progress_tracker, mock_config, logger):
         """Create test achievement hunter instance"""
         return TestAchievementHunter(
             mock_github_client,
             mock_progress_tracker,
             mock_config,
-            mock_logger
+            logger
         )
     
     def test_initialization(self, hunter, mock_config):
@@ -93,43 +158,31 @@ class TestAchievementHunterBase:
         assert hunter.enabled is True
         mock_config.get.assert_called_with("achievements.test_achievement", {})
     
-    def test_run_disabled_achievement(self, hunter, mock_logger):
-        """Test running when achievement is disabled"""
-        hunter.enabled = False
-        result = hunter.run()
+    @pytest.mark.parametrize("flag, expected_result, expected_calls, log_level, message", [
+        ("enabled", True, (False, False, False), "info",
+         "Achievement test_achievement is disabled in configuration"),
+        ("is_achievement_completed", True, (False, False, False), "info",
+         "Achievement test_achievement is already completed"),
+        ("should_validate_succeed", False, (True, False, False), "error",
+         "Requirements validation failed: Test validation error"),
+        ("should_verify_succeed", False, (True, True, True), "warning",
+         "Achievement test_achievement executed but verification failed"),
+    ], ids=["disabled", "already_completed", "validation_failure", "verification_failure"])
+    def test_run_paths(self, hunter, mock_progress_tracker, logger,
+                       flag, expected_result, expected_calls, log_level, message):
+        """Test run when a single check stops or fails the achievement"""
+        if flag == "is_achievement_completed":
+            mock_progress_tracker.is_achievement_completed.return_value = True
+        else:
+            setattr(hunter, flag, False)
         
-        assert result is True
-        assert not hunter.validate_called
-        assert not hunter.execute_called
-        mock_logger.info.assert_called_with(
-            "Achievement test_achievement is disabled in configuration"
-        )
-    
-    def test_run_already_completed(self, hunter, mock_progress_tracker, mock_logger):
-        """Test running when achievement is already completed"""
-        mock_progress_tracker.is_achievement_completed.return_value = True
-        result = hunter.run()
-        
-        assert result is True
-        assert not hunter.validate_called
-        assert not hunter.execute_called
-        mock_logger.info.assert_called_with(
-            "Achievement test_achievement is already completed"
-        )
-    
-    def test_run_validation_failure(self, hunter, mock_logger, mock_progress_tracker):
-        """Test run when validation fails"""
-        hunter.should_validate_succeed = False
         result = hunter.run()
         
-        assert result is False
-        assert hunter.validate_called
-        assert not hunter.execute_called
-        mock_logger.error.assert_called_with(
-            "Requirements validation failed: Test validation error"
-        )
+        assert result is expected_result
+        assert (hunter.validate_called, hunter.execute_called, hunter.verify_called) == expected_calls
+        assert getattr(logger, f"{log_level}_calls")[-1] == message
     
-    def test_run_successful_completion(self, hunter, mock_progress_tracker, mock_logger):
+    def test_run_successful_completion(self, hunter, mock_progress_tracker, logger):
         """Test successful achievement completion"""
         result = hunter.run()
         
@@ -144,21 +197,23 @@ class TestAchievementHunterBase:
         # Should have: in_progress, completed
         assert len(calls) >= 2
         
-        # Check in_progress call
-        in_progress_call = calls[0]
-        assert in_progress_call[0][0] == "test_achievement"
-        assert in_progress_call[1]["status"] == "in_progress"
-        assert "started_at" in in_progress_call[1]
-        
-        # Check completed call
-        completed_call = calls[-1]
-        assert completed_call[0][0] == "test_achievement"
-        assert completed_call[1]["status"] == "completed"
-        assert completed_call[1]["completed"] is True
-        assert "completed_at" in completed_call[1]
-        assert "execution_time_seconds" in completed_call[1]
-    
-    def test_run_execution_failure(self, hunter, mock_progress_tracker, mock_logger):
+        # Check in_progress and completed calls
+        first, last = calls[0], calls[-1]
+        assert first == call(
+            "test_achievement",
+            {'status': 'in_progress', 'started_at': FROZEN_NOW.isoformat()}
+        )
+        assert last == call(
+            "test_achievement",
+            {
+                'status': 'completed',
+                'completed': True,
+                'completed_at': FROZEN_NOW.isoformat(),
+                'execution_time_seconds': ANY
+            }
+        )
+    
+    def test_run_execution_failure(self, hunter, mock_progress_tracker, logger):
         """Test run when execution fails"""
         hunter.should_execute_succeed = False
         result = hunter.run()
@@ -172,23 +227,9 @@ class TestAchievementHunterBase:
         calls = mock_progress_tracker.update_achievement.call_args_list
         failure_call = calls[-1]
         assert failure_call[0][0] == "test_achievement"
-        assert failure_call[1]["status"] == "failed"
+        assert failure_call[0][1]["status"] == "failed"
     
-    def test_run_verification_failure(self, hunter, mock_progress_tracker, mock_logger):
-        """Test run when verification fails after successful execution"""
-        hunter.should_verify_succeed = False
-        result = hunter.run()
-        
-        assert result is False
-        assert hunter.validate_called
-        assert hunter.execute_called
-        assert hunter.verify_called
-        
-        mock_logger.warning.assert_called_with(
-            "Achievement test_achievement executed but verification failed"
-        )
-    
-    def test_run_with_exception(self, hunter, mock_progress_tracker, mock_logger):
+    def test_run_with_exception(self, hunter, mock_progress_tracker, logger):
         """Test run when an exception occurs"""
         hunter.execute = Mock(side_effect=Exception("Test error"))
         
@@ -199,9 +240,9 @@ class TestAchievementHunterBase:
         calls = mock_progress_tracker.update_achievement.call_args_list
         error_call = calls[-1]
         assert error_call[0][0] == "test_achievement"
-        assert error_call[1]["status"] == "error"
-        assert error_call[1]["error"] == "Test error"
-        assert "error_time" in error_call[1]
+        assert error_call[0][1]["status"] == "error"
+        assert error_call[0][1]["error"] == "Test error"
+        assert "error_time" in error_call[0][1]
     
     def test_get_progress(self, hunter, mock_progress_tracker):
         """Test getting achievement progress"""
@@ -213,74 +254,74 @@ class TestAchievementHunterBase:
         assert progress == expected_progress
         mock_progress_tracker.get_achievement_progress.assert_called_with("test_achievement")
     
-    def test_wait_with_progress(self, hunter, mock_logger):
+    def test_wait_with_progress(self, hunter, logger, mock_sleep):
         """Test wait with progress indicator"""
-        with patch('time.sleep') as mock_sleep:
-            hunter.wait_with_progress(5, "Testing wait")
-            
-            mock_sleep.assert_called_with(5)
-            mock_logger.info.assert_called_with("Testing wait for 5 seconds...")
+        hunter.wait_with_progress(5, "Testing wait")
+        
+        mock_sleep.assert_called_with(5)
+        assert logger.info_calls[-1] == "Testing wait for 5 seconds..."
     
-    def test_wait_with_progress_long(self, hunter, mock_logger):
+    def test_wait_with_progress_long(self, hunter, logger, mock_sleep):
         """Test wait with progress for long waits"""
-        with patch('time.sleep') as mock_sleep:
-            hunter.wait_with_progress(35, "Long wait")
-            
-            # Should be called multiple times for long waits
-            assert mock_sleep.call_count == 4  # 10 + 10 + 10 + 5
-            mock_logger.debug.assert_called()
+        hunter.wait_with_progress(35, "Long wait")
+        
+        # Should be called multiple times for long waits
+        assert mock_sleep.call_count == 4  # 10 + 10 + 10 + 5
+        assert logger.debug_calls
     
     def test_batch_process_success(self, hunter, mock_progress_tracker):
         """Test successful batch processing"""
         items = list(range(10))
-        processor = Mock(side_effect=lambda x: x * 2)
+        processed = []
         
-        with patch('time.sleep'):
-            results = hunter.batch_process(
-                items,
-                processor,
-                batch_size=3,
-                delay_between_batches=1,
-                description="numbers"
-            )
+        def processor(item):
+            processed.append(item)
+            return item * 2
+        
+        results = hunter.batch_process(
+            items,
+            processor,
+            batch_size=3,
+            delay_between_batches=1,
+            description="numbers"
+        )
         
         assert results == [0, 2, 4, 6, 8, 10, 12, 14, 16, 18]
-        assert processor.call_count == 10
+        assert processed == items
         
         # Check progress updates
         progress_calls = [
             call for call in mock_progress_tracker.update_achievement.call_args_list
-            if "progress" in call[1]
+            if "progress" in call[0][1]
         ]
         assert len(progress_calls) > 0
     
-    def test_batch_process_with_errors(self, hunter, mock_logger):
+    def test_batch_process_with_errors(self, hunter, logger):
         """Test batch processing with some errors"""
         items = list(range(5))
-        processor = Mock(side_effect=[0, Exception("Error"), 4, 6, 8])
         
-        with patch('time.sleep'):
-            results = hunter.batch_process(
-                items,
-                processor,
-                batch_size=2,
-                description="items"
-            )
+        def processor(item):
+            if item == 1:
+                raise Exception("Error")
+            return item * 2
+        
+        results = hunter.batch_process(
+            items,
+            processor,
+            batch_size=2,
+            description="items"
+        )
         
         assert results == [0, None, 4, 6, 8]
-        mock_logger.error.assert_called()
+        assert logger.error_calls
     
-    def test_ensure_repository_exists_creates_new(self, hunter, mock_github_client, mock_progress_tracker):
+    def test_ensure_repository_exists_creates_new(self, hunter, mock_github_client, mock_progress_tracker,
+                                                  mock_repo):
         """Test repository creation when it doesn't exist"""
-        mock_repo = Mock()
-        mock_repo.name = "test-repo"
-        mock_repo.html_url = "https://github.com/user/test-repo"
-        
-        mock_github_client.get_user_repositories.return_value = []
+        mock_github_client.repository_exists.return_value = False
         mock_github_client.create_repository.return_value = mock_repo
         
-        with patch('time.sleep'):
-            result = hunter.ensure_repository_exists("test-repo")
+        result = hunter.ensure_repository_exists("test-repo")
         
         assert result is True
         mock_github_client.create_repository.assert_called_with(
@@ -293,31 +334,29 @@ class TestAchievementHunterBase:
     
     def test_ensure_repository_exists_already_exists(self, hunter, mock_github_client):
         """Test when repository already exists"""
-        mock_repo = Mock()
-        mock_repo.name = "test-repo"
-        
-        mock_github_client.get_user_repositories.return_value = [mock_repo]
+        mock_github_client.repository_exists.return_value = True
         
         result = hunter.ensure_repository_exists("test-repo")
         
         assert result is True
+        mock_github_client.repository_exists.assert_called_once_with("test-repo")
         mock_github_client.create_repository.assert_not_called()
     
-    def test_ensure_repository_exists_creation_fails(self, hunter, mock_github_client, mock_logger):
+    def test_ensure_repository_exists_creation_fails(self, hunter, mock_github_client, logger):
         """Test when repository creation fails"""
-        mock_github_client.get_user_repositories.return_value = []
+        mock_github_client.repository_exists.return_value = False
         mock_github_client.create_repository.return_value = None
         
         result = hunter.ensure_repository_exists("test-repo")
         
         assert result is False
-        mock_logger.error.assert_called_with("Failed to create repository: test-repo")
+        assert logger.error_calls[-1] == "Failed to create repository: test-repo"
     
-    def test_ensure_repository_exists_with_exception(self, hunter, mock_github_client, mock_logger):
+    def test_ensure_repository_exists_with_exception(self, hunter, mock_github_client, logger):
         """Test repository creation with exception"""
-        mock_github_client.get_user_repositories.side_effect = Exception("API Error")
+        mock_github_client.repository_exists.side_effect = Exception("API Error")
         
         result = hunter.ensure_repository_exists("test-repo")
         
         assert result is False
-        mock_logger.error.assert_called_with("Error ensuring repository exists: API Error")
\ No newline at end of file
+        assert logger.error_calls[-1] == "Error ensuring repository exists: API Error"
\ No newline at end of file
@@ -12,10 +12,33 @@ from github_achievement_hunter.utils.progress_tracker import ProgressTracker
 from github_achievement_hunter.utils.config import ConfigLoader
 
 
+# Configuration returned by the mock config loader
+GALAXY_BRAIN_CONFIG = {
+    'achievements.galaxy_brain': {
+        'enabled': True,
+        'target_count': 64,
+        'batch_size': 3,
+        'discussion_delay': 5
+    },
+    'repository.name': 'test-repo'
+}
+
+# GraphQL responses to creating a discussion, adding a comment and marking
+# the comment as the answer
+DISCUSSION_RESPONSES = (
+    {'data': {'createDiscussion': {'discussion': {'id': 'D_123', 'number': 1}}}},
+    {'data': {'addDiscussionComment': {'comment': {'id': 'DC_456'}}}},
+    {'data': {'markDiscussionCommentAsAnswer': {'discussion': {'id': 'D_123'}}}},
+)
+
+
 class TestGalaxyBrainHunter:
     """Test suite for GalaxyBrainHunter"""
     
-    @pytest.fixture
+    # The spec'd mocks and the hunter are built once per module; reset_hunter
+    # puts them back into their initial state after every test
+    
+    @pytest.fixture(scope="module")
     def mock_clients(self):
         """Create mock GitHub clients"""
         primary_client = Mock(spec=GitHubClient)
@@ -28,7 +51,7 @@ class TestGalaxyBrainHunter:
         
         return primary_client, secondary_client
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_dependencies(self):
         """Create mock dependencies"""
         progress_tracker = Mock(spec=ProgressTracker)
@@ -36,19 +59,11 @@ class TestGalaxyBrainHunter:
         progress_tracker.is_achievement_completed.return_value = False
         
         config = Mock(spec=ConfigLoader)
-        config.get.side_effect = lambda key, default=None: {
-            'achievements.galaxy_brain': {
-                'enabled': True,
-                'target_count': 64,
-                'batch_size': 3,
-                'discussion_delay': 5
-            },
-            'repository.name': 'test-repo'
-        }.get(key, default)
+        config.get.side_effect = GALAXY_BRAIN_CONFIG.get
         
         return progress_tracker, config
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def hunter(self, mock_clients, mock_dependencies):
         """Create GalaxyBrainHunter instance"""
         primary_client, secondary_client = mock_clients
@@ -61,6 +76,21 @@ class TestGalaxyBrainHunter:
             config=config
         )
     
+    @pytest.fixture(autouse=True)
+    def reset_hunter(self, hunter, mock_clients, mock_dependencies):
+        """Undo the changes a test makes to the shared hunter and mocks"""
+        state = dict(vars(hunter))
+        yield
+        vars(hunter).clear()
+        vars(hunter).update(state)
+        
+        for client in mock_clients:
+            client.reset_mock(return_value=True, side_effect=True)
+        progress_tracker = mock_dependencies[0]
+        progress_tracker.reset_mock(return_value=True, side_effect=True)
+        progress_tracker.get_achievement_progress.return_value = {'count': 0}
+        progress_tracker.is_achievement_completed.return_value = False
+    
     def test_init(self, hunter):
         """Test hunter initialization"""
         assert hunter.achievement_name == "galaxy_brain"
@@ -68,15 +98,16 @@ class TestGalaxyBrainHunter:
         assert hunter.repo_name == "test-repo"
         assert hunter.graphql_endpoint == "https://api.github.com/graphql"
     
-    def test_from_multi_account(self, mock_dependencies):
+    def test_from_multi_account(self, mock_clients, mock_dependencies):
         """Test creating hunter from multi-account authenticator"""
+        primary_client, secondary_client = mock_clients
         progress_tracker, config = mock_dependencies
         
         # Mock multi-account authenticator
         multi_auth = Mock(spec=MultiAccountAuthenticator)
         multi_auth.has_secondary.return_value = True
-        multi_auth.get_primary_client.return_value = Mock(spec=GitHubClient)
-        multi_auth.get_secondary_client.return_value = Mock(spec=GitHubClient)
+        multi_auth.get_primary_client.return_value = primary_client
+        multi_auth.get_secondary_client.return_value = secondary_client
         
         hunter = GalaxyBrainHunter.from_multi_account(
             multi_auth, progress_tracker, config
@@ -406,58 +437,18 @@ class TestGalaxyBrainHunter:
         assert result is True
         mock_repo.add_to_collaborators.assert_called_once_with("test_user2")
     
+    @pytest.mark.parametrize("responses, expected_result, expected_calls", [
+        (DISCUSSION_RESPONSES, "D_123", 3),
+        (Exception("GraphQL error"), None, 1),
+    ], ids=["success", "error"])
     @patch('time.sleep')
-    def test_create_discussion_with_answer_success(self, mock_sleep, hunter):
-        """Test successful discussion creation with answer"""
-        with patch.object(hunter, '_execute_graphql') as mock_graphql:
-            # Mock responses for each GraphQL call
-            mock_graphql.side_effect = [
-                # Create discussion response
-                {
-                    'data': {
-                        'createDiscussion': {
-                            'discussion': {
-                                'id': 'D_123',
-                                'number': 1
-                            }
-                        }
-                    }
-                },
-                # Add comment response
-                {
-                    'data': {
-                        'addDiscussionComment': {
-                            'comment': {
-                                'id': 'DC_456'
-                            }
-                        }
-                    }
-                },
-                # Mark as answer response
-                {
-                    'data': {
-                        'markDiscussionCommentAsAnswer': {
-                            'discussion': {
-                                'id': 'D_123'
-                            }
-                        }
-                    }
-                }
-            ]
-            
-            result = hunter._create_discussion_with_answer("R_test", "C_qa", 1)
-            
-            assert result == "D_123"
-            assert mock_graphql.call_count == 3
-    
-    def test_create_discussion_with_answer_error(self, hunter):
-        """Test error in discussion creation"""
-        with patch.object(hunter, '_execute_graphql') as mock_graphql:
-            mock_graphql.side_effect = Exception("GraphQL error")
-            
+    def test_create_discussion_with_answer(self, mock_sleep, hunter, responses, expected_result, expected_calls):
+        """Test discussion creation with an answer, and its error handling"""
+        with patch.object(hunter, '_execute_graphql', side_effect=responses) as mock_graphql:
             result = hunter._create_discussion_with_answer("R_test", "C_qa", 1)
-            
-            assert result is None
+        
+        assert result == expected_result
+        assert mock_graphql.call_count == expected_calls
     
     @patch('time.sleep')
     def test_execute_full_flow(self, mock_sleep, hunter):
@@ -182,7 +182,7 @@ class TestPairExtraordinaireHunter:
         mock_repo.get_collaborators.return_value = [Mock(login="secondary_user")]
         
         # Mock repository operations
-        hunter.github_client.get_user_repositories = Mock(return_value=[mock_repo])
+        hunter.github_client.repository_exists = Mock(return_value=True)
         hunter.github_client.client.get_repo.return_value = mock_repo
         
         # Mock file operations
@@ -242,7 +242,7 @@ class TestPairExtraordinaireHunter:
         mock_repo.add_to_collaborators = Mock()
         
         # Mock repository operations
-        hunter.github_client.get_user_repositories = Mock(return_value=[mock_repo])
+        hunter.github_client.repository_exists = Mock(return_value=True)
         hunter.github_client.client.get_repo.return_value = mock_repo
         
         # Set count to 0 to trigger collaborator addition
@@ -266,7 +266,7 @@ class TestPairExtraordinaireHunter:
         mock_repo.full_name = "primary_user/test-repo"
         mock_repo.get_collaborators.return_value = [Mock(login="secondary_user")]
         
-        hunter.github_client.get_user_repositories = Mock(return_value=[mock_repo])
+        hunter.github_client.repository_exists = Mock(return_value=True)
         hunter.github_client.client.get_repo.return_value = mock_repo
         
         # Mock the author repo that will fail on create_file
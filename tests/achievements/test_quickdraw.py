@@ -81,6 +81,19 @@ class TestQuickdrawHunter:
         assert is_valid is False
         assert "Repository name must be configured" in error
     
+    def test_validate_requirements_already_achieved(self, hunter):
+        """Test validation skips the API call when already achieved"""
+        hunter.progress_tracker.get_achievement_progress.return_value = {
+            'quickdraw_achieved': True
+        }
+        hunter.github_client.client = Mock()
+        
+        is_valid, error = hunter.validate_requirements()
+        
+        assert is_valid is True
+        assert error == ""
+        hunter.github_client.client.get_user.assert_not_called()
+    
     def test_validate_requirements_auth_failure(self, hunter):
         """Test validation fails on authentication error"""
         hunter.github_client.client = Mock()
@@ -80,6 +80,19 @@ class TestYoloHunter:
         assert is_valid is False
         assert "Repository name must be configured" in error
     
+    def test_validate_requirements_already_achieved(self, hunter):
+        """Test validation skips the API call when already achieved"""
+        hunter.progress_tracker.get_achievement_progress.return_value = {
+            'yolo_achieved': True
+        }
+        hunter.github_client.client = Mock()
+        
+        is_valid, error = hunter.validate_requirements()
+        
+        assert is_valid is True
+        assert error == ""
+        hunter.github_client.client.get_user.assert_not_called()
+    
     def test_validate_requirements_auth_failure(self, hunter):
         """Test validation fails on authentication error"""
         hunter.github_client.client = Mock()
@@ -147,11 +160,14 @@ class TestYoloHunter:
         mock_branch.commit.sha = "base_sha_123"
         mock_repo.get_branch.return_value = mock_branch
         
-        # Mock file creation
-        mock_commit_result = {
-            'commit': Mock(sha='commit_sha_456')
+        mock_repo.node_id = "repo_node_id"
+        mock_repo.full_name = "test_user/test-repo"
+        
+        # Mock branch + file creation via GraphQL
+        hunter.github_client.graphql.return_value = {
+            'createRef': {'ref': {'id': 'ref_id'}},
+            'createCommitOnBranch': {'commit': {'oid': 'commit_sha_456'}}
         }
-        mock_repo.create_file.return_value = mock_commit_result
         
         # Mock PR
         mock_pr = Mock()
@@ -175,19 +191,22 @@ class TestYoloHunter:
         
         assert result is True
         
-        # Verify branch was created
-        mock_repo.create_git_ref.assert_called_once_with(
-            'refs/heads/yolo-achievement-1234567890',
-            'base_sha_123'
-        )
-        
-        # Verify file was created
-        mock_repo.create_file.assert_called_once_with(
-            'yolo-achievement.txt',
-            'Add YOLO achievement file',
-            ANY,  # File content contains timestamp
-            branch='yolo-achievement-1234567890'
-        )
+        # Verify branch and file were created in a single GraphQL call
+        hunter.github_client.graphql.assert_called_once()
+        variables = hunter.github_client.graphql.call_args[0][1]
+        assert variables['repositoryId'] == 'repo_node_id'
+        assert variables['refName'] == 'refs/heads/yolo-achievement-1234567890'
+        assert variables['baseOid'] == 'base_sha_123'
+        commit_input = variables['commitInput']
+        assert commit_input['branch'] == {
+            'repositoryNameWithOwner': 'test_user/test-repo',
+            'branchName': 'yolo-achievement-1234567890'
+        }
+        assert commit_input['expectedHeadOid'] == 'base_sha_123'
+        assert commit_input['message'] == {'headline': 'Add YOLO achievement file'}
+        assert commit_input['fileChanges']['additions'][0]['path'] == 'yolo-achievement.txt'
+        mock_repo.create_git_ref.assert_not_called()
+        mock_repo.create_file.assert_not_called()
         
         # Verify PR was created
         mock_repo.create_pull.assert_called_once_with(
@@ -204,7 +223,8 @@ class TestYoloHunter:
             commit_message='Merged without review for YOLO achievement!'
         )
         
-        # Verify branch was deleted
+        # Verify branch was deleted by the background cleanup
+        hunter._cleanup_future.result(timeout=5)
         mock_ref.delete.assert_called_once()
         
         # Verify progress was updated
@@ -229,7 +249,7 @@ class TestYoloHunter:
         mock_repo.get_branch.return_value = mock_branch
         
         # Make branch creation fail
-        mock_repo.create_git_ref.side_effect = GithubException(400, "Bad request", None)
+        hunter.github_client.graphql.side_effect = GithubException(400, "Bad request", None)
         
         with patch.object(hunter, 'ensure_repository_exists', return_value=True):
             result = hunter.execute()
@@ -248,8 +268,9 @@ class TestYoloHunter:
         mock_repo.get_branch.return_value = mock_branch
         
         # Mock successful file creation
-        mock_commit_result = {'commit': Mock(sha='commit_sha')}
-        mock_repo.create_file.return_value = mock_commit_result
+        hunter.github_client.graphql.return_value = {
+            'createCommitOnBranch': {'commit': {'oid': 'commit_sha'}}
+        }
         
         # Make PR creation fail
         mock_repo.create_pull.side_effect = GithubException(400, "Cannot create PR", None)
@@ -275,9 +296,10 @@ class TestYoloHunter:
         mock_branch.commit.sha = "base_sha"
         mock_repo.get_branch.return_value = mock_branch
         
-        # Mock file creation
-        mock_commit_result = {'commit': Mock(sha='commit_sha')}
-        mock_repo.create_file.return_value = mock_commit_result
+        # Mock branch + file creation
+        hunter.github_client.graphql.return_value = {
+            'createCommitOnBranch': {'commit': {'oid': 'commit_sha'}}
+        }
         
         # Mock PR
         mock_pr = Mock()
@@ -313,9 +335,10 @@ class TestYoloHunter:
         mock_branch.commit.sha = "base_sha"
         mock_repo.get_branch.return_value = mock_branch
         
-        # Mock file creation
-        mock_commit_result = {'commit': Mock(sha='commit_sha')}
-        mock_repo.create_file.return_value = mock_commit_result
+        # Mock branch + file creation
+        hunter.github_client.graphql.return_value = {
+            'createCommitOnBranch': {'commit': {'oid': 'commit_sha'}}
+        }
         
         # Mock PR
         mock_pr = Mock()
@@ -338,6 +361,8 @@ class TestYoloHunter:
         
         # Should still succeed even if branch deletion fails
         assert result is True
+        hunter._cleanup_future.result(timeout=5)
+        mock_repo.get_git_ref.assert_called_once_with('heads/yolo-achievement-1234567890')
     
     def test_execute_updates_progress_correctly(self, hunter):
         """Test that progress is updated with correct information"""
@@ -349,8 +374,9 @@ class TestYoloHunter:
         mock_branch.commit.sha = "base_sha"
         mock_repo.get_branch.return_value = mock_branch
         
-        mock_commit_result = {'commit': Mock(sha='commit_sha_123')}
-        mock_repo.create_file.return_value = mock_commit_result
+        hunter.github_client.graphql.return_value = {
+            'createCommitOnBranch': {'commit': {'oid': 'commit_sha_123'}}
+        }
         
         mock_pr = Mock()
         mock_pr.number = 456
@@ -3,7 +3,9 @@ Test module for logger and error handling functionality.
 """
 
 import logging
+import logging.handlers
 import os
+import pickle
 import pytest
 import tempfile
 import time
@@ -14,7 +16,8 @@ from unittest.mock import patch, MagicMock
 from github_achievement_hunter.utils.logger import (
     AchievementLogger, LoggerError, ConfigurationError, APIError,
     LoggerRateLimitError, LoggerAuthenticationError, ValidationError,
-    log_context, suppress_and_log, log_errors, log_execution_time
+    log_context, suppress_and_log, log_errors, log_execution_time,
+    _sanitize_args, _sanitize_kwargs
 )
 
 
@@ -54,6 +57,8 @@ class TestAchievementLogger:
             logger.error("Error message")
             logger.critical("Critical message")
             
+            logger.flush()
+            
             # Verify log file was created
             log_files = list(Path(tmp_dir).glob('achievement_hunter_*.log'))
             assert len(log_files) == 1
@@ -73,6 +78,8 @@ class TestAchievementLogger:
             logger = AchievementLogger(log_dir=tmp_dir, file_output=True, force_reinit=True)
             logger.info("Test message")
             
+            logger.flush()
+            
             # Check log file exists
             log_files = list(Path(tmp_dir).glob('achievement_hunter_*.log'))
             assert len(log_files) == 1
@@ -106,9 +113,20 @@ class TestAchievementLogger:
                 force_reinit=True
             )
             
-            # Should have only file handler
+            # Should have only the buffered rotating file handler
             assert len(logger.logger.handlers) == 1
-            assert isinstance(logger.logger.handlers[0], logging.FileHandler)
+            handler = logger.logger.handlers[0]
+            assert isinstance(handler, logging.handlers.MemoryHandler)
+            assert isinstance(handler.target, logging.handlers.RotatingFileHandler)
+    
+    def test_default_logger_is_lazy_singleton(self):
+        """Test the default logger is created on demand and shared."""
+        from github_achievement_hunter.utils import logger as logger_module
+        
+        default = logger_module.get_default_logger()
+        assert default is logger_module.get_default_logger()
+        assert logger_module.default_logger is default
+        assert isinstance(default, AchievementLogger)
     
     def test_get_logger(self):
         """Test get_logger returns correct logger instance."""
@@ -118,6 +136,13 @@ class TestAchievementLogger:
         assert isinstance(raw_logger, logging.Logger)
         assert raw_logger.name == 'github_achievement_hunter'
     
+    def test_level_methods_bound_to_logger(self):
+        """Test level wrappers are the underlying logger's bound methods."""
+        logger = AchievementLogger(console_output=False, file_output=False, force_reinit=True)
+        
+        for level in ('debug', 'info', 'warning', 'error', 'critical'):
+            assert getattr(logger, level) == getattr(logger.logger, level)
+    
     def test_error_with_exception_info(self):
         """Test error logging with exception information."""
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -128,6 +153,8 @@ class TestAchievementLogger:
             except ValueError:
                 logger.error("Error occurred", exc_info=True)
             
+            logger.flush()
+            
             # Check that traceback is in log
             log_files = list(Path(tmp_dir).glob('achievement_hunter_*.log'))
             with open(log_files[0], 'r') as f:
@@ -172,6 +199,17 @@ class TestCustomExceptions:
         assert str(error) == "Auth failed"
         assert error.status_code == 401
     
+    def test_exceptions_pickle_round_trip(self):
+        """Test slotted exception attributes survive pickling."""
+        reset_time = datetime(2024, 1, 1, 12, 0, 0)
+        error = pickle.loads(pickle.dumps(LoggerRateLimitError("Rate limited", reset_time=reset_time)))
+        assert str(error) == "Rate limited"
+        assert error.status_code == 429
+        assert error.reset_time == reset_time
+        
+        error = pickle.loads(pickle.dumps(ValidationError("Invalid data", field="username")))
+        assert error.field == "username"
+    
     def test_validation_error(self):
         """Test ValidationError exception."""
         error = ValidationError("Invalid data", field="username")
@@ -190,6 +228,8 @@ class TestContextManagers:
             with log_context("Test operation", logger):
                 pass  # Successful operation
             
+            logger.flush()
+            
             # Check logs
             log_files = list(Path(tmp_dir).glob('achievement_hunter_*.log'))
             with open(log_files[0], 'r') as f:
@@ -206,6 +246,8 @@ class TestContextManagers:
                 with log_context("Failing operation", logger):
                     raise ValueError("Test error")
             
+            logger.flush()
+            
             # Check logs
             log_files = list(Path(tmp_dir).glob('achievement_hunter_*.log'))
             with open(log_files[0], 'r') as f:
@@ -222,6 +264,8 @@ class TestContextManagers:
             with suppress_and_log((ValueError,), logger, "Handled error"):
                 raise ValueError("This should be suppressed")
             
+            logger.flush()
+            
             # Check logs
             log_files = list(Path(tmp_dir).glob('achievement_hunter_*.log'))
             with open(log_files[0], 'r') as f:
@@ -254,6 +298,8 @@ class TestDecorators:
             with pytest.raises(ZeroDivisionError):
                 failing_function(10, 0)
             
+            logger.flush()
+            
             # Check logs
             log_files = list(Path(tmp_dir).glob('achievement_hunter_*.log'))
             with open(log_files[0], 'r') as f:
@@ -286,6 +332,8 @@ class TestDecorators:
             result = slow_function()
             assert result == "done"
             
+            logger.flush()
+            
             # Check logs
             log_files = list(Path(tmp_dir).glob('achievement_hunter_*.log'))
             with open(log_files[0], 'r') as f:
@@ -304,6 +352,8 @@ class TestDecorators:
             
             function_with_secrets("user", "secret123", "token123")
             
+            logger.flush()
+            
             # Check logs
             log_files = list(Path(tmp_dir).glob('achievement_hunter_*.log'))
             with open(log_files[0], 'r') as f:
@@ -312,6 +362,14 @@ class TestDecorators:
                 assert "token123" not in content
                 assert "***" in content
 
+    
+    def test_sanitize_helpers(self):
+        """Test argument sanitizers redact sensitive names and string values only."""
+        assert _sanitize_kwargs({'API_KEY': 'k', 'apiKey': 'a', 'auth_header': 'h', 'user': 'u'}) == {
+            'API_KEY': '***', 'apiKey': '***', 'auth_header': '***', 'user': 'u'
+        }
+        assert _sanitize_args(('my-secret', 42, {'key': 1})) == ('***', 42, {'key': 1})
+
 
 class TestLoggerErrorHandling:
     """Test error handling in logger initialization."""
@@ -339,6 +397,8 @@ class TestIntegration:
                     logger.info("Step 2.1")
                 logger.info("Step 1.2")
             
+            logger.flush()
+            
             # Verify all operations were logged
             log_files = list(Path(tmp_dir).glob('achievement_hunter_*.log'))
             with open(log_files[0], 'r') as f:
@@ -58,6 +58,7 @@ class TestGitHubAuthenticator:
         
         assert auth.username == "testuser"
         assert auth._token == valid_token
+        assert auth.token == valid_token
         mock_github_client.get_user.assert_called_once()
     
     @patch('github_achievement_hunter.utils.auth.Github')
@@ -1,7 +1,9 @@
 import pytest
 import os
+import sys
 import tempfile
 import yaml
+from collections.abc import Mapping
 from pathlib import Path
 from unittest.mock import patch
 
@@ -34,6 +36,7 @@ class TestConfigLoader:
         
         # Cleanup
         os.unlink(temp_path)
+        Path(temp_path + '.cache.json').unlink(missing_ok=True)
     
     @pytest.fixture
     def config_with_env_vars(self):
@@ -58,6 +61,7 @@ class TestConfigLoader:
         
         # Cleanup
         os.unlink(temp_path)
+        Path(temp_path + '.cache.json').unlink(missing_ok=True)
     
     def test_load_valid_config(self, temp_config_file):
         """Test loading a valid configuration file."""
@@ -80,7 +84,7 @@ class TestConfigLoader:
         
         try:
             with pytest.raises(ConfigError, match="Error parsing YAML file"):
-                ConfigLoader(temp_path)
+                ConfigLoader(temp_path, use_cache=False)
         finally:
             os.unlink(temp_path)
     
@@ -126,7 +130,7 @@ class TestConfigLoader:
         
         try:
             with pytest.raises(ConfigError, match="Required configuration field missing"):
-                ConfigLoader(temp_path)
+                ConfigLoader(temp_path, use_cache=False)
         finally:
             os.unlink(temp_path)
     
@@ -146,7 +150,7 @@ class TestConfigLoader:
         
         try:
             with pytest.raises(ConfigError, match="must be a positive integer"):
-                ConfigLoader(temp_path)
+                ConfigLoader(temp_path, use_cache=False)
         finally:
             os.unlink(temp_path)
     
@@ -169,7 +173,7 @@ class TestConfigLoader:
         
         try:
             with pytest.raises(ConfigError, match="javascript repositories must be a positive integer"):
-                ConfigLoader(temp_path)
+                ConfigLoader(temp_path, use_cache=False)
         finally:
             os.unlink(temp_path)
     
@@ -194,15 +198,37 @@ class TestConfigLoader:
         loader.set('new.nested.value', 'test')
         assert loader.get('new.nested.value') == 'test'
     
+    def test_get_cache_invalidated_by_set(self, temp_config_file):
+        """Test memoized lookups reflect later set() calls."""
+        loader = ConfigLoader(temp_config_file)
+        
+        assert loader.get('achievements.stars') == 10
+        assert loader.get('achievements.stars') == 10
+        
+        loader.set('achievements', {'stars': 77})
+        assert loader.get('achievements.stars') == 77
+    
     def test_get_all(self, temp_config_file):
         """Test getting the entire configuration."""
         loader = ConfigLoader(temp_config_file)
         config = loader.get_all()
         
-        assert isinstance(config, dict)
+        assert isinstance(config, Mapping)
         assert 'github' in config
         assert config['github']['token'] == 'test_token_123'
     
+    def test_get_all_is_frozen_and_shared(self, temp_config_file):
+        """Test get_all returns a shared read-only snapshot refreshed by set()."""
+        loader = ConfigLoader(temp_config_file)
+        config = loader.get_all()
+        
+        assert loader.get_all() is config
+        with pytest.raises(TypeError):
+            config['github']['token'] = 'changed'
+        
+        loader.set('github.token', 'new_token')
+        assert loader.get_all()['github']['token'] == 'new_token'
+    
     def test_default_values_applied(self):
         """Test that default values are applied."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
@@ -216,7 +242,7 @@ class TestConfigLoader:
             temp_path = f.name
         
         try:
-            loader = ConfigLoader(temp_path)
+            loader = ConfigLoader(temp_path, use_cache=False)
             
             # Check default values
             assert loader.get('logging.level') == 'INFO'
@@ -227,6 +253,37 @@ class TestConfigLoader:
         finally:
             os.unlink(temp_path)
     
+    def test_defaults_not_shared_between_loaders(self, temp_config_file):
+        """Test that mutating one loader's config leaves the class defaults intact."""
+        loader = ConfigLoader(temp_config_file, use_cache=False)
+        loader.set('cache.ttl', 1)
+        
+        other = ConfigLoader(temp_config_file, use_cache=False)
+        assert other.get('cache.ttl') == 3600
+        assert dict(ConfigLoader._FLAT_DEFAULTS)['cache.ttl'] == 3600
+    
+    def test_defaults_respect_user_values(self):
+        """Test defaults never replace user values, including None and scalars."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            config = {
+                'github': {'token': 'test_token'},
+                'target': {'username': 'testuser'},
+                'achievements': {'stars': 10},
+                'cache': False,
+                'advanced': {'timeout': None}
+            }
+            yaml.dump(config, f)
+            temp_path = f.name
+        
+        try:
+            loader = ConfigLoader(temp_path, use_cache=False)
+            
+            assert loader.get('cache') is False
+            assert loader.get('advanced.timeout') is None
+            assert loader.get('advanced.debug') is False
+        finally:
+            os.unlink(temp_path)
+        
     def test_reload_configuration(self, temp_config_file):
         """Test reloading configuration."""
         loader = ConfigLoader(temp_config_file)
@@ -247,6 +304,71 @@ class TestConfigLoader:
         assert loader.get('achievements.stars') == 999
         assert loader.get('achievements.stars') != original_value
     
+    def test_cache_written_and_reused(self, temp_config_file):
+        """Test parsed YAML is cached and reused while the file is unchanged."""
+        ConfigLoader(temp_config_file)
+        assert Path(temp_config_file + '.cache.json').exists()
+        
+        with patch('yaml.load') as mock_load:
+            loader = ConfigLoader(temp_config_file)
+        
+        mock_load.assert_not_called()
+        assert loader.get('achievements.stars') == 10
+    
+    def test_cache_hit_does_not_import_yaml(self, temp_config_file):
+        """Test a cache-hit load never imports PyYAML."""
+        ConfigLoader(temp_config_file)
+        
+        with patch.dict(sys.modules):
+            del sys.modules['yaml']
+            loader = ConfigLoader(temp_config_file)
+            
+            assert 'yaml' not in sys.modules
+        assert loader.get('achievements.stars') == 10
+    
+    def test_cache_invalidated_on_change(self, temp_config_file):
+        """Test a stale cache is ignored after the YAML file changes."""
+        ConfigLoader(temp_config_file)
+        
+        with open(temp_config_file, 'r') as f:
+            config = yaml.safe_load(f)
+        config['achievements']['stars'] = 12345
+        with open(temp_config_file, 'w') as f:
+            yaml.dump(config, f)
+        
+        loader = ConfigLoader(temp_config_file)
+        
+        assert loader.get('achievements.stars') == 12345
+    
+    def test_cache_disabled(self, temp_config_file):
+        """Test no sidecar cache is written when use_cache is False."""
+        ConfigLoader(temp_config_file, use_cache=False)
+        
+        assert not Path(temp_config_file + '.cache.json').exists()
+    
+    def test_get_instance_shared(self, temp_config_file):
+        """Test get_instance returns one shared loader per unchanged file."""
+        first = ConfigLoader.get_instance(temp_config_file)
+        second = ConfigLoader.get_instance(temp_config_file)
+        
+        assert first is second
+    
+    def test_get_instance_reloads_on_change(self, temp_config_file):
+        """Test get_instance builds a new loader after the file changes."""
+        first = ConfigLoader.get_instance(temp_config_file)
+        
+        stat = os.stat(temp_config_file)
+        os.utime(temp_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        second = ConfigLoader.get_instance(temp_config_file)
+        
+        assert first is not second
+        assert len([k for k in ConfigLoader._INSTANCES if k[0] == str(Path(temp_config_file).resolve())]) == 1
+    
+    def test_get_instance_missing_file(self):
+        """Test get_instance raises ConfigError for a missing file."""
+        with pytest.raises(ConfigError, match="Configuration file not found"):
+            ConfigLoader.get_instance('nonexistent.yaml')
+    
     def test_validation_invalid_database_type(self):
         """Test validation fails for invalid database type."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
@@ -261,7 +383,7 @@ class TestConfigLoader:
         
         try:
             with pytest.raises(ConfigError, match="Invalid database type"):
-                ConfigLoader(temp_path)
+                ConfigLoader(temp_path, use_cache=False)
         finally:
             os.unlink(temp_path)
     
@@ -279,7 +401,7 @@ class TestConfigLoader:
         
         try:
             with pytest.raises(ConfigError, match="Invalid log level"):
-                ConfigLoader(temp_path)
+                ConfigLoader(temp_path, use_cache=False)
         finally:
             os.unlink(temp_path)
     
@@ -297,12 +419,12 @@ class TestConfigLoader:
         
         try:
             with pytest.raises(ConfigError, match="Dashboard port must be between"):
-                ConfigLoader(temp_path)
+                ConfigLoader(temp_path, use_cache=False)
         finally:
             os.unlink(temp_path)
     
-    def test_deep_merge(self, temp_config_file):
-        """Test deep merge functionality for defaults."""
+    def test_nested_override_keeps_sibling_defaults(self):
+        """Test a nested override keeps the defaults of its siblings."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
             config = {
                 'github': {
@@ -319,7 +441,7 @@ class TestConfigLoader:
             temp_path = f.name
         
         try:
-            loader = ConfigLoader(temp_path)
+            loader = ConfigLoader(temp_path, use_cache=False)
             
             # Check overridden value
             assert loader.get('github.rate_limit.requests_per_hour') == 3000
@@ -336,7 +458,7 @@ class TestConfigLoader:
         
         try:
             with pytest.raises(ConfigError, match="Required configuration field missing"):
-                ConfigLoader(temp_path)
+                ConfigLoader(temp_path, use_cache=False)
         finally:
             os.unlink(temp_path)
     
@@ -363,7 +485,7 @@ class TestConfigLoader:
         os.environ['WEBHOOK_TOKEN'] = 'secret123'
         
         try:
-            loader = ConfigLoader(temp_path)
+            loader = ConfigLoader(temp_path, use_cache=False)
             
             assert loader.get('notifications.webhook.url') == 'https://example.com/webhook'
             assert loader.get('notifications.webhook.headers.Authorization') == 'Bearer secret123'
@@ -11,8 +11,7 @@ from unittest.mock import Mock, patch, MagicMock, call
 
 import pytest
 from github import GithubException, RateLimitExceededException
-from github.GithubException import BadCredentialsException
-from tenacity import RetryError
+from github.GithubException import BadCredentialsException, UnknownObjectException
 
 from github_achievement_hunter.utils.auth import GitHubAuthenticator
 from github_achievement_hunter.utils.github_client import GitHubClient
@@ -26,6 +25,7 @@ class TestGitHubClient:
         """Create a mock GitHubAuthenticator."""
         auth = Mock(spec=GitHubAuthenticator)
         auth.username = "testuser"
+        auth.token = "test_token"
         auth.get_client.return_value = Mock()
         return auth
     
@@ -40,12 +40,12 @@ class TestGitHubClient:
         
         assert client.username == "testuser"
         assert client.rate_limit_buffer == 50
-        assert client._last_rate_check == 0
+        assert client._last_rate_check == float('-inf')
         mock_auth.get_client.assert_called_once()
     
     def test_check_rate_limit_skip_recent_check(self, github_client):
         """Test that rate limit check is skipped if recently checked."""
-        github_client._last_rate_check = time.time() - 30  # 30 seconds ago
+        github_client._last_rate_check = time.monotonic() - 30  # 30 seconds ago
         
         with patch.object(github_client.client, 'get_rate_limit') as mock_get_rate:
             github_client._check_rate_limit()
@@ -53,6 +53,60 @@ class TestGitHubClient:
         # Should not check rate limit since it was checked recently
         mock_get_rate.assert_not_called()
     
+    def test_close_shuts_down_executor(self, mock_auth):
+        """Test closing the client, directly or via ``with``, stops its worker threads."""
+        with GitHubClient(mock_auth) as client, patch.object(client, '_check_rate_limit'):
+            assert client.map_api_calls(lambda item: item * 2, [1, 2]) == [2, 4]
+        
+        with pytest.raises(RuntimeError):
+            client._executor.submit(print)
+        with pytest.raises(RuntimeError):
+            client._page_executor.submit(print)
+        
+        # Closing again is a no-op
+        client.close()
+    
+    def test_check_rate_limit_uses_response_headers(self, github_client):
+        """Test routine checks read recorded headers instead of calling /rate_limit."""
+        github_client.client.rate_limiting = (4000, 5000)
+        github_client.client.rate_limiting_resettime = int(time.time()) + 60
+        
+        with patch.object(github_client.client, 'get_rate_limit') as mock_get_rate:
+            github_client._check_rate_limit()
+        
+        mock_get_rate.assert_not_called()
+        assert github_client._last_rate_check > float('-inf')
+    
+    def test_check_rate_limit_headers_low_sleeps(self, github_client):
+        """Test a low header-reported limit triggers a sleep until reset."""
+        github_client.client.rate_limiting = (5, 5000)
+        github_client.client.rate_limiting_resettime = int(time.time()) + 2
+        
+        mock_rate_limit_after = Mock()
+        mock_rate_limit_after.core.remaining = 5000
+        
+        with patch.object(github_client.client, 'get_rate_limit',
+                         return_value=mock_rate_limit_after), \
+             patch('time.sleep') as mock_sleep:
+            github_client._check_rate_limit()
+        
+        mock_sleep.assert_called_once()
+        assert 1 <= mock_sleep.call_args[0][0] <= 3
+    
+    def test_check_rate_limit_unusable_headers_fall_back(self, github_client):
+        """Test unexpected recorded values fall back to a /rate_limit query."""
+        mock_rate_limit = Mock()
+        mock_rate_limit.core.remaining = 100
+        mock_rate_limit.core.limit = 5000
+        github_client.client.get_rate_limit.return_value = mock_rate_limit
+        github_client._last_rate_check = float('-inf')
+        
+        # The client is a plain Mock, so rate_limiting cannot be unpacked
+        github_client._check_rate_limit()
+        
+        github_client.client.get_rate_limit.assert_called_once()
+        assert github_client._last_rate_check > float('-inf')
+    
     def test_check_rate_limit_force_check(self, github_client):
         """Test forced rate limit check."""
         mock_rate_limit = Mock()
@@ -63,7 +117,7 @@ class TestGitHubClient:
             github_client._check_rate_limit(force_check=True)
         
         # Should update last check time
-        assert github_client._last_rate_check > 0
+        assert github_client._last_rate_check > float('-inf')
     
     def test_check_rate_limit_sleep_when_low(self, github_client):
         """Test that client sleeps when rate limit is low."""
@@ -118,11 +172,12 @@ class TestGitHubClient:
         ])
         
         with patch.object(github_client, '_check_rate_limit'):
-            with patch('time.sleep'):  # Speed up test
+            with patch('time.sleep') as mock_sleep:  # Speed up test
                 result = github_client.api_call_with_retry(mock_func)
         
         assert result == "success"
         assert mock_func.call_count == 3
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [4, 4]
     
     def test_api_call_with_retry_permanent_failure(self, github_client):
         """Test API call retry exhaustion."""
@@ -130,12 +185,181 @@ class TestGitHubClient:
         
         with patch.object(github_client, '_check_rate_limit'):
             with patch('time.sleep'):  # Speed up test
-                # Tenacity wraps the exception in RetryError after exhausting retries
-                with pytest.raises(Exception):  # Could be RetryError or GithubException
+                with pytest.raises(GithubException):
                     github_client.api_call_with_retry(mock_func)
         
         assert mock_func.call_count == 3  # Should try 3 times
     
+    def test_api_call_with_retry_skips_check_between_intervals(self, github_client):
+        """Test the rate limit check only runs every CHECK_EVERY_OPS calls."""
+        github_client._last_rate_check = time.monotonic()
+        
+        with patch.object(github_client, '_check_rate_limit') as mock_check:
+            for _ in range(github_client.CHECK_EVERY_OPS - 1):
+                github_client.api_call_with_retry(Mock(return_value=None))
+            mock_check.assert_not_called()
+            
+            github_client.api_call_with_retry(Mock(return_value=None))
+            mock_check.assert_called_once()
+    
+    def test_graphql_success(self, github_client):
+        """Test GraphQL request returns the data section."""
+        mock_response = Mock(status_code=200)
+        mock_response.json.return_value = {'data': {'viewer': {'login': 'testuser'}}}
+        
+        with patch.object(github_client, '_check_rate_limit'), \
+             patch('github_achievement_hunter.utils.github_client.requests.post',
+                   return_value=mock_response) as mock_post:
+            result = github_client.graphql("query { viewer { login } }", {'a': 1})
+        
+        assert result == {'viewer': {'login': 'testuser'}}
+        _, kwargs = mock_post.call_args
+        assert kwargs['json'] == {'query': "query { viewer { login } }", 'variables': {'a': 1}}
+        assert kwargs['headers']['Authorization'] == 'Bearer test_token'
+        assert kwargs['timeout'] == github_client.GRAPHQL_TIMEOUT
+    
+    def test_graphql_errors(self, github_client):
+        """Test GraphQL errors are raised as GithubException without retrying."""
+        mock_response = Mock(status_code=200)
+        mock_response.json.return_value = {'errors': [{'message': 'Bad query'}]}
+        
+        with patch.object(github_client, '_check_rate_limit'), \
+             patch('github_achievement_hunter.utils.github_client.requests.post',
+                   return_value=mock_response) as mock_post, \
+             patch('time.sleep'):
+            with pytest.raises(GithubException):
+                github_client.graphql("query { bad }")
+        
+        mock_post.assert_called_once()
+    
+    def test_bulk_execute_batches_operations(self, github_client):
+        """Test operations are aliased and packed into batched requests."""
+        def fake_post(payload):
+            count = payload['query'].count(': op')
+            return {'data': {f'm{i}': {'n': i} for i in range(count)}}
+        
+        with patch.object(github_client, '_check_rate_limit'), \
+             patch.object(github_client, '_post_graphql', side_effect=fake_post) as mock_post:
+            results, errors = github_client.bulk_execute(['op { a }'] * 5, batch_size=2)
+        
+        assert mock_post.call_count == 3
+        first_query = mock_post.call_args_list[0][0][0]['query']
+        assert first_query.startswith('mutation {')
+        assert 'm0: op { a }' in first_query and 'm1: op { a }' in first_query
+        assert results == [{'n': 0}, {'n': 1}, {'n': 0}, {'n': 1}, {'n': 0}]
+        assert errors == {}
+    
+    def test_bulk_execute_partial_failure(self, github_client):
+        """Test a failed operation is reported per alias and the batch is not retried."""
+        response = {
+            'data': {'m0': {'n': 0}, 'm1': None, 'm2': {'n': 2}},
+            'errors': [{'path': ['m1'], 'message': 'Could not resolve'}]
+        }
+        
+        with patch.object(github_client, '_check_rate_limit'), \
+             patch.object(github_client, '_post_graphql', return_value=response) as mock_post, \
+             patch('time.sleep'):
+            results, errors = github_client.bulk_execute(['op { a }'] * 3)
+        
+        mock_post.assert_called_once()
+        assert results == [{'n': 0}, None, {'n': 2}]
+        assert errors == {1: 'Could not resolve'}
+    
+    def test_bulk_execute_document_error(self, github_client):
+        """Test an error not tied to an operation fails the whole request."""
+        response = {'errors': [{'message': 'Parse error'}]}
+        
+        with patch.object(github_client, '_check_rate_limit'), \
+             patch.object(github_client, '_post_graphql', return_value=response) as mock_post:
+            with pytest.raises(GithubException):
+                github_client.bulk_execute(['op { a }'])
+        
+        mock_post.assert_called_once()
+    
+    def test_create_issues_bulk(self, github_client):
+        """Test bulk issue creation through one GraphQL request."""
+        github_client.client.get_repo.return_value = Mock(node_id='R_1')
+        
+        with patch.object(github_client, '_check_rate_limit'), \
+             patch.object(github_client, '_post_graphql', return_value={'data': {
+                 'm0': {'issue': {'id': 'I_1', 'number': 1, 'url': 'u1'}},
+                 'm1': {'issue': {'id': 'I_2', 'number': 2, 'url': 'u2'}}
+             }}) as mock_post:
+            issues = github_client.create_issues_bulk(
+                'owner/repo', [{'title': 'One'}, {'title': 'Two "quoted"', 'body': 'b'}]
+            )
+        
+        assert [issue['number'] for issue in issues] == [1, 2]
+        query = mock_post.call_args[0][0]['query']
+        assert 'repositoryId: "R_1"' in query
+        assert 'title: "Two \\"quoted\\""' in query
+    
+    def test_create_issues_bulk_skips_failed(self, github_client):
+        """Test rejected issues are left out without recreating the others."""
+        github_client.client.get_repo.return_value = Mock(node_id='R_1')
+        
+        with patch.object(github_client, '_check_rate_limit'), \
+             patch.object(github_client, '_post_graphql', return_value={
+                 'data': {'m0': {'issue': {'id': 'I_1', 'number': 1, 'url': 'u1'}}, 'm1': None},
+                 'errors': [{'path': ['m1'], 'message': 'Title is too long'}]
+             }) as mock_post:
+            issues = github_client.create_issues_bulk(
+                'owner/repo', [{'title': 'One'}, {'title': 'Two'}]
+            )
+        
+        mock_post.assert_called_once()
+        assert [issue['number'] for issue in issues] == [1]
+    
+    def test_close_issues_bulk(self, github_client):
+        """Test bulk issue closing looks up IDs then closes in one mutation."""
+        with patch.object(github_client, '_check_rate_limit'), \
+             patch.object(github_client, '_post_graphql', side_effect=[
+                 {'data': {'m0': {'issue': {'id': 'I_5'}}, 'm1': {'issue': {'id': 'I_6'}}}},
+                 {'data': {'m0': {'issue': {'number': 5}}, 'm1': {'issue': {'number': 6}}}}
+             ]) as mock_post:
+            github_client.close_issues_bulk('owner/repo', [5, 6])
+        
+        lookup_query, close_query = (c[0][0]['query'] for c in mock_post.call_args_list)
+        assert lookup_query.startswith('query {')
+        assert 'issue(number: 5)' in lookup_query
+        assert 'closeIssue(input: {issueId: "I_6"})' in close_query
+    
+    def test_get_repo_cached(self, github_client):
+        """Test repository lookups are cached until the TTL expires."""
+        first = github_client._get_repo('owner/repo')
+        second = github_client._get_repo('owner/repo')
+        
+        assert first is second
+        github_client.client.get_repo.assert_called_once_with('owner/repo')
+        
+        github_client._repo_cache['owner/repo'] = (
+            time.monotonic() - github_client.REPO_CACHE_TTL - 1, first
+        )
+        github_client._get_repo('owner/repo')
+        assert github_client.client.get_repo.call_count == 2
+    
+    def test_repository_exists(self, github_client):
+        """Test repository existence is checked with one direct lookup."""
+        assert github_client.repository_exists('test-repo') is True
+        github_client.client.get_repo.assert_called_once_with('testuser/test-repo')
+        
+        github_client.client.get_repo.side_effect = UnknownObjectException(404, {}, {})
+        assert github_client.repository_exists('missing-repo') is False
+    
+    def test_get_user_cached(self, github_client):
+        """Test the authenticated user is fetched once."""
+        assert github_client._get_user() is github_client._get_user()
+        github_client.client.get_user.assert_called_once_with()
+    
+    def test_delete_repository_evicts_cache(self, github_client):
+        """Test deleting a repository evicts it from the repo cache."""
+        github_client._get_repo('testuser/test-repo')
+        
+        with patch.object(github_client, '_check_rate_limit'):
+            github_client.delete_repository('test-repo')
+        
+        assert 'testuser/test-repo' not in github_client._repo_cache
+    
     def test_create_repository(self, github_client):
         """Test repository creation."""
         mock_user = Mock()
@@ -358,6 +582,77 @@ class TestGitHubClient:
         assert repos == mock_repos
         assert len(repos) == 2
     
+    def test_get_user_repositories_fetches_pages_concurrently(self, github_client):
+        """Test paginated repositories are fetched page by page in parallel."""
+        from github.PaginatedList import PaginatedList
+        
+        github_client.client.per_page = 2
+        paginated = Mock(spec=PaginatedList)
+        paginated.totalCount = 5
+        paginated.get_page.side_effect = lambda n: [f'repo{n}a', f'repo{n}b'][:5 - 2 * n]
+        mock_user = Mock()
+        mock_user.get_repos.return_value = paginated
+        
+        with patch.object(github_client, '_check_rate_limit'), \
+             patch.object(github_client.client, 'get_user', return_value=mock_user):
+            repos = github_client.get_user_repositories()
+        
+        assert repos == ['repo0a', 'repo0b', 'repo1a', 'repo1b', 'repo2a']
+        assert sorted(c[0][0] for c in paginated.get_page.call_args_list) == [0, 1, 2]
+    
+    def test_paginated_fetch_inside_map_api_calls(self, github_client):
+        """Test page fetches from mapped calls can't exhaust the shared workers."""
+        from github.PaginatedList import PaginatedList
+        
+        github_client.client.per_page = 1
+        
+        def fetch(user):
+            paginated = Mock(spec=PaginatedList)
+            paginated.totalCount = 2
+            paginated.get_page.side_effect = lambda n: [f'{user}-{n}']
+            return github_client._fetch_all_pages(paginated)
+        
+        users = [f'user{i}' for i in range(github_client.MAX_WORKERS * 2)]
+        with patch.object(github_client, '_check_rate_limit'):
+            results = github_client.map_api_calls(fetch, users)
+        
+        assert results == [[f'{user}-0', f'{user}-1'] for user in users]
+    
+    def test_iter_user_repositories_streams(self, github_client):
+        """Test repositories are streamed lazily, retrying each page."""
+        from github.PaginatedList import PaginatedList
+        
+        github_client.client.per_page = 2
+        paginated = Mock(spec=PaginatedList)
+        paginated.get_page.side_effect = [
+            ['repo0a', 'repo0b'],
+            GithubException(502, 'Bad gateway', None),
+            ['repo1a']
+        ]
+        mock_user = Mock()
+        mock_user.get_repos.return_value = paginated
+        
+        with patch.object(github_client, '_check_rate_limit'), \
+             patch.object(github_client.client, 'get_user', return_value=mock_user), \
+             patch('time.sleep'):
+            repos = github_client.iter_user_repositories()
+            
+            # Nothing is fetched until the iterator is consumed
+            mock_user.get_repos.assert_not_called()
+            assert next(repos) == 'repo0a'
+            assert paginated.get_page.call_count == 1
+            
+            assert list(repos) == ['repo0b', 'repo1a']
+        
+        assert [c[0][0] for c in paginated.get_page.call_args_list] == [0, 1, 1]
+    
+    def test_map_api_calls(self, github_client):
+        """Test API calls are mapped over items preserving order."""
+        with patch.object(github_client, '_check_rate_limit'):
+            results = github_client.map_api_calls(lambda x: x * 2, [1, 2, 3])
+        
+        assert results == [2, 4, 6]
+    
     def test_get_rate_limit_info(self, github_client):
         """Test getting rate limit information."""
         mock_rate_limit = Mock()
@@ -5,6 +5,8 @@ This module tests the ProgressTracker class including atomic writes,
 backup functionality, and recovery mechanisms.
 """
 
+import errno
+import gc
 import json
 import os
 import shutil
@@ -15,7 +17,9 @@ from unittest.mock import Mock, patch, mock_open
 
 import pytest
 
-from github_achievement_hunter.utils.progress_tracker import ProgressTracker, ProgressError
+from github_achievement_hunter.utils.progress_tracker import (
+    ProgressTracker, ProgressError, _flush_live_trackers
+)
 
 
 class TestProgressTracker:
@@ -26,6 +30,8 @@ class TestProgressTracker:
         """Create a temporary directory for test files."""
         with tempfile.TemporaryDirectory() as tmpdir:
             yield tmpdir
+            # Save pending updates now; saved later, they would recreate tmpdir
+            _flush_live_trackers()
     
     @pytest.fixture
     def tracker(self, temp_dir):
@@ -73,6 +79,7 @@ class TestProgressTracker:
         """Test atomic save functionality."""
         # Update some data
         tracker.update_achievement('pull_shark', {'count': 10})
+        tracker.flush()
         
         # Check file was created
         assert os.path.exists(tracker.progress_file)
@@ -84,13 +91,48 @@ class TestProgressTracker:
         assert saved_data['achievements']['pull_shark']['count'] == 10
         assert 'last_updated' in saved_data['metadata']
     
+    @pytest.mark.skipif(os.name != 'posix', reason="POSIX file permissions")
+    def test_saved_file_is_private(self, tracker):
+        """Test the progress file is only readable by its owner."""
+        tracker.update_achievement('pull_shark', {'count': 10})
+        tracker.flush()
+        
+        assert os.stat(tracker.progress_file).st_mode & 0o777 == 0o600
+    
+    def test_save_recreates_removed_directory(self, temp_dir):
+        """Test saving recreates a progress directory removed after creation."""
+        progress_dir = os.path.join(temp_dir, 'state')
+        tracker = ProgressTracker(os.path.join(progress_dir, 'test_progress.json'))
+        shutil.rmtree(progress_dir)
+        
+        tracker.update_achievement('pull_shark', {'count': 3})
+        tracker.flush()
+        
+        with open(tracker.progress_file, 'r') as f:
+            assert json.load(f)['achievements']['pull_shark']['count'] == 3
+    
+    def test_created_dirs_are_resolved(self, temp_dir, monkeypatch):
+        """Test relative directories are created again after a chdir."""
+        first, second = os.path.join(temp_dir, 'a'), os.path.join(temp_dir, 'b')
+        os.makedirs(first)
+        os.makedirs(second)
+        
+        monkeypatch.chdir(first)
+        ProgressTracker(os.path.join('state', 'test_progress.json'))
+        monkeypatch.chdir(second)
+        ProgressTracker(os.path.join('state', 'test_progress.json'))
+        
+        assert os.path.isdir(os.path.join(second, 'state'))
+    
     def test_save_creates_backup(self, tracker, temp_dir):
         """Test that saving creates backups."""
         # First save
         tracker.update_achievement('quickdraw', {'completed': True})
+        tracker.flush()
         
         # Second save should create backup
         tracker.update_achievement('yolo', {'completed': True})
+        tracker.flush()
         
         # Check backup exists
         backup_files = list(tracker.backup_dir.glob('progress_*.json'))
@@ -104,6 +146,43 @@ class TestProgressTracker:
         assert backup_data['achievements']['quickdraw']['completed'] is True
         assert backup_data['achievements']['yolo']['completed'] is False
     
+    def test_backup_is_hardlink_snapshot(self, tracker):
+        """Test backups link the previous file instead of copying it."""
+        tracker.update_achievement('quickdraw', {'completed': True})
+        tracker.flush()
+        previous_inode = os.stat(tracker.progress_file).st_ino
+        
+        tracker.update_achievement('yolo', {'completed': True})
+        tracker.flush()
+        
+        backup_files = list(tracker.backup_dir.glob('progress_*.json'))
+        assert len(backup_files) == 1
+        assert os.stat(backup_files[0]).st_ino == previous_inode
+        assert os.stat(tracker.progress_file).st_ino != previous_inode
+    
+    def test_backup_falls_back_to_copy(self, tracker):
+        """Test backups are copied when hard links are not supported."""
+        tracker.update_achievement('quickdraw', {'completed': True})
+        tracker.flush()
+        
+        with patch('os.link', side_effect=OSError(errno.EXDEV, 'Cross-device link')):
+            tracker._create_backup()
+        
+        backup_files = list(tracker.backup_dir.glob('progress_*.json'))
+        assert len(backup_files) == 1
+        with open(backup_files[0], 'r') as f:
+            assert json.load(f)['achievements']['quickdraw']['completed'] is True
+    
+    def test_directories_created_once(self, temp_dir):
+        """Test later trackers skip mkdir for directories already created."""
+        progress_file = os.path.join(temp_dir, 'nested', 'test_progress.json')
+        ProgressTracker(progress_file)
+        assert os.path.isdir(os.path.join(temp_dir, 'nested', '.backups'))
+        
+        with patch.object(Path, 'mkdir') as mock_mkdir:
+            ProgressTracker(progress_file)
+        mock_mkdir.assert_not_called()
+    
     def test_corrupted_file_recovery(self, temp_dir):
         """Test recovery from corrupted progress file."""
         progress_file = os.path.join(temp_dir, 'test_progress.json')
@@ -195,6 +274,24 @@ class TestProgressTracker:
         # Unknown statistic - should not raise
         tracker.increment_statistic('unknown_stat')  # No error
     
+    def test_progress_views_are_read_only(self, tracker):
+        """Test progress getters return live read-only views."""
+        achievement = tracker.get_achievement_progress('pull_shark')
+        all_progress = tracker.get_all_progress()
+        
+        with pytest.raises(TypeError):
+            achievement['count'] = 5
+        with pytest.raises(TypeError):
+            all_progress['statistics'] = {}
+        with pytest.raises(TypeError):
+            all_progress['statistics']['session_count'] = 5
+        with pytest.raises(AttributeError):
+            all_progress['achievements']['galaxy_brain']['discussions'].append(1)
+        
+        tracker.update_achievement('pull_shark', {'count': 5})
+        assert achievement['count'] == 5
+        assert all_progress['achievements']['pull_shark']['count'] == 5
+    
     def test_is_achievement_completed(self, tracker):
         """Test checking achievement completion."""
         assert tracker.is_achievement_completed('pull_shark') is False
@@ -249,6 +346,19 @@ class TestProgressTracker:
         
         assert exported['achievements']['galaxy_brain']['count'] == 8
     
+    def test_state_file_compact_export_pretty(self, tracker, temp_dir):
+        """Test saves write compact JSON while exports stay indented."""
+        export_path = os.path.join(temp_dir, 'export.json')
+        
+        tracker.update_achievement('galaxy_brain', {'count': 8})
+        tracker.export_progress(export_path)
+        
+        saved = tracker.progress_file.read_text()
+        exported = Path(export_path).read_text()
+        assert '\n' not in saved
+        assert '\n  "achievements": {' in exported
+        assert json.loads(saved) == json.loads(exported)
+    
     def test_get_summary(self, tracker):
         """Test getting progress summary."""
         # Update some achievements
@@ -258,6 +368,7 @@ class TestProgressTracker:
         tracker.update_repository({'name': 'test-repo', 'created': True})
         
         summary = tracker.get_summary()
+        json.dumps(summary)
         
         assert summary['total_achievements'] == 7  # Default achievements
         assert summary['completed_achievements'] == 2
@@ -272,11 +383,36 @@ class TestProgressTracker:
         # Create many saves to generate backups
         for i in range(10):
             tracker.update_achievement('pull_shark', {'count': i})
+            tracker.flush()
         
         # Check that old backups are cleaned up
         backups = list(tracker.backup_dir.glob('progress_*.json'))
         assert len(backups) <= tracker.MAX_BACKUPS
     
+    def test_backup_cleanup_removes_oldest(self, temp_dir):
+        """Test existing backups are tracked and trimmed oldest first."""
+        progress_file = os.path.join(temp_dir, 'test_progress.json')
+        backup_dir = Path(temp_dir) / '.backups'
+        backup_dir.mkdir()
+        for i in range(6):
+            backup = backup_dir / f'progress_2024010{i}_120000.json'
+            backup.write_text('{}')
+            os.utime(backup, (1700000000 + i, 1700000000 + i))
+        
+        tracker = ProgressTracker(progress_file)
+        tracker.update_achievement('quickdraw', {'completed': True})
+        tracker.flush()
+        tracker.update_achievement('yolo', {'completed': True})
+        tracker.flush()
+        
+        remaining = sorted(p.name for p in backup_dir.glob('progress_*.json'))
+        assert len(remaining) == tracker.MAX_BACKUPS
+        assert 'progress_20240100_120000.json' not in remaining
+        assert 'progress_20240101_120000.json' not in remaining
+        assert list(tracker._backup_queue) == sorted(
+            backup_dir.glob('progress_*.json'), key=lambda p: p.stat().st_mtime
+        )
+    
     def test_concurrent_access_protection(self, tracker):
         """Test that atomic writes protect against corruption."""
         # This is more of a conceptual test - in practice would need
@@ -285,12 +421,94 @@ class TestProgressTracker:
         # Simulate partial write by mocking
         original_data = tracker.progress.copy()
         
-        with patch('json.dump', side_effect=IOError("Disk full")):
+        tracker.update_achievement('pull_shark', {'count': 999})
+        
+        with patch('github_achievement_hunter.utils.progress_tracker._dumps',
+                   side_effect=IOError("Disk full")):
             with pytest.raises(ProgressError):
-                tracker.update_achievement('pull_shark', {'count': 999})
+                tracker.flush()
         
         # Progress should not be corrupted in memory
         assert tracker.progress == original_data
+        assert not tracker._tmp_path.exists()
+    
+    def test_updates_batched_until_flush(self, tracker):
+        """Test updates are held in memory until flushed."""
+        tracker.update_achievement('pull_shark', {'count': 1})
+        tracker.increment_statistic('total_api_calls')
+        assert not tracker.progress_file.exists()
+        
+        tracker.flush()
+        with open(tracker.progress_file, 'r') as f:
+            saved_data = json.load(f)
+        assert saved_data['achievements']['pull_shark']['count'] == 1
+        assert saved_data['statistics']['total_api_calls'] == 1
+    
+    def test_pending_updates_saved_when_collected(self, temp_dir):
+        """Test a tracker dropped with unsaved updates still writes them."""
+        progress_file = os.path.join(temp_dir, 'test_progress.json')
+        tracker = ProgressTracker(progress_file)
+        tracker.update_achievement('yolo', {'completed': True})
+        assert not os.path.exists(progress_file)
+        
+        del tracker
+        gc.collect()
+        
+        with open(progress_file, 'r') as f:
+            saved_data = json.load(f)
+        assert saved_data['achievements']['yolo']['completed'] is True
+    
+    def test_noop_updates_skip_save(self, tracker):
+        """Test updates that change nothing are not marked dirty."""
+        tracker.update_achievement('quickdraw', {'completed': True})
+        tracker.update_repository({'name': 'test-repo'})
+        tracker.flush()
+        last_updated = tracker.progress['achievements']['quickdraw']['last_updated']
+        
+        with patch.object(tracker, '_save_progress') as mock_save:
+            tracker.update_achievement('quickdraw', {'completed': True})
+            tracker.update_repository({'name': 'test-repo'})
+            tracker.flush()
+        
+        mock_save.assert_not_called()
+        assert tracker._dirty_count == 0
+        assert tracker.progress['achievements']['quickdraw']['last_updated'] == last_updated
+    
+    def test_flush_threshold_triggers_save(self, temp_dir):
+        """Test a save happens once the dirty update threshold is reached."""
+        progress_file = os.path.join(temp_dir, 'test_progress.json')
+        tracker = ProgressTracker(progress_file, flush_threshold=3)
+        
+        tracker.increment_statistic('total_api_calls')
+        tracker.increment_statistic('total_api_calls')
+        assert not os.path.exists(progress_file)
+        
+        tracker.increment_statistic('total_api_calls')
+        assert os.path.exists(progress_file)
+        assert tracker._dirty_count == 0
+    
+    def test_flush_interval_triggers_save(self, temp_dir):
+        """Test the first update after the flush interval saves immediately."""
+        progress_file = os.path.join(temp_dir, 'test_progress.json')
+        tracker = ProgressTracker(progress_file, flush_interval=0)
+        
+        tracker.update_repository({'name': 'test-repo'})
+        assert os.path.exists(progress_file)
+    
+    def test_fsync_only_on_durable_saves(self, temp_dir):
+        """Test batched saves skip the data sync while explicit flushes sync."""
+        progress_file = os.path.join(temp_dir, 'test_progress.json')
+        tracker = ProgressTracker(progress_file, flush_threshold=2)
+        
+        with patch('github_achievement_hunter.utils.progress_tracker._datasync') as mock_sync:
+            tracker.increment_statistic('total_api_calls')
+            tracker.increment_statistic('total_api_calls')
+            assert os.path.exists(progress_file)
+            mock_sync.assert_not_called()
+            
+            tracker.increment_statistic('total_api_calls')
+            tracker.flush()
+            mock_sync.assert_called_once()
     
     def test_achievement_data_persistence(self, temp_dir):
         """Test that achievement data persists across instances."""
@@ -302,6 +520,7 @@ class TestProgressTracker:
             'count': 3,
             'collaborators': ['user1', 'user2', 'user3']
         })
+        tracker1.flush()
         
         # Second instance
         tracker2 = ProgressTracker(progress_file)
@@ -313,6 +532,7 @@ class TestProgressTracker:
     def test_progress_file_permissions(self, tracker):
         """Test that progress file is created with correct permissions."""
         tracker.update_achievement('quickdraw', {'completed': True})
+        tracker.flush()
         
         # Check file exists and is readable/writable by owner
         stat_info = os.stat(tracker.progress_file)
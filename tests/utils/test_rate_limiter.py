@@ -5,14 +5,17 @@ This module tests the RateLimiter class including sliding window tracking,
 burst prevention, exponential backoff, and predictive limiting.
 """
 
+import asyncio
+import threading
 import time
 from collections import deque
 from datetime import datetime, timezone, timedelta
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 
 import pytest
 from github import GithubException
 from github.GithubException import RateLimitExceededException
+from github.Repository import Repository
 
 from github_achievement_hunter.utils.rate_limiter import RateLimiter, RateLimitError
 
@@ -49,8 +52,8 @@ class TestRateLimiter:
         assert limiter.client == mock_client
         assert limiter.buffer == 200
         assert len(limiter.request_times) == 0
-        assert 'core' in limiter.endpoint_usage
-        assert 'search' in limiter.endpoint_usage
+        assert 'core' in limiter.endpoint_requests
+        assert 'search' in limiter._buckets
     
     def test_categorize_endpoint(self, rate_limiter):
         """Test endpoint categorization."""
@@ -94,23 +97,67 @@ class TestRateLimiter:
         # Should call API twice
         assert rate_limiter.client.get_rate_limit.call_count == 2
     
+    def test_get_current_limits_all_categories(self, rate_limiter):
+        """Test one rate limit response fills every category GitHub reports."""
+        rate_limit = rate_limiter.client.get_rate_limit.return_value
+        rate_limit.graphql.remaining = 4000
+        rate_limit.graphql.limit = 5000
+        
+        limits = rate_limiter._get_current_limits()
+        
+        assert limits['graphql']['remaining'] == 4000
+        assert limits['graphql']['limit'] == 5000
+        assert rate_limiter.client.get_rate_limit.call_count == 1
+    
+    def test_rate_limit_error_shortens_limits_cache(self, rate_limiter):
+        """Test limits are re-fetched sooner while recovering from errors."""
+        rate_limiter._get_current_limits()
+        rate_limiter._last_rate_check -= 10
+        rate_limiter._get_current_limits()
+        assert rate_limiter.client.get_rate_limit.call_count == 1
+        
+        rate_limiter.handle_rate_limit_error(Exception("rate limited"))
+        rate_limiter._last_rate_check -= 10
+        rate_limiter._get_current_limits()
+        assert rate_limiter.client.get_rate_limit.call_count == 2
+        
+        rate_limiter.reset_backoff()
+        rate_limiter._last_rate_check -= 10
+        rate_limiter._get_current_limits()
+        assert rate_limiter.client.get_rate_limit.call_count == 2
+    
     def test_track_request(self, rate_limiter):
         """Test request tracking."""
-        initial_time = time.time()
+        initial_time = time.monotonic()
         
-        with patch('time.time', return_value=initial_time):
+        with patch('time.monotonic', return_value=initial_time):
             rate_limiter._track_request('core')
             rate_limiter._track_request('search')
             rate_limiter._track_request('core')
         
         assert len(rate_limiter.request_times) == 3
-        assert len(rate_limiter.endpoint_usage['core']) == 2
-        assert len(rate_limiter.endpoint_usage['search']) == 1
+        assert rate_limiter.endpoint_requests['core'] == [2, initial_time]
+        assert rate_limiter.endpoint_requests['search'] == [1, initial_time]
+        assert rate_limiter._buckets['core'][0] == 4998
+        assert rate_limiter._buckets['search'][0] == 29
+    
+    def test_track_request_keeps_window_size(self, rate_limiter):
+        """Test request history is trimmed to the last WINDOW_SIZE requests once it doubles."""
+        for _ in range(2 * rate_limiter.WINDOW_SIZE - 1):
+            rate_limiter._track_request('core')
+        
+        assert len(rate_limiter.request_times) == 2 * rate_limiter.WINDOW_SIZE - 1
+        assert rate_limiter.get_usage_stats()['total_requests_tracked'] == rate_limiter.WINDOW_SIZE
+        
+        rate_limiter._track_request('core')
+        
+        assert len(rate_limiter.request_times) == rate_limiter.WINDOW_SIZE
+        assert rate_limiter.request_times == sorted(rate_limiter.request_times)
     
     def test_check_burst_limit_under_threshold(self, rate_limiter):
         """Test burst limit checking when under threshold."""
         # Add some requests but stay under threshold
-        current_time = time.time()
+        current_time = time.monotonic()
         for i in range(20):
             rate_limiter.request_times.append(current_time - i)
         
@@ -119,12 +166,27 @@ class TestRateLimiter:
     def test_check_burst_limit_over_threshold(self, rate_limiter):
         """Test burst limit checking when over threshold."""
         # Add many recent requests
-        current_time = time.time()
+        current_time = time.monotonic()
         for i in range(35):  # Over BURST_THRESHOLD of 30
             rate_limiter.request_times.append(current_time - i * 0.5)
         
         assert rate_limiter._check_burst_limit() is False
     
+    def test_check_burst_limit_ignores_old_requests(self, rate_limiter):
+        """Test only requests from the last minute count towards a burst."""
+        current_time = time.monotonic()
+        for i in range(40):
+            rate_limiter.request_times.append(current_time - 200 + i)
+        for i in range(25):
+            rate_limiter.request_times.append(current_time - 25 + i)
+        
+        assert rate_limiter._check_burst_limit() is True
+        
+        for i in range(5):
+            rate_limiter.request_times.append(current_time)
+        
+        assert rate_limiter._check_burst_limit() is False
+    
     def test_calculate_wait_time_no_wait(self, rate_limiter):
         """Test wait time calculation when no wait needed."""
         wait_time = rate_limiter._calculate_wait_time('core')
@@ -141,7 +203,7 @@ class TestRateLimiter:
         rate_limiter.client.get_rate_limit.return_value = rate_limit
         
         # Clear cache
-        rate_limiter._last_rate_check = 0
+        rate_limiter._last_rate_check = float('-inf')
         
         wait_time = rate_limiter._calculate_wait_time('core')
         assert wait_time > 0
@@ -150,7 +212,7 @@ class TestRateLimiter:
     def test_calculate_wait_time_burst_prevention(self, rate_limiter):
         """Test wait time calculation for burst prevention."""
         # Add many recent requests to trigger burst prevention
-        current_time = time.time()
+        current_time = time.monotonic()
         for i in range(35):
             rate_limiter.request_times.append(current_time - i * 0.5)
         
@@ -160,7 +222,7 @@ class TestRateLimiter:
     def test_predict_rate_limit_no_throttle(self, rate_limiter):
         """Test predictive rate limiting when no throttle needed."""
         # Add moderate request pattern
-        current_time = time.time()
+        current_time = time.monotonic()
         for i in range(50):
             rate_limiter.request_times.append(current_time - i * 10)  # One every 10 seconds
         
@@ -172,7 +234,7 @@ class TestRateLimiter:
         """Test predictive rate limiting when throttle needed."""
         # Test that the predictive rate limiting function works
         # by mocking the internal state appropriately
-        current_time = time.time()
+        current_time = time.monotonic()
         rate_limiter.request_times.clear()
         
         # The implementation filters by last 5 minutes and requires at least 10 requests
@@ -201,6 +263,18 @@ class TestRateLimiter:
         assert isinstance(should_throttle2, bool)
         assert delay2 >= 0
     
+    def test_predict_rate_limit_uses_average_interval(self, rate_limiter):
+        """Test the suggested delay tops the average interval up to the target."""
+        current_time = time.monotonic()
+        for i in range(100):
+            rate_limiter.request_times.append(current_time - 50 + i * 0.5)
+        
+        should_throttle, delay = rate_limiter._predict_rate_limit()
+        
+        # One request every 0.5s is 7200 req/hr; target interval is 3600 / 3500
+        assert should_throttle is True
+        assert delay == pytest.approx(3600 / 3500 - 0.5)
+    
     def test_check_and_wait_no_wait(self, rate_limiter):
         """Test check_and_wait when no wait needed."""
         with patch('time.sleep') as mock_sleep:
@@ -216,7 +290,7 @@ class TestRateLimiter:
         rate_limit.core.remaining = 50
         rate_limit.core.reset = datetime.now(timezone.utc) + timedelta(seconds=10)
         rate_limiter.client.get_rate_limit.return_value = rate_limit
-        rate_limiter._last_rate_check = 0
+        rate_limiter._last_rate_check = float('-inf')
         
         with patch('time.sleep') as mock_sleep:
             rate_limiter.check_and_wait('/repos/user/repo')
@@ -225,14 +299,73 @@ class TestRateLimiter:
         sleep_time = mock_sleep.call_args[0][0]
         assert 9 <= sleep_time <= 11  # Should be around 10 seconds
     
+    def test_check_and_wait_reuses_recent_wait_time(self, rate_limiter):
+        """Test back-to-back checks compute the wait time only once."""
+        with patch.object(rate_limiter, '_calculate_wait_time', return_value=0) as mock_calc:
+            rate_limiter.check_and_wait('/repos/user/repo')
+            rate_limiter.check_and_wait('/repos/user/repo')
+            assert mock_calc.call_count == 1
+            
+            # A different category is computed separately
+            rate_limiter.check_and_wait('/search/repositories')
+            assert mock_calc.call_count == 2
+            
+            # Rate limit errors invalidate the cached value
+            rate_limiter.handle_rate_limit_error(Exception("rate limited"))
+            rate_limiter.check_and_wait('/search/repositories')
+            assert mock_calc.call_count == 3
+    
+    def test_check_and_wait_fast_path(self, rate_limiter):
+        """Test the wait time calculation is skipped while clearly within limits."""
+        rate_limiter._get_current_limits()  # 4500 core requests remaining
+        
+        with patch.object(rate_limiter, '_calculate_wait_time', return_value=0) as mock_calc:
+            rate_limiter.check_and_wait('/repos/user/repo')
+            mock_calc.assert_not_called()
+            
+            # Below twice the buffer the full calculation runs
+            rate_limiter._cached_limits['core']['remaining'] = 150
+            rate_limiter.check_and_wait('/repos/user/repo')
+            mock_calc.assert_called_once()
+        
+        assert len(rate_limiter.request_times) == 2
+    
+    def test_fast_path_skipped_when_predictor_throttles(self, rate_limiter):
+        """Test a cluster of recent requests below the burst check still reaches the predictor."""
+        rate_limiter._get_current_limits()
+        current_time = time.monotonic()
+        # 12 requests half a second apart, all more than a minute ago
+        rate_limiter.request_times.extend(current_time - 120 + i * 0.5 for i in range(12))
+        
+        assert rate_limiter._predict_rate_limit()[0] is True
+        assert rate_limiter._is_clearly_within_limits('core', current_time) is False
+    
+    def test_wait_shared_between_threads(self, rate_limiter):
+        """Test a thread joins an ongoing longer wait instead of sleeping."""
+        follower = threading.Thread(target=rate_limiter._wait, args=(1.0,))
+        
+        def sleep(seconds):
+            # While this thread sleeps, another needs a shorter wait
+            follower.start()
+            follower.join(timeout=0.1)
+            assert follower.is_alive()
+        
+        with patch('time.sleep', side_effect=sleep) as mock_sleep:
+            rate_limiter._wait(5.0)
+            follower.join(timeout=1)
+        
+        # The follower was released when the first sleep ended
+        assert not follower.is_alive()
+        mock_sleep.assert_called_once_with(5.0)
+    
     def test_handle_rate_limit_error_initial(self, rate_limiter):
         """Test handling rate limit error for first time."""
         error = RateLimitExceededException(status=429, data={}, headers={})
         
         backoff_time = rate_limiter.handle_rate_limit_error(error)
         
-        # Initial backoff is 1.0 * 2^1 = 2.0, with ±20% jitter
-        assert 1.6 <= backoff_time <= 2.4  # 2.0 ± 20%
+        # Initial backoff is 1.0 * 2 = 2.0, plus up to 40% jitter
+        assert 2.0 <= backoff_time <= 2.8
         assert rate_limiter.backoff_state['consecutive_failures'] == 1
     
     def test_handle_rate_limit_error_exponential(self, rate_limiter):
@@ -248,6 +381,7 @@ class TestRateLimiter:
         assert backoff2 > backoff1
         assert backoff3 > backoff2
         assert rate_limiter.backoff_state['consecutive_failures'] == 3
+        assert rate_limiter.backoff_state['current_backoff'] == 8.0
     
     def test_handle_rate_limit_error_max_backoff(self, rate_limiter):
         """Test that backoff doesn't exceed maximum."""
@@ -260,6 +394,24 @@ class TestRateLimiter:
         # Should not exceed max backoff (plus jitter)
         assert backoff <= rate_limiter.MAX_BACKOFF * 1.2
     
+    def test_circuit_breaker_holds_off_all_calls(self, rate_limiter):
+        """Test repeated rate limit errors make every caller wait out the backoff."""
+        rate_limiter.backoff_state['consecutive_failures'] = 2
+        rate_limiter.backoff_state['current_backoff'] = 8.0
+        rate_limiter.backoff_state['last_failure_time'] = time.monotonic() - 3
+        
+        with patch.object(rate_limiter, '_calculate_wait_time') as mock_calc:
+            wait_time = rate_limiter._get_wait_time('core')
+        
+        assert wait_time == pytest.approx(5, abs=0.1)
+        mock_calc.assert_not_called()
+        
+        # Once the backoff has passed, wait times are calculated as usual
+        rate_limiter.backoff_state['last_failure_time'] = time.monotonic() - 10
+        with patch.object(rate_limiter, '_calculate_wait_time', return_value=0) as mock_calc:
+            assert rate_limiter._get_wait_time('core') == 0
+        mock_calc.assert_called_once()
+    
     def test_reset_backoff(self, rate_limiter):
         """Test resetting backoff state."""
         # Create some backoff state
@@ -285,6 +437,81 @@ class TestRateLimiter:
         # Backoff should be reset on success
         assert rate_limiter.backoff_state['consecutive_failures'] == 0
     
+    def test_with_rate_limit_caps_concurrency(self, mock_client):
+        """Test wrapped calls hold a concurrency slot while running."""
+        limiter = RateLimiter(mock_client, max_concurrent=1)
+        
+        @limiter.with_rate_limit
+        def test_function():
+            # The only slot is taken while the call is in flight
+            return limiter._concurrency.acquire(blocking=False)
+        
+        with patch.object(limiter, 'check_and_wait'):
+            assert test_function() is False
+        
+        # Released again once the call returns
+        assert limiter._concurrency.acquire(blocking=False) is True
+    
+    def test_with_rate_limit_cacheable(self, rate_limiter):
+        """Test cacheable calls reuse results without another request."""
+        calls = []
+        
+        @rate_limiter.with_rate_limit(cacheable=True)
+        def get_repo(name):
+            calls.append(name)
+            return {'name': name}
+        
+        with patch.object(rate_limiter, 'check_and_wait') as mock_check:
+            assert get_repo('repo-a') == {'name': 'repo-a'}
+            assert get_repo('repo-a') == {'name': 'repo-a'}
+            get_repo('repo-b')
+        
+        assert calls == ['repo-a', 'repo-b']
+        assert mock_check.call_count == 2
+    
+    def test_with_rate_limit_cache_expires(self, rate_limiter):
+        """Test cached results are not reused after their TTL."""
+        calls = []
+        
+        @rate_limiter.with_rate_limit(cacheable=True, cache_ttl=0)
+        def get_repo(name):
+            calls.append(name)
+            return name
+        
+        with patch.object(rate_limiter, 'check_and_wait'):
+            get_repo('repo-a')
+            get_repo('repo-a')
+        
+        assert calls == ['repo-a', 'repo-a']
+    
+    def test_with_rate_limit_cache_bounded(self, rate_limiter):
+        """Test the response cache evicts expired, then oldest, entries when full."""
+        rate_limiter.RESPONSE_CACHE_MAX_SIZE = 3
+        
+        @rate_limiter.with_rate_limit(cacheable=True)
+        def get_repo(name):
+            return name
+        
+        @rate_limiter.with_rate_limit(cacheable=True, cache_ttl=0)
+        def get_stale(name):
+            return name
+        
+        with patch.object(rate_limiter, 'check_and_wait'):
+            get_repo('repo-a')
+            get_stale('stale')
+            get_repo('repo-b')
+            get_repo('repo-c')
+            cached = list(rate_limiter._response_cache)
+            assert len(cached) == 3
+            assert not any('stale' in key for key in cached)
+            
+            get_repo('repo-d')
+        
+        cached = list(rate_limiter._response_cache)
+        assert len(cached) == 3
+        assert not any('repo-a' in key for key in cached)
+        assert 'repo-d' in cached[-1]
+    
     def test_with_rate_limit_decorator_retry_success(self, rate_limiter):
         """Test rate limit decorator with retry on rate limit error."""
         call_count = 0
@@ -329,10 +556,67 @@ class TestRateLimiter:
         assert exc_info.value.status == 404
         assert call_count == 1  # Should not retry
     
+    def test_with_rate_limit_async_retry_success(self, rate_limiter):
+        """Test the async decorator retries rate limit errors with asyncio.sleep."""
+        call_count = 0
+        
+        @rate_limiter.with_rate_limit_async
+        async def test_function():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 2:
+                raise RateLimitExceededException(status=429, data={}, headers={})
+            return "success"
+        
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+                patch('time.sleep') as mock_time_sleep:
+            result = asyncio.run(test_function())
+        
+        assert result == "success"
+        assert call_count == 2
+        mock_sleep.assert_called_once()
+        mock_time_sleep.assert_not_called()
+        assert len(rate_limiter.request_times) == 2
+    
+    def test_with_rate_limit_async_cacheable(self, rate_limiter):
+        """Test cacheable coroutines reuse results without another request."""
+        calls = []
+        
+        @rate_limiter.with_rate_limit_async(cacheable=True)
+        async def get_repo(name):
+            calls.append(name)
+            return {'name': name}
+        
+        async def run():
+            return [await get_repo('repo-a'), await get_repo('repo-a'), await get_repo('repo-b')]
+        
+        results = asyncio.run(run())
+        
+        assert results == [{'name': 'repo-a'}, {'name': 'repo-a'}, {'name': 'repo-b'}]
+        assert calls == ['repo-a', 'repo-b']
+        assert len(rate_limiter.request_times) == 2
+    
+    def test_acheck_and_wait_offloads_limit_refresh(self, rate_limiter):
+        """Test the blocking wait calculation runs in a worker thread."""
+        loop_thread = threading.get_ident()
+        wait_threads = []
+        
+        def get_wait_time(endpoint_category):
+            wait_threads.append(threading.get_ident())
+            return 0
+        
+        # No limits fetched yet, so the fast path cannot apply
+        with patch.object(rate_limiter, '_get_wait_time', side_effect=get_wait_time):
+            asyncio.run(rate_limiter.acheck_and_wait('/repos/user/repo'))
+        
+        assert len(wait_threads) == 1
+        assert wait_threads[0] != loop_thread
+        assert len(rate_limiter.request_times) == 1
+    
     def test_get_usage_stats(self, rate_limiter):
         """Test getting usage statistics."""
         # Add some requests
-        current_time = time.time()
+        current_time = time.monotonic()
         for i in range(10):
             rate_limiter._track_request('core')
         for i in range(5):
@@ -348,49 +632,139 @@ class TestRateLimiter:
         assert 'current_limits' in stats
         assert 'backoff_state' in stats
     
-    def test_sliding_window_limit(self, rate_limiter):
-        """Test sliding window prevents exceeding limits."""
-        # Fill up the core endpoint limit within the window
-        current_time = time.time()
+    def test_get_usage_stats_cached_until_next_request(self, rate_limiter):
+        """Test usage stats are reused until another request is tracked."""
+        stats1 = rate_limiter.get_usage_stats()
+        assert rate_limiter.get_usage_stats() is stats1
         
-        # The deque maxlen is 1000, so we can't add 5000 items
-        # Instead, let's test that we properly detect when we're at the limit
-        # Add 1000 requests (maxlen of deque) all within the last 30 minutes
-        for i in range(1000):
-            # Spread them over 30 minutes (1800 seconds)
-            rate_limiter.endpoint_usage['core'].append(current_time - i * 1.8)
-        
-        # Now the oldest request is 1800 seconds ago, which is within the 3600 second window
-        # We have 1000 requests in 1800 seconds = 2000 req/hr rate
-        # This is still under the 5000 limit, so let's make it more aggressive
+        rate_limiter._track_request('core')
+        stats2 = rate_limiter.get_usage_stats()
         
-        # Clear and add requests that would exceed the limit
-        rate_limiter.endpoint_usage['core'].clear()
-        # Add requests that simulate we're at the 5000 limit
-        for i in range(1000):
-            # All requests in last 720 seconds (12 minutes) = 5000 req/hr rate
-            rate_limiter.endpoint_usage['core'].append(current_time - i * 0.72)
+        assert stats2 is not stats1
+        assert stats2['total_requests_tracked'] == 1
+    
+    def test_token_bucket_limit(self, rate_limiter):
+        """Test the token bucket waits once a window's budget is spent."""
+        current_time = time.monotonic()
         
-        # This should trigger wait time calculation
+        # 5000 requests spent just now: wait for one token (3600 / 5000 s)
+        rate_limiter._buckets['core'] = [0.0, current_time]
         wait_time = rate_limiter._calculate_wait_time('core')
-        # The wait time might be 0 if we're exactly at the limit but not over
-        # Let's check the sliding window logic differently
+        assert wait_time == pytest.approx(0.72, abs=0.01)
+        
+        # Budget spent a full window ago has been refilled
+        rate_limiter._buckets['core'] = [0.0, current_time - 3600]
+        assert rate_limiter._calculate_wait_time('core') == 0
+        assert rate_limiter._buckets['core'][0] == 5000
+    
+    def test_shared_burst_window_in_redis(self, rate_limiter):
+        """Test the burst window is read from and recorded in Redis when configured."""
+        redis_client = MagicMock()
+        redis_client.zcount.return_value = rate_limiter.BURST_THRESHOLD
+        redis_client.zrange.return_value = [('member', time.time() - 30)]
+        rate_limiter.redis_client = redis_client
+        
+        # Other processes used the burst budget although this one made no requests
+        assert rate_limiter._check_burst_limit() is False
+        assert rate_limiter._calculate_wait_time('core') == pytest.approx(31, abs=0.5)
         
-        # Instead, verify that the sliding window logic works by checking
-        # that requests outside the window don't count
-        old_request_time = current_time - 4000  # Outside 3600 second window
-        rate_limiter.endpoint_usage['core'].appendleft(old_request_time)
+        rate_limiter._track_request('core')
+        pipe = redis_client.pipeline.return_value
+        pipe.zadd.assert_called_once()
+        assert pipe.zadd.call_args[0][0] == rate_limiter.REDIS_TIMES_KEY
+        pipe.execute.assert_called_once()
+        
+        # Falls back to the local window when Redis is unavailable
+        redis_client.zcount.side_effect = ConnectionError("down")
+        assert rate_limiter._check_burst_limit() is True
+    
+    def test_shared_burst_window_read_once(self, rate_limiter):
+        """Test the wait comes from the same Redis read as the burst count."""
+        redis_client = MagicMock()
+        redis_client.zcount.side_effect = [rate_limiter.BURST_THRESHOLD, ConnectionError("down")]
+        redis_client.zrange.return_value = [('member', time.time() - 30)]
+        rate_limiter.redis_client = redis_client
+        rate_limiter.request_times.append(time.monotonic())
+        
+        assert rate_limiter._calculate_wait_time('core') == pytest.approx(31, abs=0.5)
+        redis_client.zcount.assert_called_once()
+    
+    @staticmethod
+    def _response(resource, remaining, limit):
+        """Build a response carrying GitHub's rate limit headers."""
+        return Mock(headers={
+            'X-RateLimit-Resource': resource,
+            'X-RateLimit-Remaining': str(remaining),
+            'X-RateLimit-Limit': str(limit)
+        })
+    
+    def test_response_headers_update_limits(self, rate_limiter):
+        """Test successful calls refresh remaining counts from the response headers."""
+        rate_limiter._get_current_limits()
+        
+        @rate_limiter.with_rate_limit
+        def test_function():
+            return self._response('core', 1234, 5000)
+        
+        with patch.object(rate_limiter, 'check_and_wait'):
+            test_function()
+        
+        assert rate_limiter._cached_limits['core']['remaining'] == 1234
+    
+    def test_pygithub_object_headers_update_limits(self, rate_limiter):
+        """Test PyGithub objects are read without completing lazily loaded ones."""
+        rate_limiter._get_current_limits()
+        requester = Mock()
+        repo = Repository(requester, {
+            'x-ratelimit-resource': 'core',
+            'x-ratelimit-remaining': '77',
+            'x-ratelimit-limit': '5000'
+        }, {'url': 'https://api.github.com/repos/user/repo'}, completed=False)
+        
+        rate_limiter._update_limits_from_response(repo)
+        
+        assert rate_limiter._cached_limits['core']['remaining'] == 77
+        requester.requestJsonAndCheck.assert_not_called()
+    
+    def test_response_headers_of_other_resource_ignored(self, rate_limiter):
+        """Test search and GraphQL headers on an uncategorized call leave core alone."""
+        rate_limiter._get_current_limits()
+        core_limits = dict(rate_limiter._cached_limits['core'])
+        responses = [self._response('search', 25, 30), self._response('graphql', 10, 5000)]
+        
+        @rate_limiter.with_rate_limit
+        def api_function():
+            return responses.pop(0)
+        
+        with patch.object(rate_limiter, 'check_and_wait'):
+            api_function()
+            api_function()
+        
+        assert rate_limiter._cached_limits['core'] == core_limits
+        assert rate_limiter._cached_limits['search']['remaining'] == 25
+        assert rate_limiter._cached_limits['graphql']['remaining'] == 10
+        assert rate_limiter._calculate_wait_time('core') == 0
+    
+    def test_response_without_headers_skips_update(self, rate_limiter):
+        """Test results without a known resource neither change the cache nor query the API."""
+        rate_limiter._get_current_limits()
+        cached = {category: dict(info) for category, info in rate_limiter._cached_limits.items()}
+        rate_limiter.client.get_rate_limit.reset_mock()
+        
+        @rate_limiter.with_rate_limit
+        def test_function():
+            return 'ok'
+        
+        with patch.object(rate_limiter, 'check_and_wait'):
+            test_function()
         
-        # The old request should not affect our calculation
-        # We still have high rate within the window
-        assert len(rate_limiter.endpoint_usage['core']) == 1000  # maxlen enforced
+        assert rate_limiter._cached_limits == cached
+        rate_limiter.client.get_rate_limit.assert_not_called()
     
     def test_endpoint_specific_limits(self, rate_limiter):
         """Test that different endpoints have different limits."""
-        # Add requests to search endpoint (lower limit)
-        current_time = time.time()
-        for i in range(35):  # Over search limit of 30/minute
-            rate_limiter.endpoint_usage['search'].append(current_time - i)
+        # Use up the search endpoint's tokens (lower limit)
+        rate_limiter._buckets['search'] = [0.0, time.monotonic()]
         
         # Search should need wait
         search_wait = rate_limiter._calculate_wait_time('search')